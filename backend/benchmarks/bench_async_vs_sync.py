@@ -0,0 +1,171 @@
+"""Compare the sync and async request paths under concurrent load.
+
+Serves the task API in-process (httpx ASGITransport, no network) once through
+the sync routers and once through the async routers, against the same database,
+and reports throughput and latency percentiles for a paginated read and a create.
+
+Usage:
+    python benchmarks/bench_async_vs_sync.py [--url URL] [--concurrency 200] [--requests 2000]
+
+The URL defaults to a temporary SQLite file; pass a postgresql:// URL to measure
+psycopg2 against asyncpg. The async driver is derived with to_async_url().
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from infrastructure.database import (
+    Base,
+    TaskModel,
+    UserModel,
+    create_async_database_engine,
+    create_database_engine,
+    get_async_db,
+    get_db,
+    to_async_url,
+)
+from presentation.api.async_routes import async_tasks_router, async_users_router
+from presentation.api.routes import tasks_router, users_router
+
+SEED_TASKS = 5000
+
+
+def seed(url: str) -> int:
+    """Create the schema and seed one user with SEED_TASKS tasks; return the user id."""
+    engine = create_database_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    now = datetime.now(UTC)
+    with sessionmaker(bind=engine)() as db:
+        user = UserModel(
+            first_name="Bench", last_name="User", email="bench@example.com", created_at=now, updated_at=now
+        )
+        db.add(user)
+        db.flush()
+        db.add_all(
+            TaskModel(description=f"Task {i}", status="TODO", user_id=user.id, created_at=now, updated_at=now)
+            for i in range(SEED_TASKS)
+        )
+        db.commit()
+        user_id = user.id
+    engine.dispose()
+    return user_id
+
+
+def build_sync_app(url: str, pool_size: int) -> tuple[FastAPI, callable]:
+    """Build an app serving the sync routers; return it with its cleanup."""
+    engine = create_database_engine(url, pool_size=pool_size, max_overflow=0)
+    factory = sessionmaker(autoflush=False, bind=engine)
+
+    def override_get_db():
+        with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(tasks_router)
+    app.include_router(users_router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    async def cleanup():
+        engine.dispose()
+
+    return app, cleanup
+
+
+def build_async_app(url: str, pool_size: int) -> tuple[FastAPI, callable]:
+    """Build an app serving the async routers; return it with its cleanup."""
+    # aiosqlite defaults to NullPool for files; pool explicitly so both paths match
+    engine = create_async_database_engine(
+        to_async_url(url), poolclass=AsyncAdaptedQueuePool, pool_size=pool_size, max_overflow=0
+    )
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_tasks_router)
+    app.include_router(async_users_router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app, engine.dispose
+
+
+async def run_load(app: FastAPI, user_id: int, concurrency: int, total: int) -> dict:
+    """Issue total requests (3 reads : 1 create) with at most concurrency in flight."""
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                if i % 4 == 3:
+                    response = await client.post(
+                        "/api/tasks", json={"description": f"Load {i}", "status": "TODO", "user_id": user_id}
+                    )
+                else:
+                    response = await client.get("/api/tasks", params={"limit": 50})
+                latencies.append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main() -> None:
+    """Run both request paths and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Sync database URL (default: temporary SQLite file)")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--pool-size", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{tmp}/bench.db"
+        print(f"Database: {url}  concurrency={args.concurrency}  requests={args.requests}")
+        for name, build in (("sync", build_sync_app), ("async", build_async_app)):
+            user_id = seed(url)
+            app, cleanup = build(url, args.pool_size)
+            try:
+                stats = await run_load(app, user_id, args.concurrency, args.requests)
+            finally:
+                await cleanup()
+            print(
+                f"{name:>5}: {stats['rps']:8.1f} req/s  p50 {stats['p50_ms']:7.1f} ms  "
+                f"p99 {stats['p99_ms']:7.1f} ms  errors {stats['errors']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+"""Load test of the SSE change feed: idle subscriber memory and fan-out latency.
+
+Opens --subscribers GET /api/tasks/events streams against the ASGI app in
+process (no sockets, so only the server-side cost of a connection is counted),
+measures the memory they hold with tracemalloc, then publishes --events task
+events from a worker thread, as the sync routes do, and records how long each
+subscriber takes to receive each one.
+
+Usage:
+    python benchmarks/bench_change_feed.py [--subscribers 5000] [--events 20]
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fastapi import FastAPI
+
+from domain.models import Task, TaskEvent, TaskEventType, TaskStatus
+from infrastructure.events import get_event_hub
+from presentation.api.change_feed import change_feed_router, get_task_event_publisher
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/api/tasks/events",
+    "raw_path": b"/api/tasks/events",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"accept", b"text/event-stream")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("bench", 80),
+}
+
+
+class Connection:
+    """One SSE client driven straight through the ASGI interface."""
+
+    def __init__(self, app: FastAPI, received: list[tuple[int, float]]):
+        """Initialize; received collects (event id, arrival time) pairs."""
+        self.app = app
+        self.received = received
+        self.opened = asyncio.Event()
+        self.disconnected = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def open(self) -> None:
+        """Start the request."""
+        self.task = asyncio.create_task(self.app(dict(SCOPE), self.receive, self.send))
+
+    async def receive(self) -> dict:
+        """Block until the client goes away."""
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: dict) -> None:
+        """Record the arrival of task events."""
+        if message["type"] != "http.response.body":
+            return
+        body = message.get("body", b"")
+        if body.startswith(b"retry:"):
+            self.opened.set()
+        elif body.startswith(b"event: updated"):
+            self.received.append((int(body.split(b'"task_id":', 1)[1].split(b",", 1)[0]), time.perf_counter()))
+
+    async def close(self) -> None:
+        """Disconnect and wait for the server to clean up."""
+        self.disconnected.set()
+        await self.task
+
+
+def make_event(event_id: int) -> TaskEvent:
+    """A task update event whose task_id identifies it."""
+    now = datetime.now(UTC)
+    task = Task.from_trusted(event_id, f"Task {event_id}", TaskStatus.DOING, 1, now, now)
+    return TaskEvent(TaskEventType.UPDATED, event_id, task)
+
+
+async def run(subscribers: int, events: int) -> None:
+    """Connect, measure, publish, report."""
+    app = FastAPI()
+    app.include_router(change_feed_router)
+    hub = get_event_hub()
+    publisher = get_task_event_publisher()
+    received: list[tuple[int, float]] = []
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    connections = [Connection(app, received) for _ in range(subscribers)]
+    for connection in connections:
+        connection.open()
+    await asyncio.gather(*(connection.opened.wait() for connection in connections))
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(
+        f"subscribers={hub.stats().subscribers}  memory held: {held / 2**20:.1f} MiB  ({held / subscribers:,.0f} B each)"
+    )
+
+    latencies = []
+    for event_id in range(1, events + 1):
+        received.clear()
+        published_at = time.perf_counter()
+        # Sync routes publish from a threadpool thread
+        thread = threading.Thread(target=publisher.publish, args=([make_event(event_id)],))
+        thread.start()
+        while len(received) < subscribers:
+            await asyncio.sleep(0.001)
+        thread.join()
+        latencies.append(sorted(arrived - published_at for _, arrived in received))
+
+    p50 = statistics.median(latency[len(latency) // 2] for latency in latencies)
+    p99 = statistics.median(latency[int(len(latency) * 0.99) - 1] for latency in latencies)
+    last = statistics.median(latency[-1] for latency in latencies)
+    print(f"fan-out latency over {events} events (median across events):")
+    print(f"  p50 {p50 * 1000:7.2f} ms   p99 {p99 * 1000:7.2f} ms   last subscriber {last * 1000:7.2f} ms")
+    print(f"dropped subscribers: {hub.stats().dropped}")
+
+    await asyncio.gather(*(connection.close() for connection in connections))
+    print(f"subscribers after disconnect: {hub.stats().subscribers}")
+
+
+def main() -> None:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Overhead of request metrics: MetricsMiddleware plus the SQLAlchemy cursor hooks.
+
+Serves the task API in-process (httpx ASGITransport, no network) from two apps
+on the same database. One is plain. The other is wrapped in MetricsMiddleware.
+The query cost listeners are installed on every engine, as in production;
+outside a measured request they only look up a ContextVar. Both apps are
+driven one request at a time, so the difference in mean latency is the
+per-request cost of the metrics. Rounds alternate between the apps and the best round of each is
+kept, to cancel drift.
+
+Usage:
+    python benchmarks/bench_metrics.py [--url URL] [--requests 2000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database import create_database_engine, get_db
+from infrastructure.metrics import instrument_engines
+from presentation.api.metrics import MetricsMiddleware, RequestMetrics
+from presentation.api.routes import tasks_router
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_async_vs_sync import seed  # noqa: E402
+
+# (label, path): a route with no database work and a paged listing
+ROUTES = (("no database", "/ping"), ("GET /api/tasks?limit=50", "/api/tasks?limit=50"))
+
+
+def build_app(url: str, instrumented: bool) -> tuple[FastAPI, RequestMetrics | None, callable]:
+    """Build an app serving the sync task routes; return it with its metrics and cleanup."""
+    engine = create_database_engine(url)
+    factory = sessionmaker(autoflush=False, bind=engine)
+
+    def override_get_db():
+        with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(tasks_router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    @app.get("/ping")
+    def ping():
+        return {"status": "ok"}
+
+    metrics = None
+    if instrumented:
+        metrics = RequestMetrics()
+        instrument_engines()
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+    return app, metrics, engine.dispose
+
+
+async def mean_latency(app: FastAPI, path: str, requests: int) -> float:
+    """Mean latency of requests issued one at a time, in seconds."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(100, requests)):
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(path)
+            response.raise_for_status()
+        return (time.perf_counter() - start) / requests
+
+
+async def main() -> None:
+    """Measure both apps on each route and print the overhead."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Sync database URL (default: temporary SQLite file)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{tmp}/bench.db"
+        seed(url)
+        plain, _, plain_cleanup = build_app(url, instrumented=False)
+        measured, metrics, measured_cleanup = build_app(url, instrumented=True)
+        print(f"Database: {url}  requests={args.requests} per round, best of {args.rounds} rounds")
+        try:
+            for label, path in ROUTES:
+                best_plain = best_measured = float("inf")
+                for _ in range(args.rounds):
+                    best_plain = min(best_plain, await mean_latency(plain, path, args.requests))
+                    best_measured = min(best_measured, await mean_latency(measured, path, args.requests))
+                overhead = best_measured - best_plain
+                print(
+                    f"{label:>24}: plain {best_plain * 1e6:8.1f} us  with metrics {best_measured * 1e6:8.1f} us  "
+                    f"overhead {overhead * 1e6:6.1f} us ({overhead / best_plain:+.1%})"
+                )
+        finally:
+            plain_cleanup()
+            measured_cleanup()
+        exposition = metrics.render()
+        print(f"/metrics body after the run: {len(exposition.splitlines())} lines, {len(exposition)} bytes")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
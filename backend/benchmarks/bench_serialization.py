@@ -0,0 +1,90 @@
+"""Per-row cost of encoding a task listing: Pydantic response path vs column rows + orjson.
+
+Before: each row becomes a domain Task, then a TaskResponse (isoformat() per
+timestamp), then FastAPI validates the list against response_model and
+JSONResponse encodes it with json.dumps.
+After: rows are zipped with their field names and encoded by orjson.
+
+Rows are generated in memory so only the encoding cost is measured.
+
+Usage:
+    python benchmarks/bench_serialization.py [--rows 50000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from domain.models import Task, TaskRow, TaskStatus
+from presentation.api.routes import TaskResponse, to_task_response
+from presentation.api.serialization import task_rows_response
+
+RESPONSE_MODEL = TypeAdapter(list[TaskResponse])
+
+
+def make_rows(count: int) -> list[TaskRow]:
+    """Build rows shaped like the ones the database returns."""
+    base = datetime(2025, 1, 1)
+    return [
+        TaskRow(
+            i,
+            f"Task number {i}",
+            TaskStatus.TODO,
+            i % 100 + 1,
+            base + timedelta(seconds=i),
+            base + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def pydantic_path(rows: list[TaskRow]) -> bytes:
+    """Encode the way the routes did before: entities, response models, response_model validation."""
+    responses = [to_task_response(Task(*row)) for row in rows]
+    validated = RESPONSE_MODEL.validate_python(responses)
+    return JSONResponse(RESPONSE_MODEL.dump_python(validated, mode="json")).body
+
+
+def row_path(rows: list[TaskRow]) -> bytes:
+    """Encode the way the routes do now."""
+    return task_rows_response(rows).body
+
+
+def best_of(fn, rows: list[TaskRow], repeat: int) -> float:
+    """Best wall time of repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Time both paths and check they produce the same bytes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    if pydantic_path(rows) != row_path(rows):
+        raise SystemExit("Outputs differ")
+
+    before = best_of(pydantic_path, rows, args.repeat)
+    after = best_of(row_path, rows, args.repeat)
+    print(f"rows={args.rows}  (best of {args.repeat}, output identical)")
+    print(f"pydantic: {before * 1000:8.1f} ms  {before / args.rows * 1e6:6.2f} us/row")
+    print(f"  orjson: {after * 1000:8.1f} ms  {after / args.rows * 1e6:6.2f} us/row  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
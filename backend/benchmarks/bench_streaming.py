@@ -0,0 +1,105 @@
+"""Compare peak memory and time to first byte of buffered vs streamed task listings.
+
+Seeds a database with --rows tasks, then produces the GET /api/tasks body twice:
+buffered (find_tasks -> TaskResponse list -> one JSON document, as the default
+route does) and streamed (the chunk generator behind stream=true). Peak memory is
+measured with tracemalloc; the body is discarded chunk by chunk, as a socket would.
+
+Usage:
+    python benchmarks/bench_streaming.py [--url URL] [--rows 200000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from application.services import TaskService
+from domain.models import TaskQuery
+from infrastructure.database import Base, TaskModel, UserModel, create_database_engine
+from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+from presentation.api.routes import stream_tasks, to_task_response
+
+
+def seed(session_factory: sessionmaker, rows: int) -> None:
+    """Insert one user and rows tasks."""
+    now = datetime.now(UTC)
+    with session_factory() as db:
+        user = UserModel(
+            first_name="Bench", last_name="User", email="bench@example.com", created_at=now, updated_at=now
+        )
+        db.add(user)
+        db.flush()
+        params = [
+            {"description": f"Task {i}", "status": "TODO", "user_id": user.id, "created_at": now, "updated_at": now}
+            for i in range(rows)
+        ]
+        db.execute(insert(TaskModel), params)
+        db.commit()
+
+
+def buffered(session_factory: sessionmaker):
+    """Produce the body the way the non-streaming route does."""
+    with session_factory() as db:
+        service = TaskService(SQLAlchemyTaskRepository(db), SQLAlchemyUserRepository(db))
+        responses = [to_task_response(task) for task in service.find_tasks(TaskQuery())]
+        yield JSONResponse(jsonable_encoder(responses)).body
+
+
+def measure(chunks) -> tuple[float, float, float, int]:
+    """Consume a body iterator; return (first byte s, total s, peak MiB, bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, total, peak / 2**20, size
+
+
+def main() -> None:
+    """Seed, then measure both ways of producing the listing."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_database_engine(args.url or f"sqlite:///{tmp}/bench.db")
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(autoflush=False, bind=engine)
+        seed(session_factory, args.rows)
+        print(f"Database: {engine.url}  rows={args.rows}")
+
+        for name, body in (
+            ("buffered", buffered(session_factory)),
+            ("array", stream_tasks(session_factory, TaskQuery(), ndjson=False)),
+            ("ndjson", stream_tasks(session_factory, TaskQuery(), ndjson=True)),
+        ):
+            first, total, peak, size = measure(body)
+            print(
+                f"{name:>8}: first byte {first * 1000:8.1f} ms  total {total:6.2f} s  "
+                f"peak {peak:7.1f} MiB  body {size / 2**20:6.1f} MiB"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""Layered microbenchmarks of the task hot paths, saved as JSON and compared against a baseline.
+
+Seeds a database at each scale (tasks in the table; one user per 100 tasks)
+with the data generator of scripts/seed_data.py, then times every case below
+in-process, one call at a time:
+
+    repository     SQLAlchemyTaskRepository reads and writes
+    hydration      task_queries.to_domain over the whole table
+    service        TaskService operations on the real repositories
+    serialization  the encoders behind the listing routes
+
+Each case is warmed up once, then called until --min-time has passed (at least
+--min-calls times). The median and minimum per-call time are recorded under
+"<layer>.<case>@<scale>". Writes are undone outside the timed calls, so every
+call sees the seeded table.
+
+compare reports the ratio of each median to the baseline's and exits with
+status 1 if any case is more than --threshold slower, so a regression shows up
+in review. Baselines are only comparable on the same database and similar
+hardware; benchmarks/baselines/ holds the ones committed with the code.
+
+Usage:
+    python benchmarks/bench_suite.py run [--url URL] [--scales 1000,100000] [--output bench_results.json]
+        [--baseline benchmarks/baselines/sqlite.json]
+    python benchmarks/bench_suite.py compare RESULTS BASELINE [--threshold 0.25]
+
+The URL defaults to a temporary SQLite file; pass a postgresql:// URL to
+measure a local PostgreSQL. The schema of the target database is dropped and
+recreated. Add 1000000 to --scales for the largest size.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import sqlalchemy
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.services import TaskService
+from domain.models import Task, TaskCursor, TaskFields, TaskQuery, TaskStatus, TaskUpdate
+from infrastructure.database import UserModel, create_database_engine
+from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+from infrastructure.repositories import task_queries as q
+from presentation.api.routes import to_task_response
+from presentation.api.serialization import TASK_FIELDS, task_row_page_response, task_rows_response
+from presentation.api.streaming import encode_chunks
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from seed_data import seed_volume  # noqa: E402
+
+# Version of the results format; compare refuses files of another version
+FORMAT_VERSION = 1
+
+DEFAULT_SCALES = (1_000, 100_000)
+TASKS_PER_USER = 100
+# Tasks written by each bulk case, and rows per listing page
+BATCH = 100
+PAGE_SIZE = 50
+SEARCH_TEXT = "invoice"
+
+
+@dataclass
+class Fixture:
+    """A seeded database and what the cases need from it."""
+
+    session: Session
+    scale: int
+    user_ids: list[int]
+    task_ids: list[int]
+    # Every task as a TASK_COLUMNS row, fetched once for the hydration and serialization cases
+    rows: list
+    # Calls of _updates() so far
+    updates: int = 0
+
+    @property
+    def repository(self) -> SQLAlchemyTaskRepository:
+        return SQLAlchemyTaskRepository(self.session)
+
+    @property
+    def service(self) -> TaskService:
+        return TaskService(self.repository, SQLAlchemyUserRepository(self.session))
+
+    def sample_ids(self, count: int) -> list[int]:
+        """count task ids spread evenly over the table."""
+        step = max(len(self.task_ids) // count, 1)
+        return self.task_ids[::step][:count]
+
+    def new_tasks(self, count: int) -> list[Task]:
+        """count unsaved tasks of the seeded users."""
+        now = datetime.now(UTC)
+        return [
+            Task(None, f"Bench task {i}", TaskStatus.TODO, self.user_ids[i % len(self.user_ids)], now, now)
+            for i in range(count)
+        ]
+
+
+@dataclass(frozen=True)
+class Case:
+    """A timed operation.
+
+    prepare(fixture) returns the operation. If setup is given, it is called
+    untimed before each call and its result passed to the operation; undo is
+    called untimed with each call's result.
+    """
+
+    layer: str
+    name: str
+    prepare: Callable[[Fixture], Callable]
+    setup: Callable[[Fixture], object] | None = None
+    undo: Callable[[Fixture, object], None] | None = None
+
+
+def _delete_created(fixture: Fixture, created: list[Task]) -> None:
+    fixture.repository.delete_many([task.id for task in created])
+
+
+def _delete_bulk_created(fixture: Fixture, results) -> None:
+    fixture.repository.delete_many([result.task_id for result in results if result.ok])
+
+
+def _create_batch(fixture: Fixture) -> list[int]:
+    return [task.id for task in fixture.repository.create_many(fixture.new_tasks(BATCH))]
+
+
+def _updates(fixture: Fixture) -> dict[int, TaskUpdate]:
+    """Status changes for BATCH tasks; alternate calls move them back and forth between statuses."""
+    fixture.updates += 1
+    now = datetime.now(UTC)
+    status = TaskStatus.DOING if fixture.updates % 2 else TaskStatus.DONE
+    return {
+        task_id: TaskUpdate(description=f"Updated task {task_id}", status=status, user_id=user_id, updated_at=now)
+        for task_id, user_id in zip(fixture.sample_ids(BATCH), fixture.user_ids, strict=False)
+    }
+
+
+def _middle_cursor(fixture: Fixture) -> TaskCursor:
+    row = fixture.rows[len(fixture.rows) // 2]
+    return TaskCursor(sort_key=row.created_at, id=row.id)
+
+
+def _user_query(fixture: Fixture) -> TaskQuery:
+    return TaskQuery(user_ids=frozenset({fixture.user_ids[0]}), statuses=frozenset({TaskStatus.TODO}))
+
+
+CASES = (
+    # Repository
+    Case("repository", "get_by_id", lambda f: lambda: f.repository.get_by_id(f.task_ids[len(f.task_ids) // 2])),
+    Case("repository", "get_by_user_id", lambda f: lambda: f.repository.get_by_user_id(f.user_ids[0])),
+    Case("repository", "get_all", lambda f: f.repository.get_all),
+    Case("repository", "find_rows[all]", lambda f: lambda: f.repository.find_rows(TaskQuery())),
+    Case("repository", "find_rows[user,status]", lambda f: lambda: f.repository.find_rows(_user_query(f))),
+    Case("repository", "get_rows_page[first]", lambda f: lambda: f.repository.get_rows_page(PAGE_SIZE)),
+    Case(
+        "repository",
+        "get_rows_page[middle]",
+        lambda f: lambda: f.repository.get_rows_page(PAGE_SIZE, _middle_cursor(f)),
+    ),
+    Case("repository", "search", lambda f: lambda: f.repository.search(SEARCH_TEXT, PAGE_SIZE)),
+    Case("repository", "get_watermark", lambda f: f.repository.get_watermark),
+    Case("repository", "get_counts", lambda f: f.repository.get_counts),
+    Case(
+        "repository",
+        "create",
+        lambda f: lambda: [f.repository.create(f.new_tasks(1)[0])],
+        undo=_delete_created,
+    ),
+    Case(
+        "repository",
+        "update",
+        lambda f: lambda: f.repository.update(*next(iter(_updates(f).items()))),
+    ),
+    Case(
+        "repository",
+        f"create_many[{BATCH}]",
+        lambda f: lambda: f.repository.create_many(f.new_tasks(BATCH)),
+        undo=_delete_created,
+    ),
+    Case("repository", f"update_many[{BATCH}]", lambda f: lambda: f.repository.update_many(_updates(f))),
+    Case(
+        "repository",
+        f"delete_many[{BATCH}]",
+        lambda f: f.repository.delete_many,
+        setup=_create_batch,
+    ),
+    # Hydration
+    Case("hydration", "to_domain[table]", lambda f: lambda: [q.to_domain(row) for row in f.rows]),
+    # Service
+    Case(
+        "service",
+        "create_task",
+        lambda f: lambda: [f.service.create_task("Bench task", TaskStatus.TODO, f.user_ids[0])],
+        undo=_delete_created,
+    ),
+    Case(
+        "service",
+        "update_task",
+        lambda f: lambda: f.service.update_task(f.task_ids[0], "Updated task", TaskStatus.DOING, f.user_ids[0]),
+    ),
+    Case("service", "find_task_rows[user,status]", lambda f: lambda: f.service.find_task_rows(_user_query(f))),
+    Case("service", "get_task_rows_page[first]", lambda f: lambda: f.service.get_task_rows_page(PAGE_SIZE)),
+    Case("service", "search_tasks", lambda f: lambda: f.service.search_tasks(SEARCH_TEXT, PAGE_SIZE)),
+    Case("service", "get_board_summary", lambda f: f.service.get_board_summary),
+    Case(
+        "service",
+        f"create_tasks[{BATCH}]",
+        lambda f: lambda: f.service.create_tasks(
+            [TaskFields(t.description, t.status, t.user_id) for t in f.new_tasks(BATCH)]
+        ),
+        undo=_delete_bulk_created,
+    ),
+    Case(
+        "service",
+        f"update_tasks[{BATCH}]",
+        lambda f: lambda: f.service.update_tasks(
+            [(task_id, TaskFields(c.description, c.status, c.user_id)) for task_id, c in _updates(f).items()]
+        ),
+    ),
+    Case("service", f"delete_tasks[{BATCH}]", lambda f: f.service.delete_tasks, setup=_create_batch),
+    # Serialization
+    Case("serialization", "task_rows_response[table]", lambda f: lambda: task_rows_response(f.rows)),
+    Case(
+        "serialization",
+        "task_row_page_response[page]",
+        lambda f: partial(task_row_page_response, f.repository.get_rows_page(PAGE_SIZE)),
+    ),
+    Case(
+        "serialization",
+        "encode_chunks[table,ndjson]",
+        lambda f: lambda: sum(len(chunk) for chunk in encode_chunks(f.rows, TASK_FIELDS, ndjson=True)),
+    ),
+    Case(
+        "serialization",
+        "to_task_response",
+        lambda f: lambda: to_task_response(q.to_domain(f.rows[0])).model_dump_json(),
+    ),
+)
+
+
+def seed(engine: Engine, scale: int, seed_value: int = 0) -> None:
+    """Recreate the schema and load scale generated tasks, for one user per TASKS_PER_USER (see seed_data.py)."""
+    seed_volume(engine, max(scale // TASKS_PER_USER, 1), scale, seed_value, reset=True, progress=False)
+
+
+@contextmanager
+def fixture_for(engine: Engine, scale: int) -> Iterator[Fixture]:
+    """Open a session on a seeded database and load what the cases share."""
+    with sessionmaker(bind=engine, autoflush=False)() as db:
+        user_ids = db.execute(select(UserModel.id).order_by(UserModel.id)).scalars().all()
+        rows = db.execute(q.select_all()).all()
+        db.rollback()
+        yield Fixture(session=db, scale=scale, user_ids=user_ids, task_ids=[row.id for row in rows], rows=rows)
+
+
+def measure(case: Case, fixture: Fixture, min_time: float, min_calls: int) -> dict:
+    """Time calls of a case one at a time; return the median and minimum in seconds."""
+    op = case.prepare(fixture)
+    times = []
+    total = 0.0
+    call = 0
+    # The first call warms statement caches and connections and is not recorded
+    while call == 0 or total < min_time or len(times) < min_calls:
+        argument = case.setup(fixture) if case.setup else None
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = op(argument) if case.setup else op()
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if case.undo:
+            case.undo(fixture, result)
+        if call > 0:
+            times.append(elapsed)
+            total += elapsed
+        call += 1
+    return {"median": statistics.median(times), "min": min(times), "calls": len(times)}
+
+
+def run(args: argparse.Namespace) -> int:
+    """Seed each scale, time every case, save the results and compare them if a baseline is given."""
+    scales = [int(scale) for scale in args.scales.split(",")]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{tmp}/bench.db"
+        engine = create_database_engine(url)
+        print(f"Database: {engine.dialect.name}  scales={scales}  min time {args.min_time}s per case")
+        try:
+            for scale in scales:
+                started = time.perf_counter()
+                seed(engine, scale)
+                print(f"\nSeeded {scale:,} tasks in {time.perf_counter() - started:.1f}s")
+                with fixture_for(engine, scale) as fixture:
+                    for case in CASES:
+                        key = f"{case.layer}.{case.name}@{scale}"
+                        results[key] = measure(case, fixture, args.min_time, args.min_calls)
+                        print(f"{key:>52}: {_format_seconds(results[key]['median'])}")
+        finally:
+            engine.dispose()
+    report = {"version": FORMAT_VERSION, "meta": _meta(engine.dialect.name), "results": results}
+    Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nResults written to {args.output}")
+    if args.baseline:
+        return compare_reports(report, _load(args.baseline), args.threshold)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two saved result files."""
+    return compare_reports(_load(args.results), _load(args.baseline), args.threshold)
+
+
+def compare_reports(current: dict, baseline: dict, threshold: float) -> int:
+    """Print each case's median against the baseline's; return 1 if any is more than threshold slower."""
+    for field in ("dialect", "python", "sqlalchemy"):
+        if current["meta"].get(field) != baseline["meta"].get(field):
+            print(
+                f"Warning: {field} differs from the baseline "
+                f"({current['meta'].get(field)} vs {baseline['meta'].get(field)}); ratios may not be comparable"
+            )
+    regressions = []
+    print(f"\n{'case':>52}  {'baseline':>10}  {'current':>10}  ratio")
+    for key in sorted(current["results"].keys() | baseline["results"].keys()):
+        if key not in baseline["results"]:
+            print(f"{key:>52}  {'-':>10}  {_format_seconds(current['results'][key]['median']):>10}  new")
+            continue
+        if key not in current["results"]:
+            print(f"{key:>52}  {_format_seconds(baseline['results'][key]['median']):>10}  {'-':>10}  missing")
+            continue
+        before = baseline["results"][key]["median"]
+        after = current["results"][key]["median"]
+        ratio = after / before
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        print(f"{key:>52}  {_format_seconds(before):>10}  {_format_seconds(after):>10}  {ratio:5.2f}x{flag}")
+    if regressions:
+        print(f"\n{len(regressions)} case(s) more than {threshold:.0%} slower than the baseline")
+        return 1
+    print(f"\nNo case more than {threshold:.0%} slower than the baseline")
+    return 0
+
+
+def _meta(dialect: str) -> dict:
+    """Where and when the results were measured."""
+    return {
+        "dialect": dialect,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def _load(path: str) -> dict:
+    """Read a results file, checking its format version."""
+    report = json.loads(Path(path).read_text())
+    if report.get("version") != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported results version {report.get('version')}, expected {FORMAT_VERSION}")
+    return report
+
+
+def _format_seconds(seconds: float) -> str:
+    """A duration in the most readable unit."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def main() -> int:
+    """Parse the command line and run the subcommand."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subcommands.add_parser("run", help="Seed, measure and save results")
+    run_parser.add_argument("--url", help="Sync database URL (default: temporary SQLite file)")
+    run_parser.add_argument("--scales", default=",".join(str(scale) for scale in DEFAULT_SCALES))
+    run_parser.add_argument("--min-time", type=float, default=0.5, help="Seconds to spend timing each case")
+    run_parser.add_argument("--min-calls", type=int, default=5)
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.add_argument("--baseline", help="Results file to compare against after the run")
+    run_parser.add_argument("--threshold", type=float, default=0.25)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subcommands.add_parser("compare", help="Compare saved results against a baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
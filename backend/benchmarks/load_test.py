@@ -0,0 +1,412 @@
+"""Concurrent load test replaying board traffic from a scenario file.
+
+A scenario (see benchmarks/scenarios/board.json) is the list of requests one
+visit to the board makes, in order:
+
+    list_users   GET /api/users
+    list_tasks   GET /api/tasks (step "params" become the query string)
+    move_task    PUT /api/tasks/{task_id}: a task from the last listing to the next status
+    create_task  POST /api/tasks, for a user from the last user listing
+    delete_task  DELETE /api/tasks/{task_id}: the last task this visit created
+
+A step whose input is missing (e.g. move_task on an empty board) is skipped.
+
+Visits run in one of two modes. Closed loop (the default): --concurrency
+virtual users each start a new visit as soon as theirs ends. Open loop
+(--rate): visits arrive at random (Poisson) at the given rate, at most
+--concurrency at once; an arrival while all are busy is dropped and counted,
+since a saturated server would otherwise hide behind a slower arrival rate.
+
+Visits are numbered and each draws its choices from a generator seeded with
+--seed and its number, so runs with the same options issue the same
+requests. Latency is measured per request, from sending it to reading the
+whole body, and reported per route (method and path template) with
+throughput and error rate (status >= 400 or a transport error). Results are
+saved as JSON. compare reports the change of each route against an earlier
+run and exits with status 1 if any p95 is more than --threshold slower or
+any error rate higher.
+
+Without --base-url the app is served in-process (httpx ASGITransport, no
+network) from main.app, on a temporary SQLite file seeded with --tasks tasks,
+or on --database-url (its schema is dropped and recreated).
+
+Usage:
+    python benchmarks/load_test.py run [--scenario benchmarks/scenarios/board.json] [--concurrency 20]
+        [--rate VISITS_PER_SECOND] [--duration 30 | --visits N] [--base-url http://localhost:8000]
+        [--output load_results.json]
+    python benchmarks/load_test.py compare RESULTS BASELINE [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Version of the results format; compare refuses files of another version
+FORMAT_VERSION = 1
+
+DEFAULT_SCENARIO = Path(__file__).parent / "scenarios" / "board.json"
+NEXT_STATUS = {"TODO": "DOING", "DOING": "DONE", "DONE": "TODO"}
+PERCENTILES = (50, 95, 99)
+# Rise in error rate, in percentage points, that compare reports as a regression
+ERROR_RATE_TOLERANCE = 0.01
+
+
+@dataclass
+class Visit:
+    """State carried between the steps of one visit."""
+
+    number: int
+    rng: random.Random
+    user_ids: list[int] = field(default_factory=list)
+    tasks: list[dict] = field(default_factory=list)
+    created_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class RouteStats:
+    """Latencies and errors of one route."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, duration: float) -> dict:
+        """Request count, error rate, throughput and latency percentiles in seconds."""
+        ordered = sorted(self.latencies)
+        quantiles = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+        return {
+            "requests": len(ordered),
+            "errors": self.errors,
+            "error_rate": self.errors / len(ordered),
+            "throughput": len(ordered) / duration,
+            "mean": statistics.fmean(ordered),
+            **{f"p{p}": quantiles[p - 1] for p in PERCENTILES},
+            "max": ordered[-1],
+        }
+
+
+class LoadTest:
+    """Runs visits of a scenario against a client and collects per-route statistics."""
+
+    def __init__(self, client: httpx.AsyncClient, scenario: dict, seed_value: int):
+        """Drive `client` with the steps of `scenario`; visit choices are seeded from seed_value."""
+        self.client = client
+        self.steps = scenario["steps"]
+        self.think_time = scenario.get("think_time_seconds", 0.0)
+        self.seed = seed_value
+        self.routes: dict[str, RouteStats] = defaultdict(RouteStats)
+        self.visits = 0
+        self.dropped = 0
+        self.skipped = 0
+        for step in self.steps:
+            if step["action"] not in ACTIONS:
+                raise ValueError(f"Unknown scenario action '{step['action']}', expected one of {sorted(ACTIONS)}")
+
+    async def closed_loop(self, concurrency: int, deadline: float, max_visits: int | None) -> None:
+        """Run `concurrency` virtual users back to back until the deadline or max_visits visits."""
+
+        async def user() -> None:
+            while time.perf_counter() < deadline and (max_visits is None or self.visits < max_visits):
+                await self.visit(self._next_visit())
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    async def open_loop(self, rate: float, concurrency: int, deadline: float, max_visits: int | None) -> None:
+        """Start visits at random at `rate` per second, dropping arrivals beyond `concurrency` in flight."""
+        arrivals = random.Random(self.seed)
+        running: set[asyncio.Task] = set()
+        arrived = 0
+        while time.perf_counter() < deadline and (max_visits is None or arrived < max_visits):
+            await asyncio.sleep(arrivals.expovariate(rate))
+            arrived += 1
+            if len(running) >= concurrency:
+                self.dropped += 1
+                continue
+            task = asyncio.create_task(self.visit(self._next_visit()))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        await asyncio.gather(*running)
+
+    async def visit(self, visit: Visit) -> None:
+        """Run every step of the scenario in order."""
+        for step in self.steps:
+            await ACTIONS[step["action"]](self, visit, step)
+            if self.think_time:
+                await asyncio.sleep(self.think_time)
+
+    async def request(self, route: str, method: str, path: str, **kwargs) -> httpx.Response | None:
+        """Send a request and record its latency under `route`; None if it failed."""
+        stats = self.routes[route]
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            stats.latencies.append(time.perf_counter() - start)
+            stats.errors += 1
+            return None
+        stats.latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            stats.errors += 1
+            return None
+        return response
+
+    def _next_visit(self) -> Visit:
+        self.visits += 1
+        return Visit(number=self.visits, rng=random.Random(self.seed * 1_000_003 + self.visits))
+
+
+async def list_users(test: LoadTest, visit: Visit, step: dict) -> None:
+    response = await test.request("GET /api/users", "GET", "/api/users")
+    if response is not None:
+        visit.user_ids = [user["id"] for user in response.json()]
+
+
+async def list_tasks(test: LoadTest, visit: Visit, step: dict) -> None:
+    response = await test.request("GET /api/tasks", "GET", "/api/tasks", params=step.get("params"))
+    if response is not None:
+        body = response.json()
+        # A paged listing (limit=N) wraps the tasks in items
+        visit.tasks = body["items"] if isinstance(body, dict) else body
+
+
+async def move_task(test: LoadTest, visit: Visit, step: dict) -> None:
+    if not visit.tasks:
+        test.skipped += 1
+        return
+    task = visit.rng.choice(visit.tasks)
+    body = {"description": task["description"], "status": NEXT_STATUS[task["status"]], "user_id": task["user_id"]}
+    await test.request("PUT /api/tasks/{task_id}", "PUT", f"/api/tasks/{task['id']}", json=body)
+
+
+async def create_task(test: LoadTest, visit: Visit, step: dict) -> None:
+    if not visit.user_ids:
+        test.skipped += 1
+        return
+    body = {
+        "description": f"Load test task {visit.number}",
+        "status": "TODO",
+        "user_id": visit.rng.choice(visit.user_ids),
+    }
+    response = await test.request("POST /api/tasks", "POST", "/api/tasks", json=body)
+    if response is not None:
+        visit.created_ids.append(response.json()["id"])
+
+
+async def delete_task(test: LoadTest, visit: Visit, step: dict) -> None:
+    if not visit.created_ids:
+        test.skipped += 1
+        return
+    task_id = visit.created_ids.pop()
+    await test.request("DELETE /api/tasks/{task_id}", "DELETE", f"/api/tasks/{task_id}")
+
+
+ACTIONS: dict[str, Callable[[LoadTest, Visit, dict], Awaitable[None]]] = {
+    "list_users": list_users,
+    "list_tasks": list_tasks,
+    "move_task": move_task,
+    "create_task": create_task,
+    "delete_task": delete_task,
+}
+
+
+@asynccontextmanager
+async def in_process_client(database_url: str | None, tasks: int) -> AsyncIterator[httpx.AsyncClient]:
+    """A client of main.app served in-process, on a freshly seeded database."""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = database_url or f"sqlite:///{tmp}/load.db"
+        # Settings are read when the app's modules are first imported, so they are imported here
+        os.environ["DATABASE_URL"] = url
+        os.environ.setdefault("DEBUG", "false")
+        from bench_suite import seed
+
+        from infrastructure.database import create_database_engine
+
+        engine = create_database_engine(url)
+        seed(engine, tasks)
+        engine.dispose()
+        from main import app
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+                yield client
+
+
+@asynccontextmanager
+async def network_client(base_url: str, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """A client of a running server, with a connection per virtual user."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        yield client
+
+
+async def run_scenario(args: argparse.Namespace, scenario: dict) -> dict:
+    """Run the load test and return its results."""
+    if args.base_url:
+        client_context = network_client(args.base_url, args.concurrency)
+    else:
+        client_context = in_process_client(args.database_url, args.tasks)
+    async with client_context as client:
+        test = LoadTest(client, scenario, args.seed)
+        start = time.perf_counter()
+        deadline = start + args.duration if args.visits is None else float("inf")
+        if args.rate:
+            await test.open_loop(args.rate, args.concurrency, deadline, args.visits)
+        else:
+            await test.closed_loop(args.concurrency, deadline, args.visits)
+        duration = time.perf_counter() - start
+    requests = sum(len(stats.latencies) for stats in test.routes.values())
+    errors = sum(stats.errors for stats in test.routes.values())
+    return {
+        "version": FORMAT_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "config": {
+            "scenario": scenario["name"],
+            "target": args.base_url or "in-process",
+            "mode": "open" if args.rate else "closed",
+            "concurrency": args.concurrency,
+            "rate": args.rate,
+            "duration": args.duration if args.visits is None else None,
+            "visits": args.visits,
+            "tasks": None if args.base_url else args.tasks,
+            "seed": args.seed,
+        },
+        "summary": {
+            "visits": test.visits,
+            "visits_dropped": test.dropped,
+            "steps_skipped": test.skipped,
+            "requests": requests,
+            "errors": errors,
+            "error_rate": errors / requests if requests else 0.0,
+            "throughput": requests / duration,
+            "duration": duration,
+        },
+        "routes": {route: stats.summary(duration) for route, stats in sorted(test.routes.items())},
+    }
+
+
+def print_results(results: dict) -> None:
+    """Print the summary and a line per route."""
+    config, summary = results["config"], results["summary"]
+    print(
+        f"Scenario {config['scenario']} on {config['target']}: {config['mode']} loop, "
+        f"concurrency {config['concurrency']}" + (f", {config['rate']} visits/s" if config["rate"] else "")
+    )
+    print(
+        f"{summary['visits']} visits ({summary['visits_dropped']} dropped), {summary['requests']} requests "
+        f"in {summary['duration']:.1f}s: {summary['throughput']:.1f} req/s, {summary['error_rate']:.2%} errors"
+    )
+    print(f"\n{'route':>30}  {'requests':>8}  {'req/s':>8}  {'errors':>7}  {'p50':>9}  {'p95':>9}  {'p99':>9}")
+    for route, stats in results["routes"].items():
+        print(
+            f"{route:>30}  {stats['requests']:>8}  {stats['throughput']:>8.1f}  {stats['error_rate']:>7.2%}  "
+            f"{stats['p50'] * 1e3:>6.1f} ms  {stats['p95'] * 1e3:>6.1f} ms  {stats['p99'] * 1e3:>6.1f} ms"
+        )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the scenario, print and save the results."""
+    scenario = json.loads(Path(args.scenario).read_text())
+    results = asyncio.run(run_scenario(args, scenario))
+    print_results(results)
+    Path(args.output).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print each route's p95 and throughput against an earlier run; 1 if any route regressed."""
+    current, baseline = _load(args.results), _load(args.baseline)
+    for key in sorted(current["config"].keys() | baseline["config"].keys()):
+        if current["config"].get(key) != baseline["config"].get(key):
+            print(
+                f"Warning: {key} differs from the baseline "
+                f"({current['config'].get(key)} vs {baseline['config'].get(key)}); results may not be comparable"
+            )
+    regressions = []
+    print(f"\n{'route':>30}  {'p95 before':>10}  {'p95 after':>10}  ratio  {'req/s before':>12}  {'req/s after':>11}")
+    for route in sorted(current["routes"].keys() & baseline["routes"].keys()):
+        before, after = baseline["routes"][route], current["routes"][route]
+        ratio = after["p95"] / before["p95"]
+        flags = []
+        if ratio > 1 + args.threshold:
+            flags.append("SLOWER")
+        if after["error_rate"] > before["error_rate"] + ERROR_RATE_TOLERANCE:
+            flags.append(f"ERRORS {before['error_rate']:.2%} -> {after['error_rate']:.2%}")
+        if flags:
+            regressions.append(route)
+        print(
+            f"{route:>30}  {before['p95'] * 1e3:>7.1f} ms  {after['p95'] * 1e3:>7.1f} ms  {ratio:4.2f}x  "
+            f"{before['throughput']:>12.1f}  {after['throughput']:>11.1f}  {' '.join(flags)}"
+        )
+    for route in sorted(current["routes"].keys() ^ baseline["routes"].keys()):
+        print(f"{route:>30}  only in {'the results' if route in current['routes'] else 'the baseline'}")
+    if regressions:
+        print(f"\n{len(regressions)} route(s) regressed against the baseline")
+        return 1
+    print("\nNo route regressed against the baseline")
+    return 0
+
+
+def _load(path: str) -> dict:
+    """Read a results file, checking its format version."""
+    results = json.loads(Path(path).read_text())
+    if results.get("version") != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported results version {results.get('version')}, expected {FORMAT_VERSION}")
+    return results
+
+
+def main() -> int:
+    """Parse the command line and run the subcommand."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subcommands.add_parser("run", help="Run a scenario and save the results")
+    run_parser.add_argument("--scenario", default=str(DEFAULT_SCENARIO))
+    run_parser.add_argument("--base-url", help="Server to load (default: main.app in-process)")
+    run_parser.add_argument("--database-url", help="In-process only: database to seed (default: temporary SQLite)")
+    run_parser.add_argument("--tasks", type=int, default=1000, help="In-process only: tasks to seed")
+    run_parser.add_argument("--concurrency", type=int, default=20, help="Virtual users, or visits in flight")
+    run_parser.add_argument("--rate", type=float, help="Visits per second (open loop); default: closed loop")
+    length = run_parser.add_mutually_exclusive_group()
+    length.add_argument("--duration", type=float, default=30.0, help="Seconds to start visits for")
+    length.add_argument("--visits", type=int, help="Number of visits to start instead of a duration")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", default="load_results.json")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subcommands.add_parser("compare", help="Compare saved results against an earlier run")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.25)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Add composite index for keyset pagination of tasks.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-02-03
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (created_at, id) index used by cursor pagination."""
+    op.create_index(
+        'ix_tasks_created_at_id',
+        'tasks',
+        ['created_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Remove (created_at, id) index."""
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
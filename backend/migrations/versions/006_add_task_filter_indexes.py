@@ -0,0 +1,44 @@
+"""Add composite indexes for filtered and sorted task queries.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-02-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes backing user/status filters and updated_at ordering."""
+    op.create_index(
+        'ix_tasks_user_id_status_created_at',
+        'tasks',
+        ['user_id', 'status', 'created_at']
+    )
+    op.create_index(
+        'ix_tasks_status_created_at',
+        'tasks',
+        ['status', 'created_at']
+    )
+    op.create_index(
+        'ix_tasks_updated_at_id',
+        'tasks',
+        ['updated_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Remove filter indexes."""
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_status_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_user_id_status_created_at', table_name='tasks')
@@ -0,0 +1,53 @@
+"""Add task change sequence and tombstones for delta sync.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-02-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add tasks.change_seq, the change counter and the tombstone table."""
+    # Existing tasks start at sequence 0, before any token a client can hold
+    op.add_column('tasks', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+    op.create_index('ix_tasks_change_seq', 'tasks', ['change_seq'])
+
+    change_counters = op.create_table(
+        'change_counters',
+        sa.Column('name', sa.String(length=64), primary_key=True),
+        sa.Column('value', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('compacted_through', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.bulk_insert(change_counters, [{'name': 'tasks', 'value': 0, 'compacted_through': 0}])
+
+    op.create_table(
+        'task_tombstones',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_task_tombstones_change_seq', 'task_tombstones', ['change_seq'])
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at'])
+
+
+def downgrade() -> None:
+    """Remove change tracking."""
+    op.drop_index('ix_task_tombstones_deleted_at', table_name='task_tombstones')
+    op.drop_index('ix_task_tombstones_change_seq', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_table('change_counters')
+    op.drop_index('ix_tasks_change_seq', table_name='tasks')
+    op.drop_column('tasks', 'change_seq')
@@ -0,0 +1,47 @@
+"""Add the users change counter and NOTIFY on counter updates.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the users counter row and the pg_notify trigger."""
+    op.execute("INSERT INTO change_counters (name, value, compacted_through) VALUES ('users', 0, 0)")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_change_counters() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('change_counters', NEW.name);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER change_counters_notify
+        AFTER UPDATE OF value ON change_counters
+        FOR EACH ROW EXECUTE FUNCTION notify_change_counters()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove the trigger and the users counter row."""
+    op.execute("DROP TRIGGER IF EXISTS change_counters_notify ON change_counters")
+    op.execute("DROP FUNCTION IF EXISTS notify_change_counters()")
+    op.execute("DELETE FROM change_counters WHERE name = 'users'")
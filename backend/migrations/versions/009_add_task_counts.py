@@ -0,0 +1,43 @@
+"""Add per-user, per-status task counters for the board summary.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-02-14
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create task_counts and fill it from the existing tasks."""
+    # Reuse the enum type created with the tasks table
+    status = postgresql.ENUM('TODO', 'DOING', 'DONE', name='taskstatus', create_type=False)
+    op.create_table(
+        'task_counts',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('status', status, nullable=False),
+        sa.Column('count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('user_id', 'status'),
+    )
+    op.execute(
+        """
+        INSERT INTO task_counts (user_id, status, count)
+        SELECT user_id, status, COUNT(*) FROM tasks GROUP BY user_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop task_counts."""
+    op.drop_table('task_counts')
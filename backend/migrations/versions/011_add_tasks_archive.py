@@ -0,0 +1,67 @@
+"""Add the tasks_archive table for archived DONE tasks.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-02-20
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create tasks_archive with the indexes of archived listings; tasks are archived by the job."""
+    # Reuse the enum type created with the tasks table
+    status = postgresql.ENUM('TODO', 'DOING', 'DONE', name='taskstatus', create_type=False)
+    op.create_table(
+        'tasks_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('status', status, nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_tasks_archive_user_id', 'tasks_archive', ['user_id'])
+    op.create_index('ix_tasks_archive_archived_at', 'tasks_archive', ['archived_at'])
+    op.create_index('ix_tasks_archive_created_at_id', 'tasks_archive', ['created_at', 'id'])
+    op.create_index('ix_tasks_archive_updated_at_id', 'tasks_archive', ['updated_at', 'id'])
+
+
+def downgrade() -> None:
+    """Move archived tasks back into tasks and drop tasks_archive."""
+    # The restored tasks are written at a fresh change sequence value, so delta sync reports them
+    op.execute("UPDATE change_counters SET value = value + 1 WHERE name = 'tasks'")
+    op.execute(
+        """
+        INSERT INTO tasks (id, description, status, user_id, created_at, updated_at, change_seq)
+        SELECT id, description, status, user_id, created_at, updated_at,
+               (SELECT value FROM change_counters WHERE name = 'tasks')
+        FROM tasks_archive
+        """
+    )
+    # The restored tasks count on the board again
+    op.execute('DELETE FROM task_counts')
+    op.execute(
+        """
+        INSERT INTO task_counts (user_id, status, count)
+        SELECT user_id, status, COUNT(*) FROM tasks GROUP BY user_id, status
+        """
+    )
+    op.drop_index('ix_tasks_archive_updated_at_id', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_created_at_id', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_archived_at', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_user_id', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
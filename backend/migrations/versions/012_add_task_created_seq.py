@@ -0,0 +1,28 @@
+"""Record the change sequence value each task was inserted at.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add tasks.created_seq; existing tasks predate every sync token and keep 0."""
+    op.add_column('tasks', sa.Column('created_seq', sa.BigInteger(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Drop tasks.created_seq."""
+    op.drop_column('tasks', 'created_seq')
@@ -0,0 +1,38 @@
+"""Move DONE tasks not updated for ARCHIVE_AFTER_DAYS to tasks_archive.
+
+Run periodically (e.g. nightly from cron). Tasks move in batches of
+ARCHIVE_BATCH_SIZE, one transaction each, so writers are never held up for
+long. Archived tasks leave the default listings, the board counts and task
+lookups; listings with include_archived=true still return them.
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from application.services import TaskService
+from infrastructure.config import get_settings
+from infrastructure.database import get_session_factory
+from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+
+
+def archive_tasks():
+    """Archive old DONE tasks."""
+    settings = get_settings()
+    age = timedelta(days=settings.archive_after_days)
+    print(f"Archiving DONE tasks not updated for {age.days} days...")
+
+    db = get_session_factory()()
+    try:
+        service = TaskService(SQLAlchemyTaskRepository(db), SQLAlchemyUserRepository(db))
+        archived = service.archive_done_tasks(age, settings.archive_batch_size)
+        print(f"Archived {archived} tasks")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    archive_tasks()
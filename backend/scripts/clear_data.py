@@ -6,8 +6,9 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from infrastructure.database import SessionLocal
-from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.database import get_session_factory
+from infrastructure.database.models import TaskArchiveModel, TaskCountModel, TaskModel, UserModel
+from infrastructure.repositories import task_queries, user_queries
 
 
 def clear_database():
@@ -15,17 +16,23 @@ def clear_database():
     print("Starting database clearing...")
 
     # Create session
-    db = SessionLocal()
+    db = get_session_factory()()
 
     try:
         # Delete all tasks first (due to foreign key constraint)
         deleted_tasks = db.query(TaskModel).delete()
         print(f"Deleted {deleted_tasks} tasks")
+        db.query(TaskCountModel).delete()
+        archived_tasks = db.query(TaskArchiveModel).delete()
+        print(f"Deleted {archived_tasks} archived tasks")
 
         # Delete all users
         deleted_users = db.query(UserModel).delete()
         print(f"Deleted {deleted_users} users")
 
+        # Move the change counters, as repository writes do, so ETags and caches drop the old rows
+        db.execute(task_queries.next_change_seq())
+        db.execute(user_queries.next_change_seq())
         db.commit()
         print("Database cleared successfully!")
 
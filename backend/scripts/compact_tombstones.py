@@ -0,0 +1,35 @@
+"""Compact task tombstones older than the delta sync retention window.
+
+Run periodically (e.g. daily from cron). Sync tokens older than the window
+are answered with 410 afterwards and clients fall back to a full listing.
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from application.services import TaskService
+from infrastructure.config import get_settings
+from infrastructure.database import get_session_factory
+from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+
+
+def compact_tombstones():
+    """Delete tombstones past the retention window."""
+    retention = timedelta(days=get_settings().tombstone_retention_days)
+    print(f"Compacting task tombstones older than {retention.days} days...")
+
+    db = get_session_factory()()
+    try:
+        service = TaskService(SQLAlchemyTaskRepository(db), SQLAlchemyUserRepository(db))
+        removed = service.compact_tombstones(retention)
+        print(f"Removed {removed} tombstones")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    compact_tombstones()
@@ -0,0 +1,32 @@
+"""Rebuild the board summary counters (task_counts) from the tasks table.
+
+Task writes keep the counters up to date; run this to repair them after
+tasks were changed outside the repositories (manual SQL, restores).
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from application.services import TaskService
+from infrastructure.database import get_session_factory
+from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+
+
+def rebuild_task_counts():
+    """Recompute every (user, status) task count."""
+    print("Rebuilding task counts...")
+
+    db = get_session_factory()()
+    try:
+        service = TaskService(SQLAlchemyTaskRepository(db), SQLAlchemyUserRepository(db))
+        rebuilt = service.rebuild_board_counts()
+        print(f"Rebuilt {rebuilt} (user, status) counts")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rebuild_task_counts()
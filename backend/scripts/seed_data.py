@@ -1,26 +1,72 @@
-"""Seed data script for testing."""
+"""Seed data script for testing.
 
+Without arguments, adds a handful of demo users and tasks to an empty
+database. With --users and --tasks, generates that many rows deterministically
+from --seed and bulk loads them (COPY on PostgreSQL, executemany on SQLite),
+for benchmarks and query plan checks at production volume:
+
+    python scripts/seed_data.py --users 100000 --tasks 5000000 --seed 42 --reset
+
+Generated data:
+- users and tasks are created between --end minus --days and --end, tasks in
+  id order, each after its user;
+- tasks per user are skewed: with --skew s, the busiest fraction f of users
+  owns a fraction f ** (1 / s) of the tasks (s = 2: 10% of users own 32%);
+- older tasks are more often DONE, recent ones TODO or DOING.
+"""
+
+import argparse
+import random
 import sys
-from datetime import UTC, datetime
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import Session
+
 from domain.models.task import TaskStatus
-from infrastructure.database import Base, SessionLocal, engine
+from infrastructure.database import (
+    Base,
+    bulk_insert,
+    deferred_search_index,
+    get_engine,
+    get_session_factory,
+    supports_copy,
+    sync_id_sequence,
+)
+from infrastructure.database.bulk_load import DEFAULT_BATCH_SIZE
 from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.repositories import SQLAlchemyTaskRepository, user_queries
+
+# Generated data ends here unless --end is given, so a seed always yields the same rows
+DEFAULT_END = datetime(2026, 1, 1)
+DEFAULT_DAYS = 3 * 365
+DEFAULT_SKEW = 2.0
+
+USER_COLUMNS = ("id", "first_name", "last_name", "email", "created_at", "updated_at")
+TASK_COLUMNS = ("id", "description", "status", "user_id", "created_at", "updated_at")
+
+FIRST_NAMES = ("Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Hiro", "Ines", "Jamal", "Kim", "Lena")
+LAST_NAMES = ("Johnson", "Smith", "Brown", "Prince", "Martinez", "Nguyen", "Okafor", "Rossi", "Schmidt", "Tanaka")
+VERBS = ("Review", "Draft", "Send", "Update", "Archive", "Plan", "Fix", "Prepare", "Test", "Deploy")
+NOUNS = ("invoice", "roadmap", "report", "contract", "release", "budget", "onboarding", "backlog", "migration", "API")
+QUALIFIERS = ("for Q3", "before the demo", "with the client", "draft v2", "follow-up", "", "", "")
+
+# Multiplier spreading busy users over the id range; a prime, so coprime with any smaller user count
+_USER_SPREAD = 2_654_435_761
 
 
 def seed_database():
     """Seed the database with test data."""
     print("Starting database seeding...")
 
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-
     # Create session
-    db = SessionLocal()
+    db = get_session_factory()()
 
     try:
         # Check if users already exist
@@ -141,6 +187,11 @@ def seed_database():
         db.commit()
         print(f"Created {len(tasks)} tasks")
 
+        # Rows were added through the ORM, bypassing the counter maintenance; rebuilding the
+        # task counts also moves the tasks change counter, and the users one is moved here
+        db.execute(user_queries.next_change_seq())
+        SQLAlchemyTaskRepository(db).rebuild_counts()
+
         print("Database seeding completed successfully!")
 
     except Exception as e:
@@ -151,5 +202,147 @@ def seed_database():
         db.close()
 
 
+def user_created_at(user_id: int, users: int, start: datetime, end: datetime) -> datetime:
+    """Creation time of a generated user: users sign up evenly over the first half of the period."""
+    return start + (end - start) / 2 * ((user_id - 1) / users)
+
+
+def generate_users(count: int, seed: int, end: datetime = DEFAULT_END, days: int = DEFAULT_DAYS) -> Iterator[tuple]:
+    """Yield count user rows (USER_COLUMNS) with ids 1..count."""
+    rng = random.Random(f"users-{seed}")
+    start = end - timedelta(days=days)
+    for user_id in range(1, count + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        created = user_created_at(user_id, count, start, end)
+        updated = min(created + timedelta(days=rng.expovariate(1 / 30)), end)
+        yield user_id, first, last, f"{first}.{last}.{user_id}@example.com".lower(), created, updated
+
+
+def generate_tasks(
+    count: int,
+    users: int,
+    seed: int,
+    end: datetime = DEFAULT_END,
+    days: int = DEFAULT_DAYS,
+    skew: float = DEFAULT_SKEW,
+) -> Iterator[tuple]:
+    """Yield count task rows (TASK_COLUMNS) with ids 1..count, for users 1..users, oldest first."""
+    rng = random.Random(f"tasks-{seed}")
+    start = end - timedelta(days=days)
+    period = end - start
+    for task_id in range(1, count + 1):
+        # Rank 0 is the busiest user; ranks are spread over the ids so busy users are not all the oldest
+        rank = int(users * rng.random() ** skew)
+        user_id = rank * _USER_SPREAD % users + 1
+        created = max(
+            start + period * ((task_id - 1 + rng.random()) / count), user_created_at(user_id, users, start, end)
+        )
+        age = (end - created) / period
+        roll = rng.random()
+        if roll < 0.15 + 0.75 * age:
+            status = TaskStatus.DONE
+        elif roll < 0.35 + 0.6 * age:
+            status = TaskStatus.DOING
+        else:
+            status = TaskStatus.TODO
+        # Tasks still to do were mostly never edited; the others were moved some time after creation
+        edited = status != TaskStatus.TODO or rng.random() < 0.3
+        updated = min(created + timedelta(days=rng.expovariate(1 / 5)), end) if edited else created
+        description = f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.choice(QUALIFIERS)}".strip()
+        yield task_id, description, status, user_id, created, updated
+
+
+def progress_printer(label: str, total: int) -> Callable[[int], None]:
+    """A bulk_insert progress callback printing rows loaded and rows per second, at most once a second."""
+    started = time.perf_counter()
+    last_printed = started
+
+    def report(loaded: int) -> None:
+        nonlocal last_printed
+        now = time.perf_counter()
+        if now - last_printed < 1 and loaded < total:
+            return
+        last_printed = now
+        print(f"{label}: {loaded:,}/{total:,} ({loaded / (now - started):,.0f} rows/s)", flush=True)
+
+    return report
+
+
+def seed_volume(
+    target: Engine,
+    users: int,
+    tasks: int,
+    seed: int,
+    skew: float = DEFAULT_SKEW,
+    end: datetime = DEFAULT_END,
+    days: int = DEFAULT_DAYS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    reset: bool = False,
+    progress: bool = True,
+) -> None:
+    """Generate users and tasks from a seed and bulk load them into an empty database."""
+    if reset:
+        Base.metadata.drop_all(bind=target)
+    Base.metadata.create_all(bind=target)
+    with target.connect() as conn:
+        if conn.execute(select(func.count()).select_from(UserModel)).scalar_one():
+            raise SystemExit("The database already has users; pass --reset to drop and recreate the schema")
+
+    method = "COPY" if supports_copy(target) else "executemany"
+    if progress:
+        print(f"Loading {users:,} users and {tasks:,} tasks with {method}, {batch_size:,} rows per batch")
+    started = time.perf_counter()
+    bulk_insert(
+        target,
+        UserModel.__table__,
+        USER_COLUMNS,
+        generate_users(users, seed, end, days),
+        batch_size,
+        progress_printer("users", users) if progress else None,
+    )
+    with deferred_search_index(target):
+        bulk_insert(
+            target,
+            TaskModel.__table__,
+            TASK_COLUMNS,
+            generate_tasks(tasks, users, seed, end, days, skew),
+            batch_size,
+            progress_printer("tasks", tasks) if progress else None,
+        )
+    sync_id_sequence(target, UserModel.__table__)
+    sync_id_sequence(target, TaskModel.__table__)
+    # Rows were loaded directly, bypassing the counter maintenance; rebuilding the task
+    # counts also moves the tasks change counter, and the users one is moved here
+    with Session(target) as db:
+        db.execute(user_queries.next_change_seq())
+        SQLAlchemyTaskRepository(db).rebuild_counts()
+    if progress:
+        elapsed = time.perf_counter() - started
+        print(f"Loaded {users + tasks:,} rows in {elapsed:.1f}s ({(users + tasks) / elapsed:,.0f} rows/s)")
+
+
+def main():
+    """Seed demo data, or generated data at volume when --users and --tasks are given."""
+    parser = argparse.ArgumentParser(description="Seed the database with demo or generated data")
+    parser.add_argument("--users", type=int, help="Users to generate")
+    parser.add_argument("--tasks", type=int, help="Tasks to generate")
+    parser.add_argument("--seed", type=int, default=0, help="Same seed, same rows")
+    parser.add_argument("--skew", type=float, default=DEFAULT_SKEW, help="Task ownership skew (1 = uniform)")
+    parser.add_argument("--end", type=datetime.fromisoformat, default=DEFAULT_END, help="Latest timestamp")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days of history before --end")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate the schema first")
+    args = parser.parse_args()
+
+    if args.users is None and args.tasks is None:
+        seed_database()
+        return
+    if not args.users or args.tasks is None:
+        parser.error("--users (at least 1) and --tasks are required to generate data")
+    seed_volume(
+        get_engine(), args.users, args.tasks, args.seed, args.skew, args.end, args.days, args.batch_size, args.reset
+    )
+
+
 if __name__ == "__main__":
-    seed_database()
+    main()
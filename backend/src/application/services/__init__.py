@@ -1,6 +1,8 @@
 """Services (business logic)."""
 
+from .async_task_service import AsyncTaskService
+from .async_user_service import AsyncUserService
 from .task_service import TaskService
 from .user_service import UserService
 
-__all__ = ["TaskService", "UserService"]
+__all__ = ["AsyncTaskService", "AsyncUserService", "TaskService", "UserService"]
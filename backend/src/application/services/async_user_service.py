@@ -0,0 +1,39 @@
+"""Async user service (business logic)."""
+
+from collections.abc import AsyncIterator
+
+from domain.models import TableWatermark, User, UserRow
+from domain.ports import AsyncUserRepository
+
+from .task_service import STREAM_BATCH_SIZE
+
+
+class AsyncUserService:
+    """Async user service, mirroring UserService over an async repository."""
+
+    def __init__(self, user_repository: AsyncUserRepository):
+        """Initialize service with repository."""
+        self.user_repository = user_repository
+
+    async def get_all_users(self) -> list[User]:
+        """Get all users."""
+        return await self.user_repository.get_all()
+
+    async def get_all_user_rows(self) -> list[UserRow]:
+        """Get the rows of all users, for listing."""
+        return await self.user_repository.get_all_rows()
+
+    async def get_users_watermark(self) -> TableWatermark:
+        """Get a cheap summary of the users table that changes whenever its rows do."""
+        return await self.user_repository.get_watermark()
+
+    def stream_users(self, batch_size: int = STREAM_BATCH_SIZE) -> AsyncIterator[UserRow]:
+        """Iterate over the rows of all users without loading them all at once."""
+        return self.user_repository.stream(batch_size)
+
+    async def get_user_by_id(self, user_id: int) -> User:
+        """Get a user by id."""
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            raise ValueError(f"User with id {user_id} not found")
+        return user
@@ -0,0 +1,113 @@
+"""I/O-free steps of bulk task operations, shared by the sync and async services."""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from domain.models import BulkItemResult, Task, TaskFields, TaskUpdate
+
+# (request index, task id or None for creations, validated task or changes)
+Pending = list[tuple[int, int | None, Task | TaskUpdate]]
+
+
+def validate_new_tasks(items: Sequence[TaskFields], now: datetime) -> tuple[dict[int, BulkItemResult], Pending]:
+    """Validate creation items, returning error results and the valid pending tasks."""
+    results: dict[int, BulkItemResult] = {}
+    pending: Pending = []
+    for index, item in enumerate(items):
+        try:
+            task = Task(
+                id=None,
+                description=item.description,
+                status=item.status,
+                user_id=item.user_id,
+                created_at=now,
+                updated_at=now,
+            )
+        except ValueError as e:
+            results[index] = BulkItemResult(index=index, error=str(e))
+            continue
+        pending.append((index, None, task))
+    return results, pending
+
+
+def validate_task_updates(
+    items: Sequence[tuple[int, TaskFields]], now: datetime
+) -> tuple[dict[int, BulkItemResult], Pending]:
+    """Validate update items, returning error results and the valid pending changes."""
+    results: dict[int, BulkItemResult] = {}
+    pending: Pending = []
+    seen: set[int] = set()
+    for index, (task_id, item) in enumerate(items):
+        if task_id in seen:
+            results[index] = BulkItemResult(index=index, task_id=task_id, error=f"Duplicate task id {task_id}")
+            continue
+        seen.add(task_id)
+        try:
+            changes = TaskUpdate(description=item.description, status=item.status, user_id=item.user_id, updated_at=now)
+        except ValueError as e:
+            results[index] = BulkItemResult(index=index, task_id=task_id, error=str(e))
+            continue
+        pending.append((index, task_id, changes))
+    return results, pending
+
+
+def referenced_user_ids(pending: Pending) -> set[int]:
+    """Ids of all users referenced by pending items."""
+    return {item.user_id for _, _, item in pending}
+
+
+def drop_unknown_users(pending: Pending, known_user_ids: set[int], results: dict[int, BulkItemResult]) -> Pending:
+    """Report and drop pending items whose user does not exist."""
+    kept: Pending = []
+    for index, task_id, item in pending:
+        if item.user_id in known_user_ids:
+            kept.append((index, task_id, item))
+        else:
+            results[index] = BulkItemResult(
+                index=index, task_id=task_id, error=f"User with id {item.user_id} not found"
+            )
+    return kept
+
+
+def collect_created(
+    pending: Pending, created: list[Task], results: dict[int, BulkItemResult], count: int
+) -> list[BulkItemResult]:
+    """Merge created tasks into the results, in request order."""
+    for (index, _, _), task in zip(pending, created, strict=True):
+        results[index] = BulkItemResult(index=index, task_id=task.id, task=task)
+    return [results[index] for index in range(count)]
+
+
+def collect_updated(
+    pending: Pending, updated: list[Task], results: dict[int, BulkItemResult], count: int
+) -> list[BulkItemResult]:
+    """Merge updated tasks into the results, in request order; missing tasks become errors."""
+    updated_by_id = {task.id: task for task in updated}
+    for index, task_id, _ in pending:
+        task = updated_by_id.get(task_id)
+        if task is None:
+            results[index] = BulkItemResult(index=index, task_id=task_id, error=f"Task with id {task_id} not found")
+        else:
+            results[index] = BulkItemResult(index=index, task_id=task_id, task=task)
+    return [results[index] for index in range(count)]
+
+
+def unique_ids(task_ids: Sequence[int]) -> list[int]:
+    """Task ids without duplicates, in first-seen order."""
+    return list(dict.fromkeys(task_ids))
+
+
+def collect_deleted(task_ids: Sequence[int], deleted: set[int]) -> list[BulkItemResult]:
+    """Build delete results in request order; duplicates and missing tasks become errors."""
+    results = []
+    seen: set[int] = set()
+    for index, task_id in enumerate(task_ids):
+        if task_id in seen:
+            error = f"Duplicate task id {task_id}"
+        elif task_id not in deleted:
+            error = f"Task with id {task_id} not found"
+        else:
+            error = None
+        seen.add(task_id)
+        results.append(BulkItemResult(index=index, task_id=task_id, error=error))
+    return results
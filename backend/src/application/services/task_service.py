@@ -1,27 +1,55 @@
 """Task service (business logic)."""
 
-from datetime import UTC, datetime
-
-from domain.models import Task, TaskStatus
-from domain.ports import TaskRepository, UserRepository
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+
+from domain.models import (
+    BoardSummary,
+    BulkItemResult,
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCursor,
+    TaskEvent,
+    TaskEventType,
+    TaskFields,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskStatus,
+    TaskUpdate,
+)
+from domain.ports import TaskEventPublisher, TaskRepository, UserRepository
+
+from . import bulk
+
+# Rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 1000
 
 
 class TaskService:
     """Task service."""
 
-    def __init__(self, task_repository: TaskRepository, user_repository: UserRepository):
-        """Initialize service with repositories."""
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        user_repository: UserRepository,
+        publisher: TaskEventPublisher | None = None,
+    ):
+        """Initialize service with repositories and, optionally, where to publish committed changes."""
         self.task_repository = task_repository
         self.user_repository = user_repository
+        self.publisher = publisher
 
     def create_task(self, description: str, status: TaskStatus, user_id: int) -> Task:
-        """Create a new task."""
-        # Validate user exists
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
+        """Create a new task.
 
-        # Create task
+        User existence is enforced by the tasks.user_id foreign key.
+        """
         now = datetime.now(UTC)
         task = Task(
             id=None,
@@ -31,39 +59,77 @@ class TaskService:
             created_at=now,
             updated_at=now,
         )
-        return self.task_repository.create(task)
+        created = self.task_repository.create(task)
+        self._publish([TaskEvent(TaskEventType.CREATED, created.id, created)])
+        return created
 
     def update_task(self, task_id: int, description: str, status: TaskStatus, user_id: int) -> Task:
-        """Update an existing task."""
-        # Get existing task
-        existing_task = self.task_repository.get_by_id(task_id)
-        if not existing_task:
-            raise ValueError(f"Task with id {task_id} not found")
+        """Update an existing task.
 
-        # Validate new user exists
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
-
-        # Update task
-        updated_task = Task(
-            id=task_id,
+        User existence is enforced by the tasks.user_id foreign key.
+        """
+        changes = TaskUpdate(
             description=description,
             status=status,
             user_id=user_id,
-            created_at=existing_task.created_at,
             updated_at=datetime.now(UTC),
         )
-        return self.task_repository.update(updated_task)
+        updated_task = self.task_repository.update(task_id, changes)
+        if not updated_task:
+            raise ValueError(f"Task with id {task_id} not found")
+        self._publish([TaskEvent(TaskEventType.UPDATED, updated_task.id, updated_task)])
+        return updated_task
 
     def delete_task(self, task_id: int) -> bool:
         """Delete a task."""
-        # Check if task exists
-        existing_task = self.task_repository.get_by_id(task_id)
-        if not existing_task:
+        if not self.task_repository.delete(task_id):
             raise ValueError(f"Task with id {task_id} not found")
-
-        return self.task_repository.delete(task_id)
+        self._publish([TaskEvent(TaskEventType.DELETED, task_id)])
+        return True
+
+    def create_tasks(self, items: Sequence[TaskFields]) -> list[BulkItemResult]:
+        """Create several tasks in one transaction.
+
+        Every item is validated and all referenced users are resolved before
+        anything is written; invalid items are reported and skipped.
+        """
+        results, pending = bulk.validate_new_tasks(items, datetime.now(UTC))
+        pending = bulk.drop_unknown_users(pending, self._known_user_ids(pending), results)
+        created = self.task_repository.create_many([task for _, _, task in pending]) if pending else []
+        self._publish([TaskEvent(TaskEventType.CREATED, task.id, task) for task in created])
+        return bulk.collect_created(pending, created, results, len(items))
+
+    def update_tasks(self, items: Sequence[tuple[int, TaskFields]]) -> list[BulkItemResult]:
+        """Update several tasks in one transaction.
+
+        Every item is validated and all referenced users are resolved before
+        anything is written; invalid items are reported and skipped.
+        """
+        results, pending = bulk.validate_task_updates(items, datetime.now(UTC))
+        pending = bulk.drop_unknown_users(pending, self._known_user_ids(pending), results)
+        changes = {task_id: change for _, task_id, change in pending}
+        updated = self.task_repository.update_many(changes) if changes else []
+        self._publish([TaskEvent(TaskEventType.UPDATED, task.id, task) for task in updated])
+        return bulk.collect_updated(pending, updated, results, len(items))
+
+    def delete_tasks(self, task_ids: Sequence[int]) -> list[BulkItemResult]:
+        """Delete several tasks in one transaction."""
+        unique_ids = bulk.unique_ids(task_ids)
+        deleted = self.task_repository.delete_many(unique_ids) if unique_ids else set()
+        self._publish([TaskEvent(TaskEventType.DELETED, task_id) for task_id in sorted(deleted)])
+        return bulk.collect_deleted(task_ids, deleted)
+
+    def _publish(self, events: list[TaskEvent]) -> None:
+        """Publish committed changes, if a publisher is attached."""
+        if self.publisher is not None and events:
+            self.publisher.publish(events)
+
+    def _known_user_ids(self, pending: bulk.Pending) -> set[int]:
+        """Resolve which users referenced by pending items exist, with one query."""
+        user_ids = bulk.referenced_user_ids(pending)
+        if not user_ids:
+            return set()
+        return {user.id for user in self.user_repository.get_by_ids(user_ids)}
 
     def get_tasks_by_user(self, user_id: int) -> list[Task]:
         """Get all tasks for a user."""
@@ -78,6 +144,71 @@ class TaskService:
         """Get all tasks."""
         return self.task_repository.get_all()
 
+    def find_tasks(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query."""
+        return self.task_repository.find(query)
+
+    def get_tasks_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get a page of tasks matching a query, starting after the given cursor."""
+        return self.task_repository.get_page(limit, cursor, query)
+
+    def find_task_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, for listing."""
+        return self.task_repository.find_rows(query)
+
+    def get_task_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows matching a query, starting after the given cursor."""
+        return self.task_repository.get_rows_page(limit, cursor, query)
+
+    def search_tasks(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of the rows of tasks whose description contains every term of `text`, most relevant first."""
+        return self.task_repository.search(text, limit, cursor, query)
+
+    def get_task_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get the tasks written and deleted since a sync token, or every task without one.
+
+        Raises SyncTokenExpiredError if the token is older than the tombstone retention.
+        """
+        return self.task_repository.get_changes(since)
+
+    def compact_tombstones(self, retention: timedelta) -> int:
+        """Drop the tombstones of deletions older than the retention window, returning how many."""
+        return self.task_repository.purge_tombstones(datetime.now(UTC) - retention)
+
+    def archive_done_tasks(self, age: timedelta, batch_size: int) -> int:
+        """Move DONE tasks not updated for `age` to the archive, batch_size per transaction; return how many.
+
+        Archived tasks are published as deleted: they leave the board.
+        """
+        before = datetime.now(UTC) - age
+        archived = 0
+        while True:
+            task_ids = self.task_repository.archive(before, batch_size)
+            self._publish([TaskEvent(TaskEventType.DELETED, task_id) for task_id in sorted(task_ids)])
+            archived += len(task_ids)
+            if len(task_ids) < batch_size:
+                return archived
+
+    def get_board_summary(self) -> BoardSummary:
+        """Get task counts per user and per status, from the maintained counters."""
+        return BoardSummary.from_counts(self.task_repository.get_counts())
+
+    def rebuild_board_counts(self) -> int:
+        """Recompute the board counters from the tasks, returning how many (user, status) pairs were found."""
+        return self.task_repository.rebuild_counts()
+
+    def get_tasks_watermark(self) -> TableWatermark:
+        """Get a cheap summary of the tasks table that changes whenever its rows do."""
+        return self.task_repository.get_watermark()
+
+    def stream_tasks(self, query: TaskQuery, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[TaskRow]:
+        """Iterate over the rows of all tasks matching a query without loading them all at once."""
+        return self.task_repository.stream(query, batch_size)
+
     def get_task_by_id(self, task_id: int) -> Task:
         """Get a task by id."""
         task = self.task_repository.get_by_id(task_id)
@@ -1,8 +1,12 @@
 """User service (business logic)."""
 
-from domain.models import User
+from collections.abc import Iterator
+
+from domain.models import TableWatermark, User, UserRow
 from domain.ports import UserRepository
 
+from .task_service import STREAM_BATCH_SIZE
+
 
 class UserService:
     """User service."""
@@ -15,6 +19,18 @@ class UserService:
         """Get all users."""
         return self.user_repository.get_all()
 
+    def get_all_user_rows(self) -> list[UserRow]:
+        """Get the rows of all users, for listing."""
+        return self.user_repository.get_all_rows()
+
+    def get_users_watermark(self) -> TableWatermark:
+        """Get a cheap summary of the users table that changes whenever its rows do."""
+        return self.user_repository.get_watermark()
+
+    def stream_users(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[UserRow]:
+        """Iterate over the rows of all users without loading them all at once."""
+        return self.user_repository.stream(batch_size)
+
     def get_user_by_id(self, user_id: int) -> User:
         """Get a user by id."""
         user = self.user_repository.get_by_id(user_id)
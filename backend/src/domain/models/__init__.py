@@ -1,6 +1,38 @@
 """Domain models."""
 
-from .task import Task, TaskStatus
+from .board import BoardSummary, TaskCount
+from .bulk import BulkItemResult, TaskFields
+from .events import TaskEvent, TaskEventType
+from .pagination import SearchCursor, TaskCursor, TaskPage, TaskRowPage, TaskSearchPage
+from .rows import TaskRow, UserRow
+from .sync import SyncToken, SyncTokenExpiredError, TaskChanges
+from .task import Task, TaskStatus, TaskUpdate
+from .task_query import TaskQuery, TaskSortOrder
 from .user import User
+from .watermark import TableWatermark
 
-__all__ = ["Task", "TaskStatus", "User"]
+__all__ = [
+    "BoardSummary",
+    "BulkItemResult",
+    "SearchCursor",
+    "SyncToken",
+    "SyncTokenExpiredError",
+    "TableWatermark",
+    "Task",
+    "TaskChanges",
+    "TaskCount",
+    "TaskCursor",
+    "TaskEvent",
+    "TaskEventType",
+    "TaskFields",
+    "TaskPage",
+    "TaskQuery",
+    "TaskRow",
+    "TaskRowPage",
+    "TaskSearchPage",
+    "TaskSortOrder",
+    "TaskStatus",
+    "TaskUpdate",
+    "User",
+    "UserRow",
+]
@@ -0,0 +1,46 @@
+"""Board summary value objects."""
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .task import TaskStatus
+
+
+class TaskCount(NamedTuple):
+    """Number of tasks a user has in one status."""
+
+    user_id: int
+    status: TaskStatus
+    count: int
+
+
+@dataclass(frozen=True)
+class BoardSummary:
+    """Task counts per user and per status.
+
+    Users without tasks are left out; every listed user has an entry for every status.
+    """
+
+    by_user: dict[int, dict[TaskStatus, int]]
+
+    @classmethod
+    def from_counts(cls, counts: list[TaskCount]) -> "BoardSummary":
+        """Build a summary from per-(user, status) counts, dropping users whose counts are all zero."""
+        by_user: dict[int, dict[TaskStatus, int]] = {}
+        for user_id, status, count in counts:
+            by_user.setdefault(user_id, dict.fromkeys(TaskStatus, 0))[status] = count
+        return cls(by_user={user_id: c for user_id, c in sorted(by_user.items()) if any(c.values())})
+
+    @property
+    def by_status(self) -> dict[TaskStatus, int]:
+        """Task counts per status across all users."""
+        totals = dict.fromkeys(TaskStatus, 0)
+        for counts in self.by_user.values():
+            for status, count in counts.items():
+                totals[status] += count
+        return totals
+
+    @property
+    def total(self) -> int:
+        """Number of tasks on the board."""
+        return sum(self.by_status.values())
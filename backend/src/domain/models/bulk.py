@@ -0,0 +1,29 @@
+"""Bulk operation value objects."""
+
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from .task import Task, TaskStatus
+
+
+class TaskFields(NamedTuple):
+    """Unvalidated client-supplied fields of a task in a bulk request."""
+
+    description: str
+    status: TaskStatus
+    user_id: int
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of one item of a bulk operation, by its position in the request."""
+
+    index: int
+    task_id: int | None = None
+    task: Task | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
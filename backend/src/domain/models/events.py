@@ -0,0 +1,23 @@
+"""Task change events."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from .task import Task
+
+
+class TaskEventType(str, Enum):
+    """Kind of committed task change."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """A committed task change; deletions carry no task."""
+
+    type: TaskEventType
+    task_id: int
+    task: Task | None = None
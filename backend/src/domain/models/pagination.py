@@ -0,0 +1,83 @@
+"""Pagination value objects."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from .rows import TaskRow
+from .task import Task
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    """Position of the last task of a page as (sort key, id).
+
+    The sort key is the timestamp the listing is ordered by (created_at by default).
+    """
+
+    sort_key: datetime
+    id: int
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque, URL-safe token."""
+        raw = f"{self.sort_key.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TaskCursor":
+        """Decode a token produced by encode()."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            sort_key, task_id = raw.rsplit("|", 1)
+            return cls(sort_key=datetime.fromisoformat(sort_key), id=int(task_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """Position of the last result of a search page as (relevance score, id)."""
+
+    score: float
+    id: int
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque, URL-safe token."""
+        # repr() round-trips floats exactly, so the next page resumes at the same score
+        raw = f"{self.score!r}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+        """Decode a token produced by encode()."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            score, task_id = raw.rsplit("|", 1)
+            return cls(score=float(score), id=int(task_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+
+@dataclass
+class TaskPage:
+    """A page of tasks and the cursor to fetch the next one."""
+
+    items: list[Task]
+    next_cursor: TaskCursor | None
+
+
+@dataclass
+class TaskRowPage:
+    """A page of task rows and the cursor to fetch the next one."""
+
+    items: list[TaskRow]
+    next_cursor: TaskCursor | None
+
+
+@dataclass
+class TaskSearchPage:
+    """A page of task rows, most relevant first, and the cursor to fetch the next one."""
+
+    items: list[TaskRow]
+    next_cursor: SearchCursor | None
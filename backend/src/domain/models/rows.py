@@ -0,0 +1,31 @@
+"""Read models: flat rows for high-throughput listings.
+
+Rows skip entity construction and validation; they carry exactly the fields
+a listing returns. Repositories may return any tuple-like row exposing these
+fields by position and by name (a SQLAlchemy Row qualifies).
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+
+from .task import TaskStatus
+
+
+class TaskRow(NamedTuple):
+    """A task as listed by the API."""
+
+    id: int
+    description: str
+    status: TaskStatus
+    user_id: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserRow(NamedTuple):
+    """A user as listed by the API."""
+
+    id: int
+    first_name: str
+    last_name: str
+    created_at: datetime
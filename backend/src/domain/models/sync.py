@@ -0,0 +1,51 @@
+"""Delta sync value objects."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+
+from .rows import TaskRow
+
+
+class SyncTokenExpiredError(ValueError):
+    """A sync token predates the retained tombstones; the client must resync from scratch."""
+
+
+@dataclass(frozen=True)
+class SyncToken:
+    """Position in the task change sequence a client has synced up to.
+
+    Every task write takes the next value of a monotonic sequence, stamped on
+    the rows it writes and on the tombstones of the rows it deletes.
+    """
+
+    seq: int
+
+    def encode(self) -> str:
+        """Encode the token as an opaque, URL-safe string."""
+        return base64.urlsafe_b64encode(f"seq|{self.seq}".encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncToken":
+        """Decode a token produced by encode()."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            prefix, seq = raw.split("|")
+            if prefix != "seq" or int(seq) < 0:
+                raise ValueError(raw)
+            return cls(seq=int(seq))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid sync token") from e
+
+
+@dataclass
+class TaskChanges:
+    """Tasks written and ids deleted after a sync token, up to the returned one.
+
+    Clients apply deleted_ids first, then upsert changed rows, then keep
+    token for the next request.
+    """
+
+    changed: list[TaskRow]
+    deleted_ids: list[int]
+    token: SyncToken
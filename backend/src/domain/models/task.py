@@ -13,9 +13,25 @@ class TaskStatus(str, Enum):
     DONE = "DONE"
 
 
-@dataclass
+def _validate_task_fields(description: str, status: TaskStatus, user_id: int) -> None:
+    """Validate the client-editable fields of a task."""
+    if not description or not description.strip():
+        raise ValueError("Task description cannot be empty")
+    if len(description) > 500:
+        raise ValueError("Task description cannot exceed 500 characters")
+    if user_id is None or user_id <= 0:
+        raise ValueError("Valid user_id is required")
+    if not isinstance(status, TaskStatus):
+        raise ValueError(f"Status must be one of {[s.value for s in TaskStatus]}")
+
+
+@dataclass(slots=True)
 class Task:
-    """Task domain entity."""
+    """Task domain entity.
+
+    The constructor validates its input; repositories hydrate stored tasks,
+    which already passed the table's CHECK constraints, with from_trusted().
+    """
 
     id: int | None
     description: str
@@ -26,11 +42,42 @@ class Task:
 
     def __post_init__(self):
         """Validate task data."""
-        if not self.description or not self.description.strip():
-            raise ValueError("Task description cannot be empty")
-        if len(self.description) > 500:
-            raise ValueError("Task description cannot exceed 500 characters")
-        if self.user_id is None or self.user_id <= 0:
-            raise ValueError("Valid user_id is required")
-        if not isinstance(self.status, TaskStatus):
-            raise ValueError(f"Status must be one of {[s.value for s in TaskStatus]}")
+        _validate_task_fields(self.description, self.status, self.user_id)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: int,
+        description: str,
+        status: TaskStatus,
+        user_id: int,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "Task":
+        """Build a task from stored data without re-validating it.
+
+        Only for hydrating rows read from the database; client input must go
+        through the constructor.
+        """
+        task = object.__new__(cls)
+        task.id = id
+        task.description = description
+        task.status = status
+        task.user_id = user_id
+        task.created_at = created_at
+        task.updated_at = updated_at
+        return task
+
+
+@dataclass(frozen=True, slots=True)
+class TaskUpdate:
+    """Changes applied to an existing task."""
+
+    description: str
+    status: TaskStatus
+    user_id: int
+    updated_at: datetime
+
+    def __post_init__(self):
+        """Validate task changes."""
+        _validate_task_fields(self.description, self.status, self.user_id)
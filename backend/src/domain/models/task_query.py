@@ -0,0 +1,45 @@
+"""Task query value objects."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from .task import TaskStatus
+
+
+class TaskSortOrder(str, Enum):
+    """Task listing sort order; a leading '-' means descending."""
+
+    CREATED_ASC = "created_at"
+    CREATED_DESC = "-created_at"
+    UPDATED_ASC = "updated_at"
+    UPDATED_DESC = "-updated_at"
+
+    @property
+    def field(self) -> str:
+        """Name of the timestamp field the order sorts on."""
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        """Whether the order is descending."""
+        return self.value.startswith("-")
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """Filters and sort order for task listings.
+
+    Empty sets and None bounds mean "no filter". Lower bounds are inclusive,
+    upper bounds are exclusive. Listings cover the active tasks only unless
+    include_archived also asks for the archived ones.
+    """
+
+    user_ids: frozenset[int] = frozenset()
+    statuses: frozenset[TaskStatus] = frozenset()
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+    updated_before: datetime | None = None
+    sort: TaskSortOrder = TaskSortOrder.CREATED_ASC
+    include_archived: bool = False
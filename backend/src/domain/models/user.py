@@ -4,10 +4,16 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 
+_EMAIL_PATTERN = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
-    """User domain entity."""
+    """User domain entity.
+
+    The constructor validates its input; repositories hydrate stored users,
+    which already passed the table's constraints, with from_trusted().
+    """
 
     id: int | None
     first_name: str
@@ -27,8 +33,31 @@ class User:
         if not self._is_valid_email(self.email):
             raise ValueError("Invalid email format")
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id: int,
+        first_name: str,
+        last_name: str,
+        email: str,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "User":
+        """Build a user from stored data without re-validating it.
+
+        Only for hydrating rows read from the database; client input must go
+        through the constructor.
+        """
+        user = object.__new__(cls)
+        user.id = id
+        user.first_name = first_name
+        user.last_name = last_name
+        user.email = email
+        user.created_at = created_at
+        user.updated_at = updated_at
+        return user
+
     @staticmethod
     def _is_valid_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
-        return bool(re.match(pattern, email))
+        return _EMAIL_PATTERN.match(email) is not None
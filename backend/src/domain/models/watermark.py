@@ -0,0 +1,15 @@
+"""Table watermark value object."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TableWatermark:
+    """Cheap summary of a table's state that changes whenever its rows do.
+
+    It is the value of the table's change counter, which every write bumps in
+    its own transaction, so it moves on each insert, update, delete and archive
+    whatever the writers' clocks say.
+    """
+
+    version: int
@@ -1,6 +1,9 @@
 """Repository ports (interfaces)."""
 
+from .async_task_repository import AsyncTaskRepository
+from .async_user_repository import AsyncUserRepository
+from .task_event_publisher import TaskEventPublisher
 from .task_repository import TaskRepository
 from .user_repository import UserRepository
 
-__all__ = ["TaskRepository", "UserRepository"]
+__all__ = ["AsyncTaskRepository", "AsyncUserRepository", "TaskEventPublisher", "TaskRepository", "UserRepository"]
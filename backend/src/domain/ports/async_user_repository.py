@@ -0,0 +1,50 @@
+"""Async user repository port (interface)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from domain.models import TableWatermark, User, UserRow
+
+
+class AsyncUserRepository(ABC):
+    """Abstract async user repository interface, mirroring UserRepository."""
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> User | None:
+        """Get a user by id."""
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids; missing ids are skipped."""
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, first_name: str, last_name: str) -> User | None:
+        """Get a user by first and last name."""
+        pass
+
+    @abstractmethod
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> list[User]:
+        """Get all users."""
+        pass
+
+    @abstractmethod
+    async def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users."""
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int) -> AsyncIterator[UserRow]:
+        """Iterate over the rows of all users, fetching batch_size rows at a time."""
+        pass
+
+    @abstractmethod
+    async def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the users table, which moves on every write to it."""
+        pass
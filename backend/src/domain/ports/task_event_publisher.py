@@ -0,0 +1,19 @@
+"""Task event publisher port (interface)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from domain.models import TaskEvent
+
+
+class TaskEventPublisher(ABC):
+    """Abstract sink for committed task changes.
+
+    publish() must not block: it is called from request handlers, by sync
+    and async services alike, after the change is committed.
+    """
+
+    @abstractmethod
+    def publish(self, events: Sequence[TaskEvent]) -> None:
+        """Publish task events, in commit order."""
+        pass
@@ -1,8 +1,24 @@
 """Task repository port (interface)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 
-from domain.models import Task
+from domain.models import (
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCount,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskUpdate,
+)
 
 
 class TaskRepository(ABC):
@@ -10,17 +26,46 @@ class TaskRepository(ABC):
 
     @abstractmethod
     def create(self, task: Task) -> Task:
-        """Create a new task."""
+        """Create a new task.
+
+        Raises ValueError if the task's user does not exist.
+        """
         pass
 
     @abstractmethod
-    def update(self, task: Task) -> Task:
-        """Update an existing task."""
+    def update(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        """Apply changes to an existing task.
+
+        Returns the updated task, or None if no task has that id.
+        Raises ValueError if the new user does not exist.
+        """
         pass
 
     @abstractmethod
     def delete(self, task_id: int) -> bool:
-        """Delete a task by id."""
+        """Delete a task by id, returning whether it existed."""
+        pass
+
+    @abstractmethod
+    def create_many(self, tasks: list[Task]) -> list[Task]:
+        """Create several tasks in one transaction, returning them in input order.
+
+        Raises ValueError if any task's user does not exist; nothing is created then.
+        """
+        pass
+
+    @abstractmethod
+    def update_many(self, changes: dict[int, TaskUpdate]) -> list[Task]:
+        """Apply changes keyed by task id in one transaction.
+
+        Returns the updated tasks; ids with no matching task are skipped.
+        Raises ValueError if any new user does not exist; nothing is updated then.
+        """
+        pass
+
+    @abstractmethod
+    def delete_many(self, task_ids: list[int]) -> set[int]:
+        """Delete several tasks in one transaction, returning the ids that existed."""
         pass
 
     @abstractmethod
@@ -37,3 +82,80 @@ class TaskRepository(ABC):
     def get_all(self) -> list[Task]:
         """Get all tasks."""
         pass
+
+    @abstractmethod
+    def find(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query, in the query's sort order."""
+        pass
+
+    @abstractmethod
+    def get_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get up to `limit` tasks matching `query`, starting after `cursor`."""
+        pass
+
+    @abstractmethod
+    def find_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, in the query's sort order."""
+        pass
+
+    @abstractmethod
+    def get_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows; same semantics as get_page()."""
+        pass
+
+    @abstractmethod
+    def stream(self, query: TaskQuery, batch_size: int) -> Iterator[TaskRow]:
+        """Iterate over the rows of all tasks matching a query, fetching batch_size rows at a time."""
+        pass
+
+    @abstractmethod
+    def search(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of the rows of tasks whose description matches `text`, most relevant first.
+
+        Matching is case-insensitive and every term must occur in the description,
+        served by a full-text index. The filters of `query` apply; its sort order does not.
+        """
+        pass
+
+    @abstractmethod
+    def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the tasks table, which moves on every write to it."""
+        pass
+
+    @abstractmethod
+    def get_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get the rows of tasks written and the ids of tasks deleted after `since`.
+
+        With no token, every task is returned. Costs are proportional to the
+        number of changes, not to the table size.
+        Raises SyncTokenExpiredError if tombstones after `since` were compacted.
+        """
+        pass
+
+    @abstractmethod
+    def purge_tombstones(self, before: datetime) -> int:
+        """Compact the tombstones of tasks deleted before a cutoff, returning how many were removed."""
+        pass
+
+    @abstractmethod
+    def archive(self, before: datetime, limit: int) -> set[int]:
+        """Move up to `limit` DONE tasks last updated before a cutoff to the archive; return their ids.
+
+        Archived tasks leave the active listings, lookups and counts. Delta sync
+        reports them as deleted; listings with include_archived still return them.
+        """
+        pass
+
+    @abstractmethod
+    def get_counts(self) -> list[TaskCount]:
+        """Get the maintained task counts per (user, status), without scanning tasks."""
+        pass
+
+    @abstractmethod
+    def rebuild_counts(self) -> int:
+        """Recompute the task counts from the tasks table, returning how many (user, status) pairs were found."""
+        pass
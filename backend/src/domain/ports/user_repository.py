@@ -1,8 +1,9 @@
 """User repository port (interface)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
-from domain.models import User
+from domain.models import TableWatermark, User, UserRow
 
 
 class UserRepository(ABC):
@@ -13,6 +14,11 @@ class UserRepository(ABC):
         """Get a user by id."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids; missing ids are skipped."""
+        pass
+
     @abstractmethod
     def get_by_name(self, first_name: str, last_name: str) -> User | None:
         """Get a user by first and last name."""
@@ -27,3 +33,18 @@ class UserRepository(ABC):
     def get_all(self) -> list[User]:
         """Get all users."""
         pass
+
+    @abstractmethod
+    def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users."""
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int) -> Iterator[UserRow]:
+        """Iterate over the rows of all users, fetching batch_size rows at a time."""
+        pass
+
+    @abstractmethod
+    def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the users table, which moves on every write to it."""
+        pass
@@ -0,0 +1,15 @@
+"""Caching module."""
+
+from .backend import MISSING, CacheBackend, CacheStats, LRUCacheBackend
+from .read_through import aread_through, get_cache, read_through, revalidate
+
+__all__ = [
+    "MISSING",
+    "CacheBackend",
+    "CacheStats",
+    "LRUCacheBackend",
+    "aread_through",
+    "get_cache",
+    "read_through",
+    "revalidate",
+]
@@ -0,0 +1,192 @@
+"""Cache backends for the caching repositories."""
+
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, fields, is_dataclass
+
+# Returned by CacheBackend.get() for keys that are not cached
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a cache backend since it was created."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+
+class CacheBackend(ABC):
+    """Abstract cache backend.
+
+    Keys are tuples whose first element is a namespace ("tasks", "users");
+    invalidating a namespace drops all of its entries at once. Every namespace
+    has a generation that invalidate() bumps: a value loaded before a write is
+    only stored if no invalidation happened in between, so a slow read cannot
+    re-cache data the write made stale.
+    """
+
+    @abstractmethod
+    def get(self, key: tuple) -> object:
+        """Get a cached value, or MISSING."""
+        pass
+
+    @abstractmethod
+    def set(self, key: tuple, value: object, generation: int) -> None:
+        """Cache a value loaded at the given generation of its namespace."""
+        pass
+
+    @abstractmethod
+    def generation(self, namespace: Hashable) -> int:
+        """Current generation of a namespace."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, namespace: Hashable) -> None:
+        """Drop every entry of a namespace and bump its generation."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Get the backend's counters."""
+        pass
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU cache with a per-entry TTL and entry count and memory bounds.
+
+    Thread-safe; sizes are estimated with estimate_size().
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 2**20,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty cache with the given bounds."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, value), least recently used first
+        self._entries: OrderedDict[tuple, tuple[float, int, object]] = OrderedDict()
+        self._namespaces: dict[Hashable, set[tuple]] = {}
+        self._generations: dict[Hashable, int] = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: tuple) -> object:
+        """Get a cached value, or MISSING; expired entries count as misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISSING
+            if entry[0] <= self.clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def set(self, key: tuple, value: object, generation: int) -> None:
+        """Cache a value, evicting least recently used entries to stay within bounds."""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self.clock() + self.ttl_seconds, size, value)
+            self._namespaces.setdefault(key[0], set()).add(key)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def generation(self, namespace: Hashable) -> int:
+        """Current generation of a namespace."""
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def invalidate(self, namespace: Hashable) -> None:
+        """Drop every entry of a namespace and bump its generation."""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for key in self._namespaces.pop(namespace, set()):
+                _, size, _ = self._entries.pop(key)
+                self._size -= size
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry; generations keep counting."""
+        with self._lock:
+            for namespace in self._namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._entries.clear()
+            self._namespaces.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        """Get the backend's counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+
+    def _remove(self, key: tuple) -> None:
+        """Remove an entry (lock held)."""
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+        keys = self._namespaces[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._namespaces[key[0]]
+
+
+def estimate_size(value: object) -> int:
+    """Estimate the memory held by a cached value, in bytes.
+
+    Lists are costed from their first item, since cached lists hold rows or
+    entities of one shape; rows and dataclasses sum their fields.
+    """
+    if isinstance(value, list):
+        if not value:
+            return sys.getsizeof(value)
+        return sys.getsizeof(value) + len(value) * estimate_size(value[0])
+    if is_dataclass(value):
+        return sys.getsizeof(value) + sum(estimate_size(getattr(value, f.name)) for f in fields(value))
+    if isinstance(value, Sequence) and not isinstance(value, str | bytes):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    return sys.getsizeof(value)
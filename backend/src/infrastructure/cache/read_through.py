@@ -0,0 +1,57 @@
+"""Read-through helpers shared by the caching repositories."""
+
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import TypeVar
+
+from infrastructure.config.settings import get_settings
+
+from .backend import MISSING, CacheBackend, LRUCacheBackend
+
+T = TypeVar("T")
+
+
+def read_through(cache: CacheBackend, key: tuple, load: Callable[[], T]) -> T:
+    """Return the cached value for key, loading and caching it on a miss."""
+    value = cache.get(key)
+    if value is MISSING:
+        generation = cache.generation(key[0])
+        value = load()
+        cache.set(key, value, generation)
+    return value
+
+
+async def aread_through(cache: CacheBackend, key: tuple, load: Callable[[], Awaitable[T]]) -> T:
+    """Async counterpart of read_through()."""
+    value = cache.get(key)
+    if value is MISSING:
+        generation = cache.generation(key[0])
+        value = await load()
+        cache.set(key, value, generation)
+    return value
+
+
+def revalidate(cache: CacheBackend, namespace: str, watermark: T) -> T:
+    """Drop a namespace's cached reads if its table watermark, just read from the database, has moved.
+
+    Watermarks are never served from the cache: a conditional-GET validator must reflect writes
+    made by every process, and a moved one means cached reads may predate them.
+    """
+    key = (namespace, "watermark")
+    if cache.get(key) != watermark:
+        cache.invalidate(namespace)
+        cache.set(key, watermark, cache.generation(namespace))
+    return watermark
+
+
+@lru_cache
+def get_cache() -> CacheBackend | None:
+    """Get the process-wide cache configured from settings, or None when caching is disabled."""
+    settings = get_settings()
+    if not settings.cache_active:
+        return None
+    return LRUCacheBackend(
+        max_entries=settings.cache_max_entries,
+        max_bytes=settings.cache_max_bytes,
+        ttl_seconds=settings.cache_ttl_seconds,
+    )
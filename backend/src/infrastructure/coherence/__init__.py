@@ -0,0 +1,5 @@
+"""Cross-process coherence module."""
+
+from .poller import ChangePoller
+
+__all__ = ["ChangePoller"]
@@ -0,0 +1,205 @@
+"""Change poller: keeps in-process state coherent with writes made by other processes.
+
+Every write bumps a counter in change_counters in its own transaction (see
+infrastructure.repositories.change_queries). The poller reads all counters in
+one small query and, for each namespace whose counter moved, invalidates the
+namespace in the local cache. When the tasks counter moves it also reads the
+delta since its last sync token and publishes it as task events, so the change
+feed of every worker carries every worker's writes.
+
+Writes are noticed within one poll interval. On PostgreSQL the poller can also
+LISTEN on the channel a counter trigger NOTIFYs, waking as soon as a write commits;
+if that connection fails it polls every interval while reopening it with backoff.
+With a read replica the counters are read from it, so the cache is invalidated
+once the replica it refills from has the write.
+"""
+
+import contextlib
+import logging
+import select
+import threading
+import time
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.models import SyncToken, SyncTokenExpiredError, TaskEvent, TaskEventType
+from domain.ports import TaskEventPublisher
+from infrastructure.cache import CacheBackend
+from infrastructure.database.routing import REPLICA_READ
+from infrastructure.repositories import SQLAlchemyTaskRepository, change_queries, task_queries
+
+logger = logging.getLogger(__name__)
+
+# Drivers whose connections can LISTEN for the counter trigger's notifications
+LISTEN_DRIVERS = ("psycopg2", "psycopg")
+
+# Backoff between attempts to reopen a failed LISTEN connection, doubling up to the maximum
+LISTEN_RETRY_SECONDS = 1.0
+LISTEN_RETRY_MAX_SECONDS = 60.0
+
+
+class ChangePoller:
+    """Tails change_counters on a background thread.
+
+    Cache namespaces are named after the counters ("tasks", "users").
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        cache: CacheBackend | None = None,
+        publisher: TaskEventPublisher | None = None,
+        interval_seconds: float = 1.0,
+        listen: bool = False,
+    ):
+        """Initialize with what to keep coherent and how often to look.
+
+        listen only takes effect on PostgreSQL with psycopg2 or psycopg 3.
+        """
+        self.session_factory = session_factory
+        self.cache = cache
+        self.publisher = publisher
+        self.interval_seconds = interval_seconds
+        self.listen = listen
+        self._seen: dict[str, int] = {}
+        self._token: SyncToken | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._listener = None
+        self._retry_seconds = LISTEN_RETRY_SECONDS
+        self._retry_at: float | None = None
+
+    def poll(self) -> set[str]:
+        """Read the counters once and react to those that moved; returns their names.
+
+        The first call only records where the counters stand.
+        """
+        with self.session_factory() as db:
+            counters = dict(db.execute(change_queries.select_counters(), bind_arguments=REPLICA_READ).all())
+            if not self._seen:
+                self._seen = counters
+                self._token = SyncToken(seq=counters.get(task_queries.SEQUENCE_NAME, 0))
+                return set()
+
+            moved = {name for name, value in counters.items() if value != self._seen.get(name)}
+            self._seen = counters
+            if self.cache is not None:
+                for name in moved:
+                    self.cache.invalidate(name)
+            if task_queries.SEQUENCE_NAME in moved and self.publisher is not None:
+                self._publish_task_changes(db)
+        return moved
+
+    def start(self) -> None:
+        """Record the current counters and start polling in a daemon thread."""
+        self.poll()
+        if self.listen:
+            self._listener = self._open_listener()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="change-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and release the listening connection."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 1)
+            self._thread = None
+        self._close_listener()
+
+    def _publish_task_changes(self, db: Session) -> None:
+        """Publish the task changes since the last token as events, deletions first."""
+        since = self._token
+        try:
+            changes = SQLAlchemyTaskRepository(db).get_changes(since)
+        except SyncTokenExpiredError:
+            # Fell behind the tombstone retention; skip ahead rather than replay
+            self._token = SyncToken(seq=self._seen[task_queries.SEQUENCE_NAME])
+            return
+        self._token = changes.token
+        events = [TaskEvent(TaskEventType.DELETED, task_id) for task_id in changes.deleted_ids]
+        # Tasks inserted after the last token were created since; the rest were updated
+        changed_ids = [row.id for row in changes.changed]
+        created = (
+            set(db.execute(task_queries.select_created_ids(changed_ids, since)).scalars()) if changed_ids else set()
+        )
+        for row in changes.changed:
+            event_type = TaskEventType.CREATED if row.id in created else TaskEventType.UPDATED
+            events.append(TaskEvent(event_type, row.id, task_queries.to_domain(row)))
+        if events:
+            self.publisher.publish(events)
+
+    def _run(self) -> None:
+        """Poll until stopped, waiting an interval (or a notification) between polls."""
+        while not self._stop.is_set():
+            try:
+                self._wait()
+            except Exception:
+                # The LISTEN connection is outside the pool and is not reopened for us
+                logger.exception("Change listener failed; polling every interval until it reopens")
+                self._close_listener()
+                self._schedule_reopen()
+            if self._stop.is_set():
+                break
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Change poll failed")
+
+    def _wait(self) -> None:
+        """Sleep for one interval, returning early on a NOTIFY when listening."""
+        if self._listener is None and self._retry_at is not None and time.monotonic() >= self._retry_at:
+            self._reopen_listener()
+        if self._listener is None:
+            self._stop.wait(self.interval_seconds)
+            return
+        readable, _, _ = select.select([self._listener], [], [], self.interval_seconds)
+        if not readable:
+            return
+        if isinstance(self._listener.notifies, list):
+            # psycopg2 collects notifications on poll()
+            self._listener.poll()
+            self._listener.notifies.clear()
+        else:
+            # psycopg 3 yields those already received
+            for _ in self._listener.notifies(timeout=0):
+                pass
+
+    def _reopen_listener(self) -> None:
+        """Try to reopen the LISTEN connection after a failure, backing off further if it fails again."""
+        try:
+            self._listener = self._open_listener()
+        except Exception:
+            self._retry_seconds = min(self._retry_seconds * 2, LISTEN_RETRY_MAX_SECONDS)
+            logger.warning("Reopening the change listener failed; retrying in %.0f s", self._retry_seconds)
+            self._schedule_reopen()
+            return
+        self._retry_seconds = LISTEN_RETRY_SECONDS
+        self._retry_at = None
+
+    def _schedule_reopen(self) -> None:
+        """Schedule the next attempt to reopen the LISTEN connection."""
+        self._retry_at = time.monotonic() + self._retry_seconds
+
+    def _close_listener(self) -> None:
+        """Close the LISTEN connection, if any; a broken one may fail to close cleanly."""
+        if self._listener is not None:
+            with contextlib.suppress(Exception):
+                self._listener.close()
+            self._listener = None
+
+    def _open_listener(self):
+        """Open a dedicated autocommit connection LISTENing on the counter channel, if supported."""
+        engine: Engine = self.session_factory.kw["bind"]
+        if engine.dialect.name != "postgresql" or engine.dialect.driver not in LISTEN_DRIVERS:
+            logger.info("Change notifications need PostgreSQL with psycopg2 or psycopg 3; polling only")
+            return None
+        # Detached from the pool: the connection is held for the life of the poller
+        pooled = engine.raw_connection()
+        connection = pooled.driver_connection
+        pooled.detach()
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {change_queries.NOTIFY_CHANNEL}")
+        return connection
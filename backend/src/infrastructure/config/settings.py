@@ -1,6 +1,7 @@
 """Application settings."""
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -16,11 +17,91 @@ class Settings(BaseSettings):
     postgres_host: str = "localhost"
     postgres_port: int = 5432
 
+    # Connection pool (PostgreSQL and file-based SQLite): connections kept open,
+    # extra connections allowed under load, how long a request waits for one
+    # before failing, and the age after which a connection is replaced.
+    # database_statement_timeout_ms (PostgreSQL, 0 = none) aborts slow statements.
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_recycle_seconds: int = 1800
+    database_statement_timeout_ms: int = 0
+    # PostgreSQL through psycopg 3 (postgresql+psycopg://...): a statement run
+    # this many times on a connection is prepared on the server, and its plan
+    # reused (0 = never, e.g. behind PgBouncer in transaction mode)
+    database_prepare_threshold: int = 5
+    # Pooled connections opened, and warmed up with a few cheap reads, at
+    # startup before the app reports ready (0 = open them on demand)
+    database_warmup_connections: int = 0
+    # Log every SQL statement
+    database_echo: bool = False
+
+    # Read replica: query-only repository reads (task and user lookups, listings,
+    # search, board summary) go to this URL when set; writes and reads that
+    # follow a write in the same request stay on the primary. For
+    # database_replica_max_lag_seconds after a write by this process, all reads
+    # go to the primary so clients do not read from behind their own writes.
+    database_replica_url: str | None = None
+    database_replica_max_lag_seconds: float = 1.0
+
+    # Async request path: serve the API through AsyncSession repositories on an
+    # async driver (asyncpg/aiosqlite). The URL defaults to database_url with
+    # its driver swapped.
+    async_database: bool = False
+    async_database_url: str | None = None
+
+    # Read-through cache of task and user reads (in-process LRU with TTL).
+    # Each process has its own cache, invalidated by its own writes; only
+    # coherence (below) tells it about writes by other workers and scripts,
+    # which it would otherwise serve stale for up to the TTL. Unset, the cache
+    # is therefore on only with coherence_enabled; set it to true to cache in
+    # a single-worker deployment without coherence.
+    cache_enabled: bool | None = None
+    cache_ttl_seconds: float = 30.0
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 64 * 2**20
+
+    # Delta sync: tombstones of deleted tasks are kept this long, so sync
+    # tokens older than the window must fall back to a full listing
+    tombstone_retention_days: int = 7
+
+    # Archival (scripts/archive_tasks.py): DONE tasks not updated for this many
+    # days move to tasks_archive, archive_batch_size per transaction. Listings
+    # read them only with include_archived=true.
+    archive_after_days: int = 90
+    archive_batch_size: int = 1000
+
+    # Change feed (GET /api/tasks/events): per-subscriber queue length before
+    # a slow client is dropped, and the keep-alive interval of idle streams
+    event_queue_size: int = 256
+    event_heartbeat_seconds: float = 15.0
+
+    # Cross-worker coherence: each process polls change_counters to invalidate
+    # its cache and feed its change feed with writes made by any process.
+    # coherence_listen wakes the poller on PostgreSQL NOTIFY between polls.
+    coherence_enabled: bool = False
+    coherence_poll_seconds: float = 1.0
+    coherence_listen: bool = True
+
+    # Request metrics (GET /metrics): per-route latency, status codes, requests
+    # in flight and per-request SQL statements, time and rows
+    metrics_enabled: bool = True
+
+    # Query budgets: check every request's SQL against the QueryBudget declared
+    # on its route and "warn" (log) or "raise" when it is exceeded. Meant for
+    # development and tests; "off" in production.
+    query_budget_mode: Literal["off", "warn", "raise"] = "off"
+
     # Application
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     debug: bool = True
 
+    @property
+    def cache_active(self) -> bool:
+        """Whether reads are cached: as cache_enabled says, or by default only when coherence is enabled."""
+        return self.coherence_enabled if self.cache_enabled is None else self.cache_enabled
+
     class Config:
         """Pydantic config."""
 
@@ -1,6 +1,61 @@
 """Database module."""
 
-from .base import Base, SessionLocal, engine, get_db
-from .models import TaskModel, UserModel
+from .async_base import (
+    create_async_database_engine,
+    get_async_db,
+    get_async_engine,
+    get_async_replica_router,
+    get_async_session_factory,
+    to_async_url,
+)
+from .base import (
+    Base,
+    create_database_engine,
+    engine_options,
+    get_db,
+    get_engine,
+    get_replica_router,
+    get_session_factory,
+)
+from .bulk_load import bulk_insert, deferred_search_index, supports_copy, sync_id_sequence
+from .health import DatabaseHealth, acheck_database, check_database, pool_stats
+from .models import TaskArchiveModel, TaskModel, UserModel
+from .pool import MonitoredAsyncAdaptedQueuePool, MonitoredQueuePool, PoolMonitor, PoolStats
+from .routing import REPLICA_READ, ReplicaRouter, RoutingSession
+from .warmup import awarm_up, warm_up
 
-__all__ = ["Base", "engine", "get_db", "SessionLocal", "TaskModel", "UserModel"]
+__all__ = [
+    "Base",
+    "get_engine",
+    "create_database_engine",
+    "engine_options",
+    "get_db",
+    "get_session_factory",
+    "TaskModel",
+    "TaskArchiveModel",
+    "UserModel",
+    "create_async_database_engine",
+    "get_async_db",
+    "get_async_engine",
+    "get_async_session_factory",
+    "to_async_url",
+    "DatabaseHealth",
+    "check_database",
+    "acheck_database",
+    "pool_stats",
+    "MonitoredQueuePool",
+    "MonitoredAsyncAdaptedQueuePool",
+    "PoolMonitor",
+    "PoolStats",
+    "get_replica_router",
+    "get_async_replica_router",
+    "REPLICA_READ",
+    "ReplicaRouter",
+    "RoutingSession",
+    "bulk_insert",
+    "deferred_search_index",
+    "supports_copy",
+    "sync_id_sequence",
+    "warm_up",
+    "awarm_up",
+]
@@ -0,0 +1,71 @@
+"""Async database configuration (AsyncSession on an async driver)."""
+
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from infrastructure.config.settings import get_settings
+
+from .base import enable_sqlite_foreign_keys, engine_options
+from .pool import MonitoredAsyncAdaptedQueuePool
+from .routing import ReplicaRouter, RoutingSession
+
+# Async driver used for each backend when the URL names a sync (or no) driver
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the driver of a database URL for its async counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def create_async_database_engine(url: str, **kwargs) -> AsyncEngine:
+    """Create an async engine, applying per-dialect connection setup."""
+    db_engine = create_async_engine(url, **kwargs)
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    return db_engine
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Get the process-wide async engine, created on first use."""
+    settings = get_settings()
+    url = settings.async_database_url or to_async_url(settings.database_url)
+    return create_async_database_engine(url, **engine_options(url, settings, MonitoredAsyncAdaptedQueuePool))
+
+
+@lru_cache
+def get_async_replica_router() -> ReplicaRouter | None:
+    """Get the router to the async engine of the read replica, if one is configured."""
+    settings = get_settings()
+    if not settings.database_replica_url:
+        return None
+    url = to_async_url(settings.database_replica_url)
+    replica = create_async_database_engine(url, **engine_options(url, settings, MonitoredAsyncAdaptedQueuePool))
+    # Sessions route on the sync side of AsyncSession, so the router holds the sync facade
+    return ReplicaRouter(replica.sync_engine, settings.database_replica_max_lag_seconds)
+
+
+@lru_cache
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory bound to the async engine, routing reads to the replica if configured."""
+    return async_sessionmaker(
+        get_async_engine(),
+        sync_session_class=RoutingSession,
+        router=get_async_replica_router(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db():
+    """Get async database session."""
+    async with get_async_session_factory()() as db:
+        yield db
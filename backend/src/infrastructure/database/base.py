@@ -1,21 +1,94 @@
-"""Database base configuration."""
+"""Database base configuration.
 
-from sqlalchemy import create_engine
+Nothing connects at import: the engines and the session factory are created on first use.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import Pool
+
+from infrastructure.config.settings import Settings, get_settings
+
+from .pool import MonitoredQueuePool, PoolMonitor
+from .routing import ReplicaRouter, RoutingSession
+
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Enforce foreign keys on SQLite, which leaves them off by default."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def create_database_engine(url: str, **kwargs) -> Engine:
+    """Create an engine, applying per-dialect connection setup."""
+    db_engine = create_engine(url, **kwargs)
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine, "connect", enable_sqlite_foreign_keys)
+    return db_engine
 
-from infrastructure.config.settings import get_settings
 
-settings = get_settings()
+def engine_options(url: str, settings: Settings, pool_class: type[Pool] = MonitoredQueuePool) -> dict:
+    """create_engine() arguments for the echo, pool, statement timeout and statement preparation in settings.
 
-# Create engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-)
+    The pool gets its own PoolMonitor (see health.pool_stats).
+    """
+    options = {"echo": settings.database_echo, "pool_pre_ping": True}
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # In-memory SQLite uses one connection per thread (or one in all); there is no pool to size
+        return options
+    options.update(
+        poolclass=pool_class,
+        monitor=PoolMonitor(),
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout_seconds,
+        pool_recycle=settings.database_pool_recycle_seconds,
+    )
+    if parsed.get_backend_name() == "postgresql":
+        connect_args = {}
+        if settings.database_statement_timeout_ms > 0:
+            connect_args.update(
+                statement_timeout_args(parsed.get_driver_name(), settings.database_statement_timeout_ms)
+            )
+        if parsed.get_driver_name() == "psycopg":
+            # psycopg 3 prepares a statement on the server once a connection has run it this many times
+            connect_args["prepare_threshold"] = settings.database_prepare_threshold or None
+        if connect_args:
+            options["connect_args"] = connect_args
+    return options
+
+
+def statement_timeout_args(driver: str, timeout_ms: int) -> dict:
+    """Connect arguments setting statement_timeout for every connection of a PostgreSQL driver."""
+    # Applied at connection startup, so no SET can be lost to a rolled-back transaction
+    if driver == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(timeout_ms)}}
+    return {"options": f"-c statement_timeout={timeout_ms}"}
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Get the process-wide engine, created on first use."""
+    settings = get_settings()
+    return create_database_engine(settings.database_url, **engine_options(settings.database_url, settings))
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter | None:
+    """Get the router to the engine of the read replica, if one is configured."""
+    settings = get_settings()
+    if not settings.database_replica_url:
+        return None
+    replica = create_database_engine(
+        settings.database_replica_url, **engine_options(settings.database_replica_url, settings)
+    )
+    return ReplicaRouter(replica, settings.database_replica_max_lag_seconds)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create declarative base
 Base = declarative_base()
@@ -23,8 +96,16 @@ Base = declarative_base()
 
 def get_db():
     """Get database session."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
+
+@lru_cache
+def get_session_factory() -> sessionmaker:
+    """Get the session factory, also for work that outlives the request-scoped session; created on first use."""
+    return sessionmaker(
+        class_=RoutingSession, router=get_replica_router(), autocommit=False, autoflush=False, bind=get_engine()
+    )
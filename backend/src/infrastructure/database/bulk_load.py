@@ -0,0 +1,121 @@
+"""Bulk loading of rows into a table: COPY on PostgreSQL, executemany elsewhere.
+
+Rows are consumed from an iterable in batches, each written and committed in
+its own transaction, so memory stays bounded however many rows there are.
+On psycopg2 and psycopg 3 a batch is sent as COPY ... FROM STDIN in text
+format; other drivers get one executemany INSERT per batch.
+
+On SQLite, indexing each inserted task for full-text search triples the cost
+of a load; deferred_search_index() indexes them all at once instead.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from io import StringIO
+from itertools import islice
+
+from sqlalchemy import Connection, Engine, Table, insert, text
+
+from .models import SQLITE_FTS_INSERT_TRIGGER
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# PostgreSQL drivers that bulk_insert() writes to with COPY
+COPY_DRIVERS = ("psycopg2", "psycopg")
+
+# Characters with a meaning in COPY text format, escaped with a backslash
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def supports_copy(engine: Engine) -> bool:
+    """Whether bulk_insert() writes to this engine with COPY."""
+    return engine.dialect.name == "postgresql" and engine.dialect.driver in COPY_DRIVERS
+
+
+def bulk_insert(
+    engine: Engine,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """Insert rows (tuples of `columns` values) batch_size at a time; return how many were inserted.
+
+    progress, if given, is called with the running total after each batch commits.
+    """
+    use_copy = supports_copy(engine)
+    rows = iter(rows)
+    loaded = 0
+    while batch := list(islice(rows, batch_size)):
+        with engine.begin() as conn:
+            if use_copy:
+                _copy(conn, table, columns, batch)
+            else:
+                conn.execute(insert(table), [dict(zip(columns, row, strict=True)) for row in batch])
+        loaded += len(batch)
+        if progress is not None:
+            progress(loaded)
+    return loaded
+
+
+@contextmanager
+def deferred_search_index(engine: Engine) -> Iterator[None]:
+    """On SQLite, leave tasks inserted in the block out of tasks_fts and rebuild it once on exit.
+
+    Nothing changes elsewhere: PostgreSQL computes the search vector of each row as it is copied.
+    """
+    if engine.dialect.name != "sqlite":
+        yield
+        return
+    with engine.begin() as conn:
+        conn.execute(text("DROP TRIGGER tasks_fts_insert"))
+    try:
+        yield
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(SQLITE_FTS_INSERT_TRIGGER))
+            conn.execute(text("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"))
+
+
+def sync_id_sequence(engine: Engine, table: Table) -> None:
+    """Move a PostgreSQL id sequence past rows inserted with explicit ids; nothing elsewhere."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), COALESCE(MAX(id), 0) + 1, false) "
+                f"FROM {table.name}"
+            )
+        )
+
+
+def copy_text(rows: Iterable[tuple]) -> str:
+    """Rows in COPY text format: tab-separated values, one row per line, NULL as \\N."""
+    return "".join("\t".join(_copy_value(value) for value in row) + "\n" for row in rows)
+
+
+def _copy_value(value) -> str:
+    """One value in COPY text format; enums are written by name, as the Enum column type stores them."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy(conn: Connection, table: Table, columns: Sequence[str], batch: list[tuple]) -> None:
+    """Write a batch with COPY ... FROM STDIN on the connection's psycopg2 or psycopg 3 cursor."""
+    quote = conn.dialect.identifier_preparer.quote
+    statement = f"COPY {quote(table.name)} ({', '.join(quote(column) for column in columns)}) FROM STDIN"
+    with conn.connection.cursor() as cursor:
+        if conn.dialect.driver == "psycopg2":
+            cursor.copy_expert(statement, StringIO(copy_text(batch)))
+        else:
+            with cursor.copy(statement) as copy:
+                copy.write(copy_text(batch))
@@ -0,0 +1,88 @@
+"""Database readiness probe: a timed round trip plus the state of the connection pool."""
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .pool import PoolStats
+
+
+@dataclass(frozen=True)
+class DatabaseHealth:
+    """Outcome of a readiness probe."""
+
+    ready: bool
+    # Time to get a connection from the pool, then to run SELECT 1 on it
+    checkout_ms: float | None
+    round_trip_ms: float | None
+    error: str | None
+    pool: PoolStats | None
+
+
+def pool_stats(engine: Engine) -> PoolStats | None:
+    """Stats of an engine's pool, if it is monitored."""
+    monitor = getattr(engine.pool, "monitor", None)
+    return monitor.stats(engine.pool) if monitor is not None else None
+
+
+def check_database(engine: Engine) -> DatabaseHealth:
+    """Probe the database through an engine.
+
+    An exhausted pool is reported from its stats rather than waited on for up to pool_timeout.
+    """
+    stats = pool_stats(engine)
+    if _exhausted(stats):
+        return _unavailable(_exhausted_error(stats), stats)
+    started = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            checked_out = time.perf_counter()
+            connection.execute(text("SELECT 1"))
+            finished = time.perf_counter()
+    except Exception as e:
+        return _unavailable(str(e), pool_stats(engine))
+    return _healthy(started, checked_out, finished, pool_stats(engine))
+
+
+async def acheck_database(engine: AsyncEngine) -> DatabaseHealth:
+    """Probe the database through an async engine, without waiting on an exhausted pool."""
+    stats = pool_stats(engine.sync_engine)
+    if _exhausted(stats):
+        return _unavailable(_exhausted_error(stats), stats)
+    started = time.perf_counter()
+    try:
+        async with engine.connect() as connection:
+            checked_out = time.perf_counter()
+            await connection.execute(text("SELECT 1"))
+            finished = time.perf_counter()
+    except Exception as e:
+        return _unavailable(str(e), pool_stats(engine.sync_engine))
+    return _healthy(started, checked_out, finished, pool_stats(engine.sync_engine))
+
+
+def _exhausted(stats: PoolStats | None) -> bool:
+    """Whether every connection the pool may open is checked out, so a checkout would wait."""
+    return stats is not None and stats.saturation is not None and stats.saturation >= 1
+
+
+def _exhausted_error(stats: PoolStats) -> str:
+    """Error of a probe that found the pool exhausted."""
+    return f"Connection pool exhausted: {stats.checked_out} of {stats.size + stats.max_overflow} checked out"
+
+
+def _unavailable(error: str, stats: PoolStats | None) -> DatabaseHealth:
+    """A failed probe."""
+    return DatabaseHealth(ready=False, checkout_ms=None, round_trip_ms=None, error=error, pool=stats)
+
+
+def _healthy(started: float, checked_out: float, finished: float, stats: PoolStats | None) -> DatabaseHealth:
+    """A successful probe from its timestamps."""
+    return DatabaseHealth(
+        ready=True,
+        checkout_ms=(checked_out - started) * 1000,
+        round_trip_ms=(finished - checked_out) * 1000,
+        error=None,
+        pool=stats,
+    )
@@ -1,6 +1,21 @@
 """SQLAlchemy database models."""
 
-from sqlalchemy import CheckConstraint, Column, DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    event,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from domain.models.task import TaskStatus
@@ -26,7 +41,10 @@ class UserModel(Base):
     __table_args__ = (
         CheckConstraint("LENGTH(TRIM(first_name)) > 0", name="check_first_name_not_empty"),
         CheckConstraint("LENGTH(TRIM(last_name)) > 0", name="check_last_name_not_empty"),
-        CheckConstraint("email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'", name="check_email_format"),
+        # Regex matching is PostgreSQL-only; other dialects rely on domain validation
+        CheckConstraint(
+            "email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'", name="check_email_format"
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -41,6 +59,10 @@ class TaskModel(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Value of the task change sequence at the last write (see ChangeCounterModel)
+    change_seq = Column(BigInteger, nullable=False, server_default="0", index=True)
+    # Value of the task change sequence when the task was inserted (0 if loaded directly)
+    created_seq = Column(BigInteger, nullable=False, server_default="0")
 
     # Relationship
     user = relationship("UserModel", back_populates="tasks")
@@ -49,4 +71,172 @@ class TaskModel(Base):
     __table_args__ = (
         CheckConstraint("LENGTH(TRIM(description)) > 0", name="check_description_not_empty"),
         CheckConstraint("LENGTH(description) <= 500", name="check_description_max_length"),
+        # Keyset pagination
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        # Filtered board views
+        Index("ix_tasks_user_id_status_created_at", "user_id", "status", "created_at"),
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        # Substring search (ILIKE '%...%'); needs the pg_trgm extension, created below
+        Index(
+            "ix_tasks_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
+
+
+# Full-text search indexes for tables created with metadata.create_all() (migration 010 for
+# PostgreSQL). PostgreSQL gets a generated tsvector column with a GIN index; SQLite gets an
+# external-content FTS5 table with the trigram tokenizer, kept in sync with tasks by triggers.
+SQLITE_FTS_INSERT_TRIGGER = (
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description); END"
+)
+event.listen(
+    TaskModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', description)) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)").execute_if(dialect="postgresql"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "description, content='tasks', content_rowid='id', tokenize='trigram')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL(SQLITE_FTS_INSERT_TRIGGER).execute_if(dialect="sqlite"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); END"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+        "INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description); END"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    TaskModel.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+)
+
+
+class TaskArchiveModel(Base):
+    """DONE task moved out of tasks by the archival job (see scripts/archive_tasks.py).
+
+    Keeps the task's id and columns, so listings can read both tables as one.
+    """
+
+    __tablename__ = "tasks_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    description = Column(Text, nullable=False)
+    status = Column(Enum(TaskStatus), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False, index=True)
+
+    __table_args__ = (
+        # Keyset pagination of listings that include archived tasks
+        Index("ix_tasks_archive_created_at_id", "created_at", "id"),
+        Index("ix_tasks_archive_updated_at_id", "updated_at", "id"),
+    )
+
+
+class ChangeCounterModel(Base):
+    """Named monotonic counters, one per namespace ("tasks", "users").
+
+    Each write transaction increments its namespace's counter first and
+    stamps the new value on what it writes; the row lock serializes writers,
+    so values become visible in commit order. Other processes tail the
+    counters to learn about writes.
+    """
+
+    __tablename__ = "change_counters"
+
+    name = Column(String(64), primary_key=True)
+    value = Column(BigInteger, nullable=False, server_default="0")
+    # Highest sequence value whose tombstones have been compacted away
+    compacted_through = Column(BigInteger, nullable=False, server_default="0")
+
+
+# Tables created with metadata.create_all() (rather than migrations) get the counter rows
+# and, on PostgreSQL, the trigger that NOTIFYs listeners whenever a counter moves
+event.listen(
+    ChangeCounterModel.__table__,
+    "after_create",
+    DDL("INSERT INTO change_counters (name, value, compacted_through) VALUES ('tasks', 0, 0), ('users', 0, 0)"),
+)
+event.listen(
+    ChangeCounterModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE OR REPLACE FUNCTION notify_change_counters() RETURNS trigger AS $$ "
+        "BEGIN PERFORM pg_notify('change_counters', NEW.name); RETURN NEW; END; "
+        "$$ LANGUAGE plpgsql"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    ChangeCounterModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER change_counters_notify AFTER UPDATE OF value ON change_counters "
+        "FOR EACH ROW EXECUTE FUNCTION notify_change_counters()"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class TaskTombstoneModel(Base):
+    """Record of a deleted task, kept for delta sync until compacted."""
+
+    __tablename__ = "task_tombstones"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=False)
+    change_seq = Column(BigInteger, nullable=False, index=True)
+    deleted_at = Column(DateTime, nullable=False, index=True)
+
+
+class TaskCountModel(Base):
+    """Number of tasks per (user, status), maintained by every task write.
+
+    Rows are upserted with signed deltas in the write's own transaction;
+    scripts/rebuild_task_counts.py recomputes them from tasks.
+    """
+
+    __tablename__ = "task_counts"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    status = Column(Enum(TaskStatus), nullable=False)
+    count = Column(BigInteger, nullable=False, server_default="0")
+
+    __table_args__ = (PrimaryKeyConstraint("user_id", "status"),)
@@ -0,0 +1,32 @@
+"""Pipeline mode for statements whose results are not read (psycopg 3 only).
+
+Inside pipelined(session), psycopg 3 queues the statements executed on the
+session's connection and sends them together, reading all their results in
+one round trip when the block exits. Only statements without RETURNING belong
+in the block: SQLAlchemy reads a statement's result description as soon as it
+executes it. An error in any of them is raised when the block exits, and the
+transaction must then be rolled back as usual.
+
+On every other driver the statements simply run one after the other.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy.orm import Session
+
+
+def supports_pipeline(driver: str) -> bool:
+    """Whether pipelined() batches round trips for this DBAPI driver."""
+    return driver == "psycopg"
+
+
+@contextmanager
+def pipelined(session: Session) -> Iterator[None]:
+    """Send the statements executed in the block in one round trip, on psycopg 3."""
+    connection = session.connection()
+    if not supports_pipeline(connection.dialect.driver):
+        yield
+        return
+    with connection.connection.driver_connection.pipeline():
+        yield
@@ -0,0 +1,204 @@
+"""Connection pool instrumentation.
+
+PoolMonitor listens to SQLAlchemy pool events to count checkouts and measure
+how long connections live. SQLAlchemy has no event before a checkout starts,
+so the time callers wait for a connection is measured by the Monitored* pool
+classes around Pool.connect(). Durations are kept in bounded windows, so
+percentiles describe recent traffic.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# QueuePool's default, which it does not expose once constructed
+DEFAULT_MAX_OVERFLOW = 10
+
+# Number of recent checkout waits and connection lifetimes kept for percentiles
+WINDOW_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """State of a connection pool and timings of its recent activity.
+
+    Capacity figures are None for pools without a fixed size (e.g. SQLite in memory).
+    """
+
+    size: int | None
+    max_overflow: int | None
+    checked_out: int | None
+    idle: int | None
+    # Checked-out connections over the most the pool can hand out (size + max_overflow)
+    saturation: float | None
+    checkouts: int
+    timeouts: int
+    wait_ms_p50: float | None
+    wait_ms_p99: float | None
+    wait_ms_max: float | None
+    connects: int
+    invalidations: int
+    lifetime_seconds_p50: float | None
+    lifetime_seconds_max: float | None
+
+
+class PoolMonitor:
+    """Collects checkout waits and connection lifetimes of one pool. Thread-safe."""
+
+    def __init__(self, window_size: int = WINDOW_SIZE):
+        """Initialize with how many recent samples to keep."""
+        self._lock = threading.Lock()
+        self._waits: deque[float] = deque(maxlen=window_size)
+        self._lifetimes: deque[float] = deque(maxlen=window_size)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._connects = 0
+        self._invalidations = 0
+        # Creation times of connections detached from the pool, by DBAPI connection identity
+        self._detached: dict[int, float] = {}
+
+    def attach(self, pool: Pool) -> None:
+        """Listen to a pool's events; listeners carry over when the pool is recreated."""
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "close_detached", self._on_close_detached)
+        event.listen(pool, "detach", self._on_detach)
+
+    def record_wait(self, seconds: float) -> None:
+        """Record how long a caller waited for a connection."""
+        with self._lock:
+            self._waits.append(seconds)
+
+    def record_timeout(self) -> None:
+        """Record a caller giving up after the pool timeout."""
+        with self._lock:
+            self._timeouts += 1
+
+    def stats(self, pool: Pool) -> PoolStats:
+        """Snapshot of the pool's capacity and the recorded timings."""
+        with self._lock:
+            waits = sorted(self._waits)
+            lifetimes = sorted(self._lifetimes)
+            checkouts, timeouts = self._checkouts, self._timeouts
+            connects, invalidations = self._connects, self._invalidations
+
+        size = max_overflow = checked_out = idle = saturation = None
+        if isinstance(pool, _MonitoredPoolMixin):
+            size, max_overflow = pool.size(), pool.max_overflow
+            checked_out, idle = pool.checkedout(), pool.checkedin()
+            # A negative max_overflow means unbounded
+            saturation = checked_out / (size + max_overflow) if max_overflow >= 0 else None
+        return PoolStats(
+            size=size,
+            max_overflow=max_overflow,
+            checked_out=checked_out,
+            idle=idle,
+            saturation=saturation,
+            checkouts=checkouts,
+            timeouts=timeouts,
+            wait_ms_p50=_scaled(_percentile(waits, 0.5), 1000),
+            wait_ms_p99=_scaled(_percentile(waits, 0.99), 1000),
+            wait_ms_max=_scaled(waits[-1] if waits else None, 1000),
+            connects=connects,
+            invalidations=invalidations,
+            lifetime_seconds_p50=_percentile(lifetimes, 0.5),
+            lifetime_seconds_max=lifetimes[-1] if lifetimes else None,
+        )
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        """Stamp a new DBAPI connection with its creation time."""
+        connection_record.info["connected_at"] = time.monotonic()
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        """Count a checkout."""
+        with self._lock:
+            self._checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        """Count a connection discarded after an error or a failed pre-ping."""
+        with self._lock:
+            self._invalidations += 1
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        """Record the lifetime of a connection the pool closed."""
+        self._record_lifetime(connection_record.info.pop("connected_at", None))
+
+    def _on_detach(self, dbapi_connection, connection_record) -> None:
+        """Carry the creation time of a connection leaving the pool over to the connection itself."""
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            with self._lock:
+                self._detached[id(dbapi_connection)] = connected_at
+
+    def _on_close_detached(self, dbapi_connection) -> None:
+        """Record the lifetime of a detached connection when it is closed."""
+        with self._lock:
+            connected_at = self._detached.pop(id(dbapi_connection), None)
+        self._record_lifetime(connected_at)
+
+    def _record_lifetime(self, connected_at: float | None) -> None:
+        """Record how long a connection lived, if its creation was seen."""
+        if connected_at is None:
+            return
+        with self._lock:
+            self._lifetimes.append(time.monotonic() - connected_at)
+
+
+class _MonitoredPoolMixin:
+    """Times Pool.connect() into the pool's monitor, which also listens to its events."""
+
+    def __init__(self, creator, monitor: PoolMonitor | None = None, **kwargs):
+        """Initialize the pool, then attach the monitor (pass monitor= to create_engine)."""
+        super().__init__(creator, **kwargs)
+        self.monitor = monitor
+        self.max_overflow = kwargs.get("max_overflow", DEFAULT_MAX_OVERFLOW)
+        if monitor is not None and "_dispatch" not in kwargs:
+            monitor.attach(self)
+
+    def connect(self):
+        """Check out a connection, recording how long it took or that it timed out."""
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.monitor is not None:
+                self.monitor.record_timeout()
+            raise
+        if self.monitor is not None:
+            self.monitor.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        """Recreate the pool (e.g. on dispose()) with the same monitor; event listeners carry over."""
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_MonitoredPoolMixin, QueuePool):
+    """QueuePool reporting to a PoolMonitor."""
+
+
+class MonitoredAsyncAdaptedQueuePool(_MonitoredPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool (for async drivers) reporting to a PoolMonitor."""
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of sorted values, or None if there are none."""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def _scaled(value: float | None, factor: float) -> float | None:
+    """Multiply a value that may be missing."""
+    return value * factor if value is not None else None
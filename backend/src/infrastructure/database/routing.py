@@ -0,0 +1,78 @@
+"""Read-replica routing.
+
+Repositories mark query-only reads by executing them with
+bind_arguments=REPLICA_READ. A RoutingSession sends those reads to the replica
+engine of its ReplicaRouter and everything else to the primary:
+
+- a session that has written keeps all its reads on the primary, so a request
+  reads its own writes;
+- for max_lag_seconds after any write committed by this process, reads go to
+  the primary, covering the time the replica takes to replay it.
+
+Plain sessions ignore the marker, so without a replica every read goes to the primary.
+"""
+
+import threading
+import time
+from types import MappingProxyType
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+# bind_arguments of Session.execute() for reads that may be served by a replica
+REPLICA_READ = MappingProxyType({"replica": True})
+
+# Session.info key set once the session has executed a write
+WROTE_KEY = "wrote"
+
+
+class ReplicaRouter:
+    """Chooses between the primary and a replica for reads. Thread-safe; one per process."""
+
+    def __init__(self, replica: Engine, max_lag_seconds: float = 1.0):
+        """Initialize with the replica engine and the replication lag to allow for after a write."""
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self._lock = threading.Lock()
+        self._last_write = float("-inf")
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def record_write(self) -> None:
+        """Note that this process just committed a write."""
+        with self._lock:
+            self._last_write = time.monotonic()
+
+    def replica_for_read(self) -> Engine | None:
+        """The replica if it can be trusted to have this process's writes, else None for the primary."""
+        with self._lock:
+            if time.monotonic() - self._last_write < self.max_lag_seconds:
+                self.primary_reads += 1
+                return None
+            self.replica_reads += 1
+            return self.replica
+
+
+class RoutingSession(Session):
+    """Session that sends replica-eligible reads to its router's replica (pass router= to sessionmaker)."""
+
+    def __init__(self, *args, router: ReplicaRouter | None = None, **kwargs):
+        """Initialize the session with an optional router; without one it behaves as a plain Session."""
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, *, clause=None, replica: bool = False, **kw):
+        """Bind for a statement: the replica for eligible reads, the primary for everything else."""
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info[WROTE_KEY] = True
+        elif replica and self.router is not None and not self.info.get(WROTE_KEY):
+            engine = self.router.replica_for_read()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def commit(self) -> None:
+        """Commit, starting the router's staleness window if the session wrote."""
+        super().commit()
+        if self.router is not None and self.info.get(WROTE_KEY):
+            self.router.record_write()
@@ -0,0 +1,66 @@
+"""Connection pool warm-up, run at startup before the app reports ready.
+
+warm_up() holds the connections it checks out until all are open, so the pool
+opens that many instead of reusing one, then runs WARMUP_QUERIES on each. The
+first requests skip connection setup (TCP, TLS and authentication) and find
+the tables they read already loaded into each server session's catalog cache.
+"""
+
+import logging
+import time
+from contextlib import AsyncExitStack, ExitStack
+
+from sqlalchemy import Engine, literal, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from .models import ChangeCounterModel, TaskCountModel, TaskModel, UserModel
+
+logger = logging.getLogger(__name__)
+
+# Cheap reads touching every table a request path starts from
+WARMUP_QUERIES = (
+    select(literal(1)),
+    select(UserModel.id).limit(1),
+    select(TaskModel.id).limit(1),
+    select(TaskCountModel.user_id).limit(1),
+    select(ChangeCounterModel.name).limit(1),
+)
+
+
+def warm_up(engine: Engine, connections: int) -> int:
+    """Open up to `connections` pooled connections and run the warm-up queries on each; return how many."""
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        opened = [stack.enter_context(engine.connect()) for _ in range(_capped(engine, connections))]
+        for connection in opened:
+            for query in WARMUP_QUERIES:
+                connection.execute(query).all()
+    _log(len(opened), started)
+    return len(opened)
+
+
+async def awarm_up(engine: AsyncEngine, connections: int) -> int:
+    """Open up to `connections` pooled connections of an async engine and run the warm-up queries on each."""
+    started = time.perf_counter()
+    async with AsyncExitStack() as stack:
+        opened = [
+            await stack.enter_async_context(engine.connect()) for _ in range(_capped(engine.sync_engine, connections))
+        ]
+        for connection in opened:
+            for query in WARMUP_QUERIES:
+                (await connection.execute(query)).all()
+    _log(len(opened), started)
+    return len(opened)
+
+
+def _capped(engine: Engine, connections: int) -> int:
+    """Connections worth opening: overflow connections are closed on return, and other pools hold one."""
+    if isinstance(engine.pool, QueuePool):
+        return min(connections, engine.pool.size())
+    return min(connections, 1)
+
+
+def _log(opened: int, started: float) -> None:
+    """Log how long warming the pool took."""
+    logger.info("Warmed %d database connections in %.1f ms", opened, (time.perf_counter() - started) * 1000)
@@ -0,0 +1,5 @@
+"""Change feed module."""
+
+from .hub import EventHub, HubStats, Subscription, get_event_hub
+
+__all__ = ["EventHub", "HubStats", "Subscription", "get_event_hub"]
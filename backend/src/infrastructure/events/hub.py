@@ -0,0 +1,118 @@
+"""In-process publish/subscribe hub for change feeds."""
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from infrastructure.config.settings import get_settings
+
+
+@dataclass
+class HubStats:
+    """Counters of an event hub since it was created."""
+
+    subscribers: int
+    published: int
+    dropped: int
+
+
+class Subscription:
+    """A subscriber's bounded queue of pre-encoded messages.
+
+    A subscriber that falls queue_size messages behind is dropped rather than
+    buffered without limit: its queue is cleared and get() returns None.
+    """
+
+    def __init__(self, hub: "EventHub", queue_size: int):
+        """Initialize an empty queue registered with the hub."""
+        self._hub = hub
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(queue_size)
+        self.dropped = False
+
+    async def get(self) -> bytes | None:
+        """Wait for the next message; None once the subscriber has been dropped."""
+        if self.dropped:
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        """Unsubscribe."""
+        self._hub._subscribers.discard(self)
+
+    def _offer(self, messages: Sequence[bytes]) -> None:
+        """Enqueue messages, dropping the subscriber if they do not all fit."""
+        if self._queue.maxsize - self._queue.qsize() < len(messages):
+            self._drop()
+            return
+        for message in messages:
+            self._queue.put_nowait(message)
+
+    def _drop(self) -> None:
+        """Discard queued messages and wake the consumer with None."""
+        self.dropped = True
+        self.close()
+        self._hub._dropped += 1
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class EventHub:
+    """Fans published messages out to every subscriber of this process.
+
+    Subscriptions live on the event loop serving the app. publish() may be
+    called from any thread (sync routes run in a threadpool): off the loop,
+    the fan-out is scheduled onto it with one call_soon_threadsafe per batch.
+    Messages are encoded once by the publisher and shared by all subscribers.
+    """
+
+    def __init__(self, queue_size: int = 256):
+        """Initialize with no subscribers; each gets a queue of queue_size messages."""
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._published = 0
+        self._dropped = 0
+
+    def subscribe(self) -> Subscription:
+        """Register a subscriber; must be called on the event loop."""
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(self, self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether anyone is listening; lets publishers skip encoding."""
+        return bool(self._subscribers)
+
+    def publish(self, messages: Sequence[bytes]) -> None:
+        """Deliver messages to every current subscriber without blocking."""
+        loop = self._loop
+        if not messages or not self._subscribers or loop is None:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._fan_out(messages)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._fan_out, tuple(messages))
+
+    def stats(self) -> HubStats:
+        """Snapshot of the hub's counters."""
+        return HubStats(subscribers=len(self._subscribers), published=self._published, dropped=self._dropped)
+
+    def _fan_out(self, messages: Sequence[bytes]) -> None:
+        """Offer messages to each subscriber (runs on the event loop)."""
+        self._published += len(messages)
+        for subscription in list(self._subscribers):
+            subscription._offer(messages)
+
+
+@lru_cache
+def get_event_hub() -> EventHub:
+    """Get the process-wide event hub configured from settings."""
+    return EventHub(queue_size=get_settings().event_queue_size)
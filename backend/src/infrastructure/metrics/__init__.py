@@ -0,0 +1,28 @@
+"""Metrics module."""
+
+from .query_budget import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    budget_of,
+    enforce_query_budget,
+    query_budget,
+)
+from .query_cost import QueryCost, instrument_engines, measure_queries, statement_shape
+from .registry import CONTENT_TYPE, Counter, Gauge, Histogram, MetricsRegistry
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "QueryBudget",
+    "QueryBudgetExceededError",
+    "QueryCost",
+    "budget_of",
+    "enforce_query_budget",
+    "query_budget",
+    "statement_shape",
+    "instrument_engines",
+    "measure_queries",
+]
@@ -0,0 +1,87 @@
+"""Query budgets: limits on the SQL a block of code, a service call or a route may run.
+
+A QueryBudget caps the number of statements and how often any one statement
+shape may repeat. A repeated shape is the signature of an N+1: the same lookup
+issued once per row instead of once per page. Routes declare their budget by
+decorating the endpoint with a QueryBudget. enforce_query_budget() checks a
+block against a budget, in tests or at runtime (see
+presentation.api.query_budget).
+"""
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TypeVar
+
+from .query_cost import QueryCost, measure_queries
+
+logger = logging.getLogger(__name__)
+
+# Endpoint attribute holding the route's declared budget
+BUDGET_ATTRIBUTE = "query_budget"
+
+# Times any statement shape may run by default; a second run usually means a per-row lookup
+DEFAULT_MAX_REPEATS = 1
+
+F = TypeVar("F", bound=Callable)
+
+
+class QueryBudgetExceededError(Exception):
+    """Raised when a block runs more SQL than its budget allows."""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """At most max_queries statements, none of whose shapes runs more than max_repeats times."""
+
+    max_queries: int
+    max_repeats: int = DEFAULT_MAX_REPEATS
+
+    def __call__(self, endpoint: F) -> F:
+        """Declare this budget on a route endpoint, which is returned unchanged."""
+        setattr(endpoint, BUDGET_ATTRIBUTE, self)
+        return endpoint
+
+    def violations(self, cost: QueryCost) -> list[str]:
+        """Descriptions of how a measured cost exceeds the budget; empty if it does not."""
+        found = []
+        if cost.queries > self.max_queries:
+            found.append(f"{cost.queries} statements, budget {self.max_queries}")
+        repeated = cost.most_repeated()
+        if repeated is not None and repeated[1] > self.max_repeats:
+            shape, times = repeated
+            found.append(f"statement repeated {times} times, budget {self.max_repeats}: {shape}")
+        return found
+
+
+def budget_of(endpoint: Callable) -> QueryBudget | None:
+    """The budget declared on an endpoint, if any."""
+    return getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+def report(budget: QueryBudget, cost: QueryCost, name: str, action: str) -> None:
+    """Warn about or raise on a cost over budget ("warn" or "raise"); nothing if within it."""
+    violations = budget.violations(cost)
+    if not violations:
+        return
+    message = f"{name} exceeded its query budget: " + "; ".join(violations)
+    if action == "raise":
+        raise QueryBudgetExceededError(message)
+    logger.warning(message)
+
+
+@contextmanager
+def enforce_query_budget(budget: QueryBudget, name: str = "block", action: str = "raise") -> Iterator[QueryCost]:
+    """Measure the block with statement shapes and report it against a budget on exit.
+
+    Also usable as a decorator of sync functions.
+    """
+    with measure_queries(track_shapes=True) as cost:
+        yield cost
+    report(budget, cost, name, action)
+
+
+def query_budget(max_queries: int, max_repeats: int = DEFAULT_MAX_REPEATS, name: str = "block"):
+    """enforce_query_budget() raising on a budget given inline, e.g. `with query_budget(2): ...` in tests."""
+    return enforce_query_budget(QueryBudget(max_queries, max_repeats), name)
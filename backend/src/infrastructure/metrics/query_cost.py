@@ -0,0 +1,106 @@
+"""Per-request database cost from SQLAlchemy cursor events.
+
+measure_queries() opens a QueryCost for the current context. The cursor
+listeners installed by instrument_engines() add each statement's count, time and
+rows to it. Contexts are copied into threadpool threads, so sync routes and
+streamed responses are counted too. Statements run outside a measured context,
+such as the change poller's, cost one ContextVar lookup.
+
+Measurements nest. A statement counts toward every enclosing QueryCost, so a
+query budget around a service call still lets request metrics see the same
+statements.
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+# ExecutionContext attribute holding the start time of the statement in flight
+_STARTED = "_metrics_started"
+
+# A parenthesized list of bind parameters in any paramstyle, e.g. an expanded IN (?, ?, ?)
+_PARAMETER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+))+\s*\)")
+
+
+@dataclass
+class QueryCost:
+    """Statements executed in one request, the time spent in them and the rows they reported.
+
+    rows is the driver's rowcount: rows returned by SELECTs on PostgreSQL
+    (psycopg2 and asyncpg buffer results) and rows written by INSERT, UPDATE
+    and DELETE. SQLite reports only the latter.
+    """
+
+    queries: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    # Executions per statement shape, when tracked (see statement_shape)
+    shapes: Counter[str] | None = None
+    # Enclosing measurement, which is charged for the same statements
+    parent: "QueryCost | None" = field(default=None, repr=False)
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        """The statement shape executed most often and how many times, if shapes are tracked."""
+        if not self.shapes:
+            return None
+        return self.shapes.most_common(1)[0]
+
+
+_current: ContextVar[QueryCost | None] = ContextVar("query_cost", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """A statement with its lists of bind parameters collapsed, so IN lists of any length match."""
+    return _PARAMETER_LIST.sub("(...)", statement)
+
+
+@contextmanager
+def measure_queries(track_shapes: bool = False) -> Iterator[QueryCost]:
+    """Collect the cost of the statements executed in this context until the block exits.
+
+    track_shapes also counts executions per statement shape, to spot repeated statements (N+1).
+    """
+    cost = QueryCost(shapes=Counter() if track_shapes else None, parent=_current.get())
+    token = _current.set(cost)
+    try:
+        yield cost
+    finally:
+        _current.reset(token)
+
+
+def instrument_engines() -> None:
+    """Listen to cursor execution on every engine, sync and async alike; idempotent."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Stamp the statement's start if a request is being measured."""
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Add the statement to the cost of every enclosing measurement."""
+    cost = _current.get()
+    started = getattr(context, _STARTED, None)
+    if cost is None or started is None:
+        return
+    elapsed = time.perf_counter() - started
+    rows = max(cursor.rowcount, 0)
+    shape = None
+    while cost is not None:
+        cost.queries += 1
+        cost.seconds += elapsed
+        cost.rows += rows
+        if cost.shapes is not None:
+            shape = shape or statement_shape(statement)
+            cost.shapes[shape] += 1
+        cost = cost.parent
@@ -0,0 +1,158 @@
+"""In-process metrics rendered in the Prometheus text exposition format (version 0.0.4).
+
+Only what the API reports is implemented: counters, gauges and histograms
+with fixed label names, whose samples are keyed by tuples of label values.
+Updates take a lock per metric, so they are safe from the threadpool.
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus client defaults, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    """A named metric with fixed label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        """Initialize with the metric name, its HELP text and its label names."""
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> Iterator[str]:
+        """Lines of the metric: HELP, TYPE and its samples."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterator[str]:
+        """Sample lines of the metric."""
+        raise NotImplementedError
+
+    def _labels(self, values: tuple, extra: str = "") -> str:
+        """Render a label set, with an extra preformatted label (e.g. le) appended."""
+        pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(self.label_names, values, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        """Initialize with no samples."""
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1.0) -> None:
+        """Add to the value of a label set."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        """Current value of a label set."""
+        return self._values.get(labels, 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{self._labels(labels)} {_format(value)}"
+
+
+class Gauge(Counter):
+    """Value per label set that goes up and down."""
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1.0) -> None:
+        """Subtract from the value of a label set."""
+        self.inc(labels, -amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observations per label set over fixed, cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize with upper bounds of the buckets, in increasing order; +Inf is implied."""
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+        # Per label set: non-cumulative count per bucket (last one is +Inf), sum, count
+        self._series: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, labels: tuple = ()) -> None:
+        """Record one observation for a label set."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, labels: tuple = ()) -> int:
+        """Number of observations of a label set."""
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            snapshot = [(labels, list(counts), total[0]) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                le = 'le="' + _format(bound) + '"'
+                yield f"{self.name}_bucket{self._labels(labels, le)} {cumulative}"
+            yield f"{self.name}_sum{self._labels(labels)} {_format(total)}"
+            yield f"{self.name}_count{self._labels(labels)} {cumulative}"
+
+
+class MetricsRegistry:
+    """The metrics of a process, in registration order."""
+
+    def __init__(self):
+        """Initialize with no metrics."""
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: M) -> M:
+        """Add a metric and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Every metric in the text exposition format."""
+        return "".join(f"{line}\n" for metric in self._metrics for line in metric.render())
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    """Format a sample value or bucket bound as Prometheus expects."""
+    return "+Inf" if value == float("inf") else repr(float(value))
@@ -1,6 +1,21 @@
 """Repository implementations."""
 
+from .caching_async_task_repository import CachingAsyncTaskRepository
+from .caching_async_user_repository import CachingAsyncUserRepository
+from .caching_task_repository import CachingTaskRepository
+from .caching_user_repository import CachingUserRepository
+from .sqlalchemy_async_task_repository import SQLAlchemyAsyncTaskRepository
+from .sqlalchemy_async_user_repository import SQLAlchemyAsyncUserRepository
 from .sqlalchemy_task_repository import SQLAlchemyTaskRepository
 from .sqlalchemy_user_repository import SQLAlchemyUserRepository
 
-__all__ = ["SQLAlchemyTaskRepository", "SQLAlchemyUserRepository"]
+__all__ = [
+    "CachingAsyncTaskRepository",
+    "CachingAsyncUserRepository",
+    "CachingTaskRepository",
+    "CachingUserRepository",
+    "SQLAlchemyAsyncTaskRepository",
+    "SQLAlchemyAsyncUserRepository",
+    "SQLAlchemyTaskRepository",
+    "SQLAlchemyUserRepository",
+]
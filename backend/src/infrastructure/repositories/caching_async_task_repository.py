@@ -0,0 +1,152 @@
+"""Read-through caching decorator for async task repositories."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from domain.models import (
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCount,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskUpdate,
+)
+from domain.ports import AsyncTaskRepository
+from infrastructure.cache import CacheBackend, aread_through, revalidate
+
+from .caching_task_repository import NAMESPACE
+
+
+class CachingAsyncTaskRepository(AsyncTaskRepository):
+    """Async counterpart of CachingTaskRepository, sharing its cache namespace."""
+
+    def __init__(self, repository: AsyncTaskRepository, cache: CacheBackend):
+        """Initialize with the repository to wrap and the cache to use."""
+        self.repository = repository
+        self.cache = cache
+
+    async def create(self, task: Task) -> Task:
+        """Create a task and invalidate cached task reads."""
+        created = await self.repository.create(task)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    async def update(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        """Update a task and invalidate cached task reads."""
+        updated = await self.repository.update(task_id, changes)
+        self.cache.invalidate(NAMESPACE)
+        return updated
+
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task and invalidate cached task reads."""
+        deleted = await self.repository.delete(task_id)
+        self.cache.invalidate(NAMESPACE)
+        return deleted
+
+    async def create_many(self, tasks: list[Task]) -> list[Task]:
+        """Create tasks and invalidate cached task reads."""
+        created = await self.repository.create_many(tasks)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    async def update_many(self, changes: dict[int, TaskUpdate]) -> list[Task]:
+        """Update tasks and invalidate cached task reads."""
+        updated = await self.repository.update_many(changes)
+        self.cache.invalidate(NAMESPACE)
+        return updated
+
+    async def delete_many(self, task_ids: list[int]) -> set[int]:
+        """Delete tasks and invalidate cached task reads."""
+        deleted = await self.repository.delete_many(task_ids)
+        self.cache.invalidate(NAMESPACE)
+        return deleted
+
+    async def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by id, through the cache."""
+        return await aread_through(
+            self.cache, (NAMESPACE, "get_by_id", task_id), lambda: self.repository.get_by_id(task_id)
+        )
+
+    async def get_by_user_id(self, user_id: int) -> list[Task]:
+        """Get all tasks of a user, through the cache."""
+        key = (NAMESPACE, "get_by_user_id", user_id)
+        return await aread_through(self.cache, key, lambda: self.repository.get_by_user_id(user_id))
+
+    async def get_all(self) -> list[Task]:
+        """Get all tasks, through the cache."""
+        return await aread_through(self.cache, (NAMESPACE, "get_all"), self.repository.get_all)
+
+    async def find(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query, through the cache."""
+        return await aread_through(self.cache, (NAMESPACE, "find", query), lambda: self.repository.find(query))
+
+    async def get_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get a page of matching tasks, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "get_page", limit, cursor, query)
+        return await aread_through(self.cache, key, lambda: self.repository.get_page(limit, cursor, query))
+
+    async def find_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, through the cache."""
+        return await aread_through(
+            self.cache, (NAMESPACE, "find_rows", query), lambda: self.repository.find_rows(query)
+        )
+
+    async def get_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "get_rows_page", limit, cursor, query)
+        return await aread_through(self.cache, key, lambda: self.repository.get_rows_page(limit, cursor, query))
+
+    async def search(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of matching task rows, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "search", text, limit, cursor, query)
+        return await aread_through(self.cache, key, lambda: self.repository.search(text, limit, cursor, query))
+
+    async def get_watermark(self) -> TableWatermark:
+        """Get the tasks table watermark from the database, dropping cached task reads if it has moved."""
+        return revalidate(self.cache, NAMESPACE, await self.repository.get_watermark())
+
+    def stream(self, query: TaskQuery, batch_size: int) -> AsyncIterator[TaskRow]:
+        """Iterate over the rows of matching tasks, bypassing the cache."""
+        return self.repository.stream(query, batch_size)
+
+    async def get_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get task changes after a sync token, through the cache."""
+        return await aread_through(
+            self.cache, (NAMESPACE, "get_changes", since), lambda: self.repository.get_changes(since)
+        )
+
+    async def purge_tombstones(self, before: datetime) -> int:
+        """Compact tombstones and invalidate cached task reads."""
+        removed = await self.repository.purge_tombstones(before)
+        self.cache.invalidate(NAMESPACE)
+        return removed
+
+    async def archive(self, before: datetime, limit: int) -> set[int]:
+        """Archive old DONE tasks and invalidate cached task reads."""
+        archived = await self.repository.archive(before, limit)
+        self.cache.invalidate(NAMESPACE)
+        return archived
+
+    async def get_counts(self) -> list[TaskCount]:
+        """Get the task counts per (user, status), through the cache."""
+        return await aread_through(self.cache, (NAMESPACE, "get_counts"), self.repository.get_counts)
+
+    async def rebuild_counts(self) -> int:
+        """Rebuild the task counts and invalidate cached task reads."""
+        rebuilt = await self.repository.rebuild_counts()
+        self.cache.invalidate(NAMESPACE)
+        return rebuilt
@@ -0,0 +1,56 @@
+"""Read-through caching decorator for async user repositories."""
+
+from collections.abc import AsyncIterator
+
+from domain.models import TableWatermark, User, UserRow
+from domain.ports import AsyncUserRepository
+from infrastructure.cache import CacheBackend, aread_through, revalidate
+
+from .caching_user_repository import NAMESPACE
+
+
+class CachingAsyncUserRepository(AsyncUserRepository):
+    """Async counterpart of CachingUserRepository, sharing its cache namespace."""
+
+    def __init__(self, repository: AsyncUserRepository, cache: CacheBackend):
+        """Initialize with the repository to wrap and the cache to use."""
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        """Get a user by id, through the cache."""
+        return await aread_through(
+            self.cache, (NAMESPACE, "get_by_id", user_id), lambda: self.repository.get_by_id(user_id)
+        )
+
+    async def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids, through the cache."""
+        key = (NAMESPACE, "get_by_ids", frozenset(user_ids))
+        return await aread_through(self.cache, key, lambda: self.repository.get_by_ids(user_ids))
+
+    async def get_by_name(self, first_name: str, last_name: str) -> User | None:
+        """Get a user by first and last name, through the cache."""
+        key = (NAMESPACE, "get_by_name", first_name, last_name)
+        return await aread_through(self.cache, key, lambda: self.repository.get_by_name(first_name, last_name))
+
+    async def create(self, user: User) -> User:
+        """Create a user and invalidate cached user reads."""
+        created = await self.repository.create(user)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    async def get_all(self) -> list[User]:
+        """Get all users, through the cache."""
+        return await aread_through(self.cache, (NAMESPACE, "get_all"), self.repository.get_all)
+
+    async def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users, through the cache."""
+        return await aread_through(self.cache, (NAMESPACE, "get_all_rows"), self.repository.get_all_rows)
+
+    async def get_watermark(self) -> TableWatermark:
+        """Get the users table watermark from the database, dropping cached user reads if it has moved."""
+        return revalidate(self.cache, NAMESPACE, await self.repository.get_watermark())
+
+    def stream(self, batch_size: int) -> AsyncIterator[UserRow]:
+        """Iterate over the rows of all users, bypassing the cache."""
+        return self.repository.stream(batch_size)
@@ -0,0 +1,152 @@
+"""Read-through caching decorator for task repositories."""
+
+from collections.abc import Iterator
+from datetime import datetime
+
+from domain.models import (
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCount,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskUpdate,
+)
+from domain.ports import TaskRepository
+from infrastructure.cache import CacheBackend, read_through, revalidate
+
+# Cache namespace of task reads; every task write invalidates it
+NAMESPACE = "tasks"
+
+
+class CachingTaskRepository(TaskRepository):
+    """Task repository that caches reads of another one and invalidates them on writes.
+
+    Keys are the read method and its arguments (the query shape). Cached
+    values are shared between callers and must not be mutated. Streams are
+    not cached.
+    """
+
+    def __init__(self, repository: TaskRepository, cache: CacheBackend):
+        """Initialize with the repository to wrap and the cache to use."""
+        self.repository = repository
+        self.cache = cache
+
+    def create(self, task: Task) -> Task:
+        """Create a task and invalidate cached task reads."""
+        created = self.repository.create(task)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    def update(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        """Update a task and invalidate cached task reads."""
+        updated = self.repository.update(task_id, changes)
+        self.cache.invalidate(NAMESPACE)
+        return updated
+
+    def delete(self, task_id: int) -> bool:
+        """Delete a task and invalidate cached task reads."""
+        deleted = self.repository.delete(task_id)
+        self.cache.invalidate(NAMESPACE)
+        return deleted
+
+    def create_many(self, tasks: list[Task]) -> list[Task]:
+        """Create tasks and invalidate cached task reads."""
+        created = self.repository.create_many(tasks)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    def update_many(self, changes: dict[int, TaskUpdate]) -> list[Task]:
+        """Update tasks and invalidate cached task reads."""
+        updated = self.repository.update_many(changes)
+        self.cache.invalidate(NAMESPACE)
+        return updated
+
+    def delete_many(self, task_ids: list[int]) -> set[int]:
+        """Delete tasks and invalidate cached task reads."""
+        deleted = self.repository.delete_many(task_ids)
+        self.cache.invalidate(NAMESPACE)
+        return deleted
+
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by id, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_by_id", task_id), lambda: self.repository.get_by_id(task_id))
+
+    def get_by_user_id(self, user_id: int) -> list[Task]:
+        """Get all tasks of a user, through the cache."""
+        key = (NAMESPACE, "get_by_user_id", user_id)
+        return read_through(self.cache, key, lambda: self.repository.get_by_user_id(user_id))
+
+    def get_all(self) -> list[Task]:
+        """Get all tasks, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_all"), self.repository.get_all)
+
+    def find(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "find", query), lambda: self.repository.find(query))
+
+    def get_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get a page of matching tasks, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "get_page", limit, cursor, query)
+        return read_through(self.cache, key, lambda: self.repository.get_page(limit, cursor, query))
+
+    def find_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "find_rows", query), lambda: self.repository.find_rows(query))
+
+    def get_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "get_rows_page", limit, cursor, query)
+        return read_through(self.cache, key, lambda: self.repository.get_rows_page(limit, cursor, query))
+
+    def search(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of matching task rows, through the cache."""
+        query = query or TaskQuery()
+        key = (NAMESPACE, "search", text, limit, cursor, query)
+        return read_through(self.cache, key, lambda: self.repository.search(text, limit, cursor, query))
+
+    def get_watermark(self) -> TableWatermark:
+        """Get the tasks table watermark from the database, dropping cached task reads if it has moved."""
+        return revalidate(self.cache, NAMESPACE, self.repository.get_watermark())
+
+    def stream(self, query: TaskQuery, batch_size: int) -> Iterator[TaskRow]:
+        """Iterate over the rows of matching tasks, bypassing the cache."""
+        return self.repository.stream(query, batch_size)
+
+    def get_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get task changes after a sync token, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_changes", since), lambda: self.repository.get_changes(since))
+
+    def purge_tombstones(self, before: datetime) -> int:
+        """Compact tombstones and invalidate cached task reads."""
+        removed = self.repository.purge_tombstones(before)
+        self.cache.invalidate(NAMESPACE)
+        return removed
+
+    def archive(self, before: datetime, limit: int) -> set[int]:
+        """Archive old DONE tasks and invalidate cached task reads."""
+        archived = self.repository.archive(before, limit)
+        self.cache.invalidate(NAMESPACE)
+        return archived
+
+    def get_counts(self) -> list[TaskCount]:
+        """Get the task counts per (user, status), through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_counts"), self.repository.get_counts)
+
+    def rebuild_counts(self) -> int:
+        """Rebuild the task counts and invalidate cached task reads."""
+        rebuilt = self.repository.rebuild_counts()
+        self.cache.invalidate(NAMESPACE)
+        return rebuilt
@@ -0,0 +1,59 @@
+"""Read-through caching decorator for user repositories."""
+
+from collections.abc import Iterator
+
+from domain.models import TableWatermark, User, UserRow
+from domain.ports import UserRepository
+from infrastructure.cache import CacheBackend, read_through, revalidate
+
+# Cache namespace of user reads; every user write invalidates it
+NAMESPACE = "users"
+
+
+class CachingUserRepository(UserRepository):
+    """User repository that caches reads of another one and invalidates them on writes.
+
+    Cached values are shared between callers and must not be mutated.
+    Streams are not cached.
+    """
+
+    def __init__(self, repository: UserRepository, cache: CacheBackend):
+        """Initialize with the repository to wrap and the cache to use."""
+        self.repository = repository
+        self.cache = cache
+
+    def get_by_id(self, user_id: int) -> User | None:
+        """Get a user by id, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_by_id", user_id), lambda: self.repository.get_by_id(user_id))
+
+    def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids, through the cache."""
+        key = (NAMESPACE, "get_by_ids", frozenset(user_ids))
+        return read_through(self.cache, key, lambda: self.repository.get_by_ids(user_ids))
+
+    def get_by_name(self, first_name: str, last_name: str) -> User | None:
+        """Get a user by first and last name, through the cache."""
+        key = (NAMESPACE, "get_by_name", first_name, last_name)
+        return read_through(self.cache, key, lambda: self.repository.get_by_name(first_name, last_name))
+
+    def create(self, user: User) -> User:
+        """Create a user and invalidate cached user reads."""
+        created = self.repository.create(user)
+        self.cache.invalidate(NAMESPACE)
+        return created
+
+    def get_all(self) -> list[User]:
+        """Get all users, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_all"), self.repository.get_all)
+
+    def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users, through the cache."""
+        return read_through(self.cache, (NAMESPACE, "get_all_rows"), self.repository.get_all_rows)
+
+    def get_watermark(self) -> TableWatermark:
+        """Get the users table watermark from the database, dropping cached user reads if it has moved."""
+        return revalidate(self.cache, NAMESPACE, self.repository.get_watermark())
+
+    def stream(self, batch_size: int) -> Iterator[UserRow]:
+        """Iterate over the rows of all users, bypassing the cache."""
+        return self.repository.stream(batch_size)
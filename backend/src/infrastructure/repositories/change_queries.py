@@ -0,0 +1,34 @@
+"""SQL statements on the change counters shared by all repositories.
+
+change_counters holds one monotonic counter per namespace ("tasks", "users").
+Every write transaction bumps its namespace's counter first, so the row lock
+serializes writers and values become visible in commit order; other
+processes tail the counters to learn about writes (see infrastructure.coherence).
+"""
+
+from sqlalchemy import Select, Update, select, update
+
+from infrastructure.database.models import ChangeCounterModel
+
+# Postgres NOTIFY channel signalled by a trigger whenever a counter moves
+NOTIFY_CHANNEL = "change_counters"
+
+
+def bump(name: str) -> Update:
+    """UPDATE ... RETURNING the next value of a counter, locking it until commit."""
+    return (
+        update(ChangeCounterModel)
+        .where(ChangeCounterModel.name == name)
+        .values(value=ChangeCounterModel.value + 1)
+        .returning(ChangeCounterModel.value)
+    )
+
+
+def select_value(name: str) -> Select:
+    """SELECT the current value of one counter, by primary key."""
+    return select(ChangeCounterModel.value).where(ChangeCounterModel.name == name)
+
+
+def select_counters() -> Select:
+    """SELECT the current value of every counter."""
+    return select(ChangeCounterModel.name, ChangeCounterModel.value)
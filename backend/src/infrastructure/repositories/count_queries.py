@@ -0,0 +1,69 @@
+"""SQL statements maintaining task_counts, shared by the sync and async task repositories.
+
+task_counts holds the number of tasks per (user_id, status). Each task write
+applies signed deltas to it in the write's own transaction with one upsert,
+so the board summary reads one row per (user, status) however many tasks
+there are. rebuild() recomputes the table from tasks to repair any drift.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import Delete, Insert, Select, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from domain.models import TaskStatus
+from infrastructure.database.models import TaskCountModel, TaskModel
+
+CountKey = tuple[int, TaskStatus]
+
+# INSERT constructs supporting ON CONFLICT, per dialect
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def deltas(removed: Iterable[CountKey], added: Iterable[CountKey]) -> dict[CountKey, int]:
+    """Net change per (user_id, status) of removing and adding tasks, without zero entries."""
+    net: dict[CountKey, int] = {}
+    for key in removed:
+        net[key] = net.get(key, 0) - 1
+    for key in added:
+        net[key] = net.get(key, 0) + 1
+    return {key: delta for key, delta in net.items() if delta}
+
+
+def select_keys(task_ids) -> Select:
+    """SELECT (id, user_id, status) of tasks, i.e. the counts they are part of."""
+    return select(TaskModel.id, TaskModel.user_id, TaskModel.status).where(TaskModel.id.in_(task_ids))
+
+
+def apply(changes: dict[CountKey, int], dialect_name: str) -> Insert:
+    """Multi-row INSERT ... ON CONFLICT DO UPDATE adding deltas to counts."""
+    # Sorted so concurrent writers would lock rows in the same order
+    values = [
+        {"user_id": user_id, "status": status, "count": delta}
+        for (user_id, status), delta in sorted(changes.items(), key=lambda item: (item[0][0], item[0][1].value))
+    ]
+    stmt = _UPSERT_INSERTS[dialect_name](TaskCountModel).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[TaskCountModel.user_id, TaskCountModel.status],
+        set_={"count": TaskCountModel.count + stmt.excluded.count},
+    )
+
+
+def select_counts() -> Select:
+    """SELECT the non-zero counts, by user then status."""
+    return (
+        select(TaskCountModel.user_id, TaskCountModel.status, TaskCountModel.count)
+        .where(TaskCountModel.count != 0)
+        .order_by(TaskCountModel.user_id, TaskCountModel.status)
+    )
+
+
+def clear() -> Delete:
+    """DELETE every count, ahead of rebuild()."""
+    return delete(TaskCountModel)
+
+
+def rebuild() -> Insert:
+    """INSERT ... SELECT the counts recomputed from tasks."""
+    recount = select(TaskModel.user_id, TaskModel.status, func.count()).group_by(TaskModel.user_id, TaskModel.status)
+    return insert(TaskCountModel).from_select(["user_id", "status", "count"], recount)
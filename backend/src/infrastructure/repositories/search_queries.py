@@ -0,0 +1,94 @@
+"""SQL statements for task search, shared by the sync and async task repositories.
+
+Every whitespace-separated term of the search text must occur in the task
+description, case-insensitively. Each dialect serves this from its own index:
+
+- PostgreSQL: tasks.search_vector, a generated tsvector column with a GIN
+  index, matches words (stemmed, so "fixing" finds "fix"); a pg_trgm GIN index
+  on description serves the substring match (ILIKE) for everything else.
+  Relevance is ts_rank plus trigram similarity.
+- SQLite: tasks_fts, an FTS5 table with the trigram tokenizer, matches terms
+  of three or more characters as substrings; shorter terms fall back to LIKE
+  on the rows FTS5 found. Relevance is bm25.
+
+Results are ordered by descending relevance then id and paged by keyset on
+that pair. The index objects are created in infrastructure.database.models
+(and migration 010 on PostgreSQL).
+"""
+
+from sqlalchemy import Select, and_, column, func, literal, literal_column, or_, select, table
+
+from domain.models import SearchCursor, TaskQuery, TaskRow, TaskSearchPage
+from infrastructure.database.models import TaskModel
+
+from .task_queries import TASK_COLUMNS, where_matching
+
+# Generated column, deliberately not mapped on TaskModel (it only exists on PostgreSQL)
+SEARCH_VECTOR = literal_column("tasks.search_vector")
+TEXT_SEARCH_CONFIG = "english"
+
+# FTS5 index over tasks.description on SQLite; rowid is the task id, rank is bm25()
+TASKS_FTS = table("tasks_fts", column("rowid"), column("rank"))
+
+# Shortest term the FTS5 trigram tokenizer can match
+MIN_TRIGRAM_TERM = 3
+
+
+def select_page(text: str, limit: int, cursor: SearchCursor | None, query: TaskQuery, dialect_name: str) -> Select:
+    """SELECT one keyset page of matching tasks with their score, plus one row to detect a next page."""
+    terms = text.split()
+    matches = _postgresql_matches(text, terms) if dialect_name == "postgresql" else _sqlite_matches(terms)
+    ranked = where_matching(matches, query).subquery("ranked")
+    stmt = select(ranked)
+    if cursor is not None:
+        stmt = stmt.where(
+            or_(ranked.c.score < cursor.score, and_(ranked.c.score == cursor.score, ranked.c.id > cursor.id))
+        )
+    return stmt.order_by(ranked.c.score.desc(), ranked.c.id.asc()).limit(limit + 1)
+
+
+def to_page(rows, limit: int) -> TaskSearchPage:
+    """Build a page of task rows from the rows of select_page()."""
+    items = [TaskRow(*row[:-1]) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = SearchCursor(score=last.score, id=last.id)
+    return TaskSearchPage(items=items, next_cursor=next_cursor)
+
+
+def _postgresql_matches(text: str, terms: list[str]) -> Select:
+    """SELECT tasks matching every term as a word (search_vector) or as substrings (trigram index)."""
+    tsquery = func.plainto_tsquery(TEXT_SEARCH_CONFIG, text)
+    score = func.ts_rank(SEARCH_VECTOR, tsquery) + func.similarity(TaskModel.description, text)
+    substrings = and_(*(TaskModel.description.ilike(_like_pattern(term), escape="\\") for term in terms))
+    return select(*TASK_COLUMNS, score.label("score")).where(or_(SEARCH_VECTOR.op("@@")(tsquery), substrings))
+
+
+def _sqlite_matches(terms: list[str]) -> Select:
+    """SELECT tasks containing every term, through tasks_fts where the terms are long enough."""
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_TERM]
+    if long_terms:
+        # bm25() is lower for better matches
+        stmt = (
+            select(*TASK_COLUMNS, (-TASKS_FTS.c.rank).label("score"))
+            .join(TASKS_FTS, TASKS_FTS.c.rowid == TaskModel.id)
+            .where(literal_column("tasks_fts").op("MATCH")(_fts_query(long_terms)))
+        )
+    else:
+        stmt = select(*TASK_COLUMNS, literal(0.0).label("score"))
+    for term in terms:
+        if len(term) < MIN_TRIGRAM_TERM:
+            stmt = stmt.where(TaskModel.description.ilike(_like_pattern(term), escape="\\"))
+    return stmt
+
+
+def _fts_query(terms: list[str]) -> str:
+    """FTS5 query requiring every term, each quoted as a literal string."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE pattern finding a term anywhere, with wildcards in the term escaped."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -0,0 +1,268 @@
+"""SQLAlchemy async task repository implementation."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models import (
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCount,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskUpdate,
+)
+from domain.ports import AsyncTaskRepository
+from infrastructure.database.routing import REPLICA_READ
+
+from . import count_queries as counts
+from . import search_queries
+from . import task_queries as q
+
+
+class SQLAlchemyAsyncTaskRepository(AsyncTaskRepository):
+    """SQLAlchemy AsyncSession implementation of task repository.
+
+    Every write also adjusts task_counts in its transaction (see count_queries).
+    Query-only reads are marked REPLICA_READ, for a RoutingSession to send to a read replica.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with async database session."""
+        self.session = session
+
+    async def create(self, task: Task) -> Task:
+        """Create a new task with a single INSERT ... RETURNING."""
+        stmt = q.insert_task(task, await self._next_change_seq())
+        result = await self._execute_write(stmt, f"User with id {task.user_id} not found")
+        row = result.one()
+        await self._apply_counts(counts.deltas((), [(row.user_id, row.status)]))
+        await self.session.commit()
+        return q.to_domain(row)
+
+    async def update(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        """Update an existing task with a single UPDATE ... RETURNING.
+
+        The statement also returns the task's previous user and status, to move its count.
+        """
+        updated = await self._update_returning_old(task_id, changes, await self._next_change_seq())
+        if updated is None:
+            await self.session.rollback()
+            return None
+        row, old = updated
+        await self._apply_counts(counts.deltas([old], [(row.user_id, row.status)]))
+        await self.session.commit()
+        return q.to_domain(row)
+
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task by id with a single DELETE ... RETURNING, leaving a tombstone."""
+        return bool(await self._delete_with_tombstones([task_id]))
+
+    async def create_many(self, tasks: list[Task]) -> list[Task]:
+        """Create several tasks with a multi-row INSERT ... RETURNING and one commit."""
+        if not tasks:
+            return []
+        params = q.insert_many_params(tasks, await self._next_change_seq())
+        rows = (await self._execute_write(q.insert_many(), "One or more users not found", params)).all()
+        await self._apply_counts(counts.deltas((), [(row.user_id, row.status) for row in rows]))
+        await self.session.commit()
+        return q.to_created(rows)
+
+    async def update_many(self, changes: dict[int, TaskUpdate]) -> list[Task]:
+        """Update several tasks with one executemany UPDATE, a SELECT on each side of it and one commit."""
+        if not changes:
+            return []
+        params = q.update_many_params(changes, await self._next_change_seq())
+        old = (await self.session.execute(counts.select_keys(changes))).all()
+        await self._execute_write(q.update_many(), "One or more users not found", params)
+        rows = (await self.session.execute(q.select_by_ids(changes))).all()
+        await self._apply_counts(
+            counts.deltas([(row.user_id, row.status) for row in old], [(row.user_id, row.status) for row in rows])
+        )
+        await self.session.commit()
+        return [q.to_domain(row) for row in rows]
+
+    async def delete_many(self, task_ids: list[int]) -> set[int]:
+        """Delete several tasks with a single DELETE ... RETURNING, leaving tombstones."""
+        if not task_ids:
+            return set()
+        return await self._delete_with_tombstones(task_ids)
+
+    async def get_by_id(self, task_id: int) -> Task | None:
+        """Get a task by id."""
+        row = (await self.session.execute(q.select_by_id(task_id), bind_arguments=REPLICA_READ)).first()
+        if not row:
+            return None
+        return q.to_domain(row)
+
+    async def get_by_user_id(self, user_id: int) -> list[Task]:
+        """Get all tasks for a specific user."""
+        rows = (await self.session.execute(q.select_by_user_id(user_id), bind_arguments=REPLICA_READ)).all()
+        return [q.to_domain(row) for row in rows]
+
+    async def get_all(self) -> list[Task]:
+        """Get all tasks ordered by creation time."""
+        rows = (await self.session.execute(q.select_all(), bind_arguments=REPLICA_READ)).all()
+        return [q.to_domain(row) for row in rows]
+
+    async def find(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query, in the query's sort order."""
+        rows = (await self.session.execute(q.select_matching(query), bind_arguments=REPLICA_READ)).all()
+        return [q.to_domain(row) for row in rows]
+
+    async def get_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get a page of matching tasks using keyset pagination over (sort key, id)."""
+        query = query or TaskQuery()
+        rows = (await self.session.execute(q.select_page(limit, cursor, query), bind_arguments=REPLICA_READ)).all()
+        return q.to_page(rows, limit, query)
+
+    async def find_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, in the query's sort order."""
+        return (await self.session.execute(q.select_matching(query), bind_arguments=REPLICA_READ)).all()
+
+    async def get_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows using keyset pagination over (sort key, id)."""
+        query = query or TaskQuery()
+        rows = (await self.session.execute(q.select_page(limit, cursor, query), bind_arguments=REPLICA_READ)).all()
+        return q.to_row_page(rows, limit, query)
+
+    async def stream(self, query: TaskQuery, batch_size: int) -> AsyncIterator[TaskRow]:
+        """Iterate over matching task rows through a server-side cursor, batch_size rows at a time."""
+        result = await self.session.stream(
+            q.select_matching(query).execution_options(yield_per=batch_size), bind_arguments=REPLICA_READ
+        )
+        async for row in result:
+            yield row
+
+    async def search(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of matching task rows through the dialect's full-text index, most relevant first."""
+        query = query or TaskQuery()
+        stmt = search_queries.select_page(text, limit, cursor, query, self._dialect_name())
+        return search_queries.to_page((await self.session.execute(stmt, bind_arguments=REPLICA_READ)).all(), limit)
+
+    async def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the tasks table from its change counter."""
+        return q.to_watermark((await self.session.execute(q.select_watermark(), bind_arguments=REPLICA_READ)).one())
+
+    async def get_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get changes after `since` with three indexed queries: sequence, rows, tombstones.
+
+        The sequence is read first and bounds both lists, so a write committed
+        meanwhile is left for the next token rather than half-reported.
+        """
+        token = q.to_sync_token((await self.session.execute(q.select_sequence())).one(), since)
+        changed = (await self.session.execute(q.select_changed(since, token))).all()
+        deleted_ids = []
+        if since is not None:
+            deleted_ids = list((await self.session.execute(q.select_deleted_ids(since, token))).scalars())
+        return TaskChanges(changed=changed, deleted_ids=deleted_ids, token=token)
+
+    async def purge_tombstones(self, before: datetime) -> int:
+        """Delete tombstones written before a cutoff and advance the compaction horizon."""
+        through = (await self.session.execute(q.select_compactable_seq(before))).scalar_one_or_none()
+        if through is None:
+            return 0
+        removed = (await self.session.execute(q.delete_tombstones_through(through))).rowcount
+        await self.session.execute(q.mark_compacted(through))
+        await self.session.commit()
+        return removed
+
+    async def archive(self, before: datetime, limit: int) -> set[int]:
+        """Move a batch of old DONE tasks to tasks_archive in one transaction, leaving tombstones."""
+        change_seq = await self._next_change_seq()
+        task_ids = (await self.session.execute(q.select_archivable_ids(before, limit))).scalars().all()
+        if not task_ids:
+            await self.session.rollback()
+            return set()
+        now = datetime.now(UTC)
+        await self.session.execute(q.copy_to_archive(task_ids, now))
+        archived = (await self.session.execute(q.delete_tasks(task_ids))).all()
+        archived_ids = {row.id for row in archived}
+        await self.session.execute(q.insert_tombstones(archived_ids, change_seq, now))
+        await self._apply_counts(counts.deltas([(row.user_id, row.status) for row in archived], ()))
+        await self.session.commit()
+        return archived_ids
+
+    async def get_counts(self) -> list[TaskCount]:
+        """Get the non-zero task counts per (user, status) from task_counts."""
+        return (await self.session.execute(counts.select_counts(), bind_arguments=REPLICA_READ)).all()
+
+    async def rebuild_counts(self) -> int:
+        """Replace task_counts with counts recomputed from tasks in one transaction."""
+        # Taking the change sequence holds off task writes until the rebuild commits
+        await self._next_change_seq()
+        await self.session.execute(counts.clear())
+        rebuilt = (await self.session.execute(counts.rebuild())).rowcount
+        await self.session.commit()
+        return rebuilt
+
+    async def _next_change_seq(self) -> int:
+        """Take the next task change sequence value, locking the counter until commit."""
+        return (await self.session.execute(q.next_change_seq())).scalar_one()
+
+    async def _update_returning_old(self, task_id: int, changes: TaskUpdate, change_seq: int):
+        """Update a task, returning its new row and previous count key, or None if it does not exist.
+
+        One statement on PostgreSQL; SQLite cannot return the previous values, so they are read first.
+        """
+        user_not_found = f"User with id {changes.user_id} not found"
+        if self._dialect_name() == "postgresql":
+            stmt = q.update_task_returning_old(task_id, changes, change_seq)
+            row = (await self._execute_write(stmt, user_not_found)).one_or_none()
+            return None if row is None else (row, (row.old_user_id, row.old_status))
+        old = (await self.session.execute(counts.select_keys([task_id]))).one_or_none()
+        if old is None:
+            return None
+        row = (await self._execute_write(q.update_task(task_id, changes, change_seq), user_not_found)).one()
+        return row, (old.user_id, old.status)
+
+    async def _delete_with_tombstones(self, task_ids: list[int]) -> set[int]:
+        """Delete tasks and record a tombstone for each one that existed, in one transaction.
+
+        Ids that match nothing return before a change sequence value is taken, so a miss neither
+        waits on the counter lock nor moves the watermark.
+        """
+        existing = (await self.session.execute(q.select_existing_ids(task_ids))).scalars().all()
+        if not existing:
+            await self.session.rollback()
+            return set()
+        change_seq = await self._next_change_seq()
+        deleted = (await self.session.execute(q.delete_tasks(existing))).all()
+        deleted_ids = {row.id for row in deleted}
+        if deleted_ids:
+            await self.session.execute(q.insert_tombstones(deleted_ids, change_seq, datetime.now(UTC)))
+            await self._apply_counts(counts.deltas([(row.user_id, row.status) for row in deleted], ()))
+        await self.session.commit()
+        return deleted_ids
+
+    async def _apply_counts(self, changes: dict[counts.CountKey, int]) -> None:
+        """Add count deltas to task_counts, if there are any."""
+        if changes:
+            await self.session.execute(counts.apply(changes, self._dialect_name()))
+
+    def _dialect_name(self) -> str:
+        """Name of the database dialect, for statements that differ between PostgreSQL and SQLite."""
+        return self.session.get_bind().dialect.name
+
+    async def _execute_write(self, stmt, user_not_found: str, params: list[dict] | None = None):
+        """Execute a write statement, translating user_id foreign key violations to ValueError."""
+        try:
+            return await self.session.execute(stmt, params)
+        except IntegrityError as e:
+            await self.session.rollback()
+            if q.is_foreign_key_violation(e):
+                raise ValueError(user_not_found) from e
+            raise
@@ -0,0 +1,71 @@
+"""SQLAlchemy async user repository implementation."""
+
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models import TableWatermark, User, UserRow
+from domain.ports import AsyncUserRepository
+from infrastructure.database.routing import REPLICA_READ
+
+from . import user_queries as q
+
+
+class SQLAlchemyAsyncUserRepository(AsyncUserRepository):
+    """SQLAlchemy AsyncSession implementation of user repository.
+
+    Query-only reads are marked REPLICA_READ, for a RoutingSession to send to a read replica.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with async database session."""
+        self.session = session
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        """Get a user by id."""
+        row = (await self.session.execute(q.select_by_id(user_id), bind_arguments=REPLICA_READ)).first()
+        if not row:
+            return None
+        return q.to_domain(row)
+
+    async def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids in a single IN query."""
+        if not user_ids:
+            return []
+        rows = (await self.session.execute(q.select_by_ids(user_ids), bind_arguments=REPLICA_READ)).all()
+        return [q.to_domain(row) for row in rows]
+
+    async def get_by_name(self, first_name: str, last_name: str) -> User | None:
+        """Get a user by first and last name."""
+        row = (await self.session.execute(q.select_by_name(first_name, last_name), bind_arguments=REPLICA_READ)).first()
+        if not row:
+            return None
+        return q.to_domain(row)
+
+    async def create(self, user: User) -> User:
+        """Create a new user, bumping the users change counter in the same transaction."""
+        await self.session.execute(q.next_change_seq())
+        row = (await self.session.execute(q.insert_user(user))).one()
+        await self.session.commit()
+        return q.to_domain(row)
+
+    async def get_all(self) -> list[User]:
+        """Get all users."""
+        rows = (await self.session.execute(q.select_all(), bind_arguments=REPLICA_READ)).all()
+        return [q.to_domain(row) for row in rows]
+
+    async def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users."""
+        return (await self.session.execute(q.select_all_rows(), bind_arguments=REPLICA_READ)).all()
+
+    async def stream(self, batch_size: int) -> AsyncIterator[UserRow]:
+        """Iterate over user rows through a server-side cursor, batch_size rows at a time."""
+        result = await self.session.stream(
+            q.select_all_rows().execution_options(yield_per=batch_size), bind_arguments=REPLICA_READ
+        )
+        async for row in result:
+            yield row
+
+    async def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the users table from its change counter."""
+        return q.to_watermark((await self.session.execute(q.select_watermark(), bind_arguments=REPLICA_READ)).one())
@@ -1,84 +1,268 @@
 """SQLAlchemy task repository implementation."""
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from domain.models import Task, TaskStatus
+from domain.models import (
+    SearchCursor,
+    SyncToken,
+    TableWatermark,
+    Task,
+    TaskChanges,
+    TaskCount,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRow,
+    TaskRowPage,
+    TaskSearchPage,
+    TaskUpdate,
+)
 from domain.ports import TaskRepository
-from infrastructure.database.models import TaskModel
+from infrastructure.database.pipeline import pipelined
+from infrastructure.database.routing import REPLICA_READ
+
+from . import count_queries as counts
+from . import search_queries
+from . import task_queries as q
 
 
 class SQLAlchemyTaskRepository(TaskRepository):
-    """SQLAlchemy implementation of task repository."""
+    """SQLAlchemy implementation of task repository.
+
+    Every write also adjusts task_counts in its transaction (see count_queries).
+    Query-only reads are marked REPLICA_READ, for a RoutingSession to send to a read replica.
+    """
 
     def __init__(self, session: Session):
         """Initialize repository with database session."""
         self.session = session
 
     def create(self, task: Task) -> Task:
-        """Create a new task."""
-        db_task = TaskModel(
-            description=task.description,
-            status=task.status,
-            user_id=task.user_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-        self.session.add(db_task)
+        """Create a new task with a single INSERT ... RETURNING."""
+        stmt = q.insert_task(task, self._next_change_seq())
+        row = self._execute_write(stmt, f"User with id {task.user_id} not found").one()
+        self._apply_counts(counts.deltas((), [(row.user_id, row.status)]))
         self.session.commit()
-        self.session.refresh(db_task)
-        return self._to_domain(db_task)
+        return q.to_domain(row)
 
-    def update(self, task: Task) -> Task:
-        """Update an existing task."""
-        db_task = self.session.query(TaskModel).filter(TaskModel.id == task.id).first()
-        if not db_task:
-            raise ValueError(f"Task with id {task.id} not found")
-
-        db_task.description = task.description
-        db_task.status = task.status
-        db_task.user_id = task.user_id
-        db_task.updated_at = datetime.now(UTC)
+    def update(self, task_id: int, changes: TaskUpdate) -> Task | None:
+        """Update an existing task with a single UPDATE ... RETURNING.
 
+        The statement also returns the task's previous user and status, to move its count.
+        """
+        updated = self._update_returning_old(task_id, changes, self._next_change_seq())
+        if updated is None:
+            self.session.rollback()
+            return None
+        row, old = updated
+        self._apply_counts(counts.deltas([old], [(row.user_id, row.status)]))
         self.session.commit()
-        self.session.refresh(db_task)
-        return self._to_domain(db_task)
+        return q.to_domain(row)
 
     def delete(self, task_id: int) -> bool:
-        """Delete a task by id."""
-        db_task = self.session.query(TaskModel).filter(TaskModel.id == task_id).first()
-        if not db_task:
-            return False
+        """Delete a task by id with a single DELETE ... RETURNING, leaving a tombstone."""
+        return bool(self._delete_with_tombstones([task_id]))
 
-        self.session.delete(db_task)
+    def create_many(self, tasks: list[Task]) -> list[Task]:
+        """Create several tasks with a multi-row INSERT ... RETURNING and one commit."""
+        if not tasks:
+            return []
+        params = q.insert_many_params(tasks, self._next_change_seq())
+        rows = self._execute_write(q.insert_many(), "One or more users not found", params).all()
+        self._apply_counts(counts.deltas((), [(row.user_id, row.status) for row in rows]))
         self.session.commit()
-        return True
+        return q.to_created(rows)
+
+    def update_many(self, changes: dict[int, TaskUpdate]) -> list[Task]:
+        """Update several tasks with one executemany UPDATE, a SELECT on each side of it and one commit."""
+        if not changes:
+            return []
+        params = q.update_many_params(changes, self._next_change_seq())
+        old = self.session.execute(counts.select_keys(changes)).all()
+        self._execute_write(q.update_many(), "One or more users not found", params)
+        rows = self.session.execute(q.select_by_ids(changes)).all()
+        self._apply_counts(
+            counts.deltas([(row.user_id, row.status) for row in old], [(row.user_id, row.status) for row in rows])
+        )
+        self.session.commit()
+        return [q.to_domain(row) for row in rows]
+
+    def delete_many(self, task_ids: list[int]) -> set[int]:
+        """Delete several tasks with a single DELETE ... RETURNING, leaving tombstones."""
+        if not task_ids:
+            return set()
+        return self._delete_with_tombstones(task_ids)
 
     def get_by_id(self, task_id: int) -> Task | None:
         """Get a task by id."""
-        db_task = self.session.query(TaskModel).filter(TaskModel.id == task_id).first()
-        if not db_task:
+        row = self.session.execute(q.select_by_id(task_id), bind_arguments=REPLICA_READ).first()
+        if not row:
             return None
-        return self._to_domain(db_task)
+        return q.to_domain(row)
 
     def get_by_user_id(self, user_id: int) -> list[Task]:
         """Get all tasks for a specific user."""
-        db_tasks = self.session.query(TaskModel).filter(TaskModel.user_id == user_id).all()
-        return [self._to_domain(db_task) for db_task in db_tasks]
+        rows = self.session.execute(q.select_by_user_id(user_id), bind_arguments=REPLICA_READ).all()
+        return [q.to_domain(row) for row in rows]
 
     def get_all(self) -> list[Task]:
         """Get all tasks ordered by creation time."""
-        db_tasks = self.session.query(TaskModel).order_by(TaskModel.created_at.asc()).all()
-        return [self._to_domain(db_task) for db_task in db_tasks]
-
-    def _to_domain(self, db_task: TaskModel) -> Task:
-        """Convert database model to domain model."""
-        return Task(
-            id=db_task.id,
-            description=db_task.description,
-            status=TaskStatus(db_task.status),
-            user_id=db_task.user_id,
-            created_at=db_task.created_at,
-            updated_at=db_task.updated_at,
+        rows = self.session.execute(q.select_all(), bind_arguments=REPLICA_READ).all()
+        return [q.to_domain(row) for row in rows]
+
+    def find(self, query: TaskQuery) -> list[Task]:
+        """Get all tasks matching a query, in the query's sort order."""
+        rows = self.session.execute(q.select_matching(query), bind_arguments=REPLICA_READ).all()
+        return [q.to_domain(row) for row in rows]
+
+    def get_page(self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None) -> TaskPage:
+        """Get a page of matching tasks using keyset pagination over (sort key, id)."""
+        query = query or TaskQuery()
+        rows = self.session.execute(q.select_page(limit, cursor, query), bind_arguments=REPLICA_READ).all()
+        return q.to_page(rows, limit, query)
+
+    def find_rows(self, query: TaskQuery) -> list[TaskRow]:
+        """Get the rows of all tasks matching a query, in the query's sort order."""
+        return self.session.execute(q.select_matching(query), bind_arguments=REPLICA_READ).all()
+
+    def get_rows_page(
+        self, limit: int, cursor: TaskCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskRowPage:
+        """Get a page of task rows using keyset pagination over (sort key, id)."""
+        query = query or TaskQuery()
+        rows = self.session.execute(q.select_page(limit, cursor, query), bind_arguments=REPLICA_READ).all()
+        return q.to_row_page(rows, limit, query)
+
+    def stream(self, query: TaskQuery, batch_size: int) -> Iterator[TaskRow]:
+        """Iterate over matching task rows through a server-side cursor, batch_size rows at a time."""
+        yield from self.session.execute(
+            q.select_matching(query).execution_options(yield_per=batch_size), bind_arguments=REPLICA_READ
+        )
+
+    def search(
+        self, text: str, limit: int, cursor: SearchCursor | None = None, query: TaskQuery | None = None
+    ) -> TaskSearchPage:
+        """Get a page of matching task rows through the dialect's full-text index, most relevant first."""
+        query = query or TaskQuery()
+        stmt = search_queries.select_page(text, limit, cursor, query, self._dialect_name())
+        return search_queries.to_page(self.session.execute(stmt, bind_arguments=REPLICA_READ).all(), limit)
+
+    def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the tasks table from its change counter."""
+        return q.to_watermark(self.session.execute(q.select_watermark(), bind_arguments=REPLICA_READ).one())
+
+    def get_changes(self, since: SyncToken | None) -> TaskChanges:
+        """Get changes after `since` with three indexed queries: sequence, rows, tombstones.
+
+        The sequence is read first and bounds both lists, so a write committed
+        meanwhile is left for the next token rather than half-reported.
+        """
+        token = q.to_sync_token(self.session.execute(q.select_sequence()).one(), since)
+        changed = self.session.execute(q.select_changed(since, token)).all()
+        deleted_ids = (
+            list(self.session.execute(q.select_deleted_ids(since, token)).scalars()) if since is not None else []
         )
+        return TaskChanges(changed=changed, deleted_ids=deleted_ids, token=token)
+
+    def purge_tombstones(self, before: datetime) -> int:
+        """Delete tombstones written before a cutoff and advance the compaction horizon."""
+        through = self.session.execute(q.select_compactable_seq(before)).scalar_one_or_none()
+        if through is None:
+            return 0
+        removed = self.session.execute(q.delete_tombstones_through(through)).rowcount
+        self.session.execute(q.mark_compacted(through))
+        self.session.commit()
+        return removed
+
+    def archive(self, before: datetime, limit: int) -> set[int]:
+        """Move a batch of old DONE tasks to tasks_archive in one transaction, leaving tombstones."""
+        change_seq = self._next_change_seq()
+        task_ids = self.session.execute(q.select_archivable_ids(before, limit)).scalars().all()
+        if not task_ids:
+            self.session.rollback()
+            return set()
+        now = datetime.now(UTC)
+        self.session.execute(q.copy_to_archive(task_ids, now))
+        archived = self.session.execute(q.delete_tasks(task_ids)).all()
+        archived_ids = {row.id for row in archived}
+        with pipelined(self.session):
+            self.session.execute(q.insert_tombstones(archived_ids, change_seq, now))
+            self._apply_counts(counts.deltas([(row.user_id, row.status) for row in archived], ()))
+        self.session.commit()
+        return archived_ids
+
+    def get_counts(self) -> list[TaskCount]:
+        """Get the non-zero task counts per (user, status) from task_counts."""
+        return self.session.execute(counts.select_counts(), bind_arguments=REPLICA_READ).all()
+
+    def rebuild_counts(self) -> int:
+        """Replace task_counts with counts recomputed from tasks in one transaction."""
+        # Taking the change sequence holds off task writes until the rebuild commits
+        self._next_change_seq()
+        self.session.execute(counts.clear())
+        rebuilt = self.session.execute(counts.rebuild()).rowcount
+        self.session.commit()
+        return rebuilt
+
+    def _next_change_seq(self) -> int:
+        """Take the next task change sequence value, locking the counter until commit."""
+        return self.session.execute(q.next_change_seq()).scalar_one()
+
+    def _update_returning_old(self, task_id: int, changes: TaskUpdate, change_seq: int):
+        """Update a task, returning its new row and previous count key, or None if it does not exist.
+
+        One statement on PostgreSQL; SQLite cannot return the previous values, so they are read first.
+        """
+        user_not_found = f"User with id {changes.user_id} not found"
+        if self._dialect_name() == "postgresql":
+            stmt = q.update_task_returning_old(task_id, changes, change_seq)
+            row = self._execute_write(stmt, user_not_found).one_or_none()
+            return None if row is None else (row, (row.old_user_id, row.old_status))
+        old = self.session.execute(counts.select_keys([task_id])).one_or_none()
+        if old is None:
+            return None
+        row = self._execute_write(q.update_task(task_id, changes, change_seq), user_not_found).one()
+        return row, (old.user_id, old.status)
+
+    def _delete_with_tombstones(self, task_ids: list[int]) -> set[int]:
+        """Delete tasks and record a tombstone for each one that existed, in one transaction.
+
+        Ids that match nothing return before a change sequence value is taken, so a miss neither
+        waits on the counter lock nor moves the watermark.
+        """
+        existing = self.session.execute(q.select_existing_ids(task_ids)).scalars().all()
+        if not existing:
+            self.session.rollback()
+            return set()
+        change_seq = self._next_change_seq()
+        deleted = self.session.execute(q.delete_tasks(existing)).all()
+        deleted_ids = {row.id for row in deleted}
+        if deleted_ids:
+            with pipelined(self.session):
+                self.session.execute(q.insert_tombstones(deleted_ids, change_seq, datetime.now(UTC)))
+                self._apply_counts(counts.deltas([(row.user_id, row.status) for row in deleted], ()))
+        self.session.commit()
+        return deleted_ids
+
+    def _apply_counts(self, changes: dict[counts.CountKey, int]) -> None:
+        """Add count deltas to task_counts, if there are any."""
+        if changes:
+            self.session.execute(counts.apply(changes, self._dialect_name()))
+
+    def _dialect_name(self) -> str:
+        """Name of the database dialect, for statements that differ between PostgreSQL and SQLite."""
+        return self.session.get_bind().dialect.name
+
+    def _execute_write(self, stmt, user_not_found: str, params: list[dict] | None = None):
+        """Execute a write statement, translating user_id foreign key violations to ValueError."""
+        try:
+            return self.session.execute(stmt, params)
+        except IntegrityError as e:
+            self.session.rollback()
+            if q.is_foreign_key_violation(e):
+                raise ValueError(user_not_found) from e
+            raise
@@ -1,14 +1,21 @@
 """SQLAlchemy user repository implementation."""
 
+from collections.abc import Iterator
+
 from sqlalchemy.orm import Session
 
-from domain.models import User
+from domain.models import TableWatermark, User, UserRow
 from domain.ports import UserRepository
-from infrastructure.database.models import UserModel
+from infrastructure.database.routing import REPLICA_READ
+
+from . import user_queries as q
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    """SQLAlchemy implementation of user repository."""
+    """SQLAlchemy implementation of user repository.
+
+    Query-only reads are marked REPLICA_READ, for a RoutingSession to send to a read replica.
+    """
 
     def __init__(self, session: Session):
         """Initialize repository with database session."""
@@ -16,48 +23,47 @@ class SQLAlchemyUserRepository(UserRepository):
 
     def get_by_id(self, user_id: int) -> User | None:
         """Get a user by id."""
-        db_user = self.session.query(UserModel).filter(UserModel.id == user_id).first()
-        if not db_user:
+        row = self.session.execute(q.select_by_id(user_id), bind_arguments=REPLICA_READ).first()
+        if not row:
             return None
-        return self._to_domain(db_user)
+        return q.to_domain(row)
+
+    def get_by_ids(self, user_ids: set[int]) -> list[User]:
+        """Get the users with the given ids in a single IN query."""
+        if not user_ids:
+            return []
+        rows = self.session.execute(q.select_by_ids(user_ids), bind_arguments=REPLICA_READ).all()
+        return [q.to_domain(row) for row in rows]
 
     def get_by_name(self, first_name: str, last_name: str) -> User | None:
         """Get a user by first and last name."""
-        db_user = (
-            self.session.query(UserModel)
-            .filter(UserModel.first_name == first_name, UserModel.last_name == last_name)
-            .first()
-        )
-        if not db_user:
+        row = self.session.execute(q.select_by_name(first_name, last_name), bind_arguments=REPLICA_READ).first()
+        if not row:
             return None
-        return self._to_domain(db_user)
+        return q.to_domain(row)
 
     def create(self, user: User) -> User:
-        """Create a new user."""
-        db_user = UserModel(
-            first_name=user.first_name,
-            last_name=user.last_name,
-            email=user.email,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-        self.session.add(db_user)
+        """Create a new user, bumping the users change counter in the same transaction."""
+        self.session.execute(q.next_change_seq())
+        row = self.session.execute(q.insert_user(user)).one()
         self.session.commit()
-        self.session.refresh(db_user)
-        return self._to_domain(db_user)
+        return q.to_domain(row)
 
     def get_all(self) -> list[User]:
         """Get all users."""
-        db_users = self.session.query(UserModel).all()
-        return [self._to_domain(db_user) for db_user in db_users]
-
-    def _to_domain(self, db_user: UserModel) -> User:
-        """Convert database model to domain model."""
-        return User(
-            id=db_user.id,
-            first_name=db_user.first_name,
-            last_name=db_user.last_name,
-            email=db_user.email,
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at,
+        rows = self.session.execute(q.select_all(), bind_arguments=REPLICA_READ).all()
+        return [q.to_domain(row) for row in rows]
+
+    def get_all_rows(self) -> list[UserRow]:
+        """Get the rows of all users."""
+        return self.session.execute(q.select_all_rows(), bind_arguments=REPLICA_READ).all()
+
+    def stream(self, batch_size: int) -> Iterator[UserRow]:
+        """Iterate over user rows through a server-side cursor, batch_size rows at a time."""
+        yield from self.session.execute(
+            q.select_all_rows().execution_options(yield_per=batch_size), bind_arguments=REPLICA_READ
         )
+
+    def get_watermark(self) -> TableWatermark:
+        """Get the watermark of the users table from its change counter."""
+        return q.to_watermark(self.session.execute(q.select_watermark(), bind_arguments=REPLICA_READ).one())
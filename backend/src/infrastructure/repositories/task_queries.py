@@ -0,0 +1,392 @@
+"""SQL statements shared by the sync and async task repositories."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    Delete,
+    Insert,
+    Select,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+
+from domain.models import (
+    SyncToken,
+    SyncTokenExpiredError,
+    TableWatermark,
+    Task,
+    TaskCursor,
+    TaskPage,
+    TaskQuery,
+    TaskRowPage,
+    TaskStatus,
+    TaskUpdate,
+)
+from infrastructure.database.models import ChangeCounterModel, TaskArchiveModel, TaskModel, TaskTombstoneModel
+
+from . import change_queries
+
+# Columns selected and returned by task statements, in Task (and TaskRow) field order
+TASK_COLUMNS = (
+    TaskModel.id,
+    TaskModel.description,
+    TaskModel.status,
+    TaskModel.user_id,
+    TaskModel.created_at,
+    TaskModel.updated_at,
+)
+
+# The same columns of tasks_archive
+ARCHIVE_COLUMNS = (
+    TaskArchiveModel.id,
+    TaskArchiveModel.description,
+    TaskArchiveModel.status,
+    TaskArchiveModel.user_id,
+    TaskArchiveModel.created_at,
+    TaskArchiveModel.updated_at,
+)
+
+# Row of change_counters holding the task change sequence
+SEQUENCE_NAME = "tasks"
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Check whether an integrity error was raised by a foreign key constraint."""
+    # PostgreSQL drivers report SQLSTATE 23503; SQLite only has a message
+    sqlstate = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+    return sqlstate == "23503" or "FOREIGN KEY constraint failed" in str(error.orig)
+
+
+def to_domain(row) -> Task:
+    """Convert a TaskModel (or a row with TASK_COLUMNS) to a domain task.
+
+    Stored rows already satisfy the table constraints, and the Enum column
+    type yields TaskStatus members, so the task is hydrated without validation.
+    """
+    return Task.from_trusted(row.id, row.description, row.status, row.user_id, row.created_at, row.updated_at)
+
+
+def next_change_seq() -> Update:
+    """UPDATE ... RETURNING the next task change sequence value (see change_queries)."""
+    return change_queries.bump(SEQUENCE_NAME)
+
+
+def insert_task(task: Task, change_seq: int) -> Insert:
+    """INSERT ... RETURNING for a single task."""
+    return (
+        insert(TaskModel)
+        .values(
+            description=task.description,
+            status=task.status,
+            user_id=task.user_id,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            change_seq=change_seq,
+            created_seq=change_seq,
+        )
+        .returning(*TASK_COLUMNS)
+    )
+
+
+def update_task(task_id: int, changes: TaskUpdate, change_seq: int) -> Update:
+    """UPDATE ... RETURNING for a single task."""
+    return (
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(_update_values(changes, change_seq))
+        .returning(*TASK_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def update_task_returning_old(task_id: int, changes: TaskUpdate, change_seq: int) -> Update:
+    """UPDATE ... FROM (SELECT ... FOR UPDATE) ... RETURNING a task with its previous user_id and status.
+
+    PostgreSQL only: SQLite's RETURNING cannot reference the FROM clause.
+    """
+    old = (
+        select(TaskModel.id, TaskModel.user_id, TaskModel.status)
+        .where(TaskModel.id == task_id)
+        .with_for_update()
+        .subquery("old")
+    )
+    return (
+        update(TaskModel)
+        .where(TaskModel.id == old.c.id)
+        .values(_update_values(changes, change_seq))
+        .returning(*TASK_COLUMNS, old.c.user_id.label("old_user_id"), old.c.status.label("old_status"))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _update_values(changes: TaskUpdate, change_seq: int) -> dict:
+    """SET values of a single task update."""
+    return {
+        "description": changes.description,
+        "status": changes.status,
+        "user_id": changes.user_id,
+        "updated_at": changes.updated_at,
+        "change_seq": change_seq,
+    }
+
+
+def delete_tasks(task_ids: list[int]) -> Delete:
+    """DELETE ... RETURNING (id, user_id, status) for a set of tasks."""
+    return (
+        delete(TaskModel)
+        .where(TaskModel.id.in_(task_ids))
+        .returning(TaskModel.id, TaskModel.user_id, TaskModel.status)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def insert_tombstones(task_ids, change_seq: int, deleted_at: datetime) -> Insert:
+    """Multi-row INSERT of tombstones for deleted tasks."""
+    return insert(TaskTombstoneModel).values(
+        [{"task_id": task_id, "change_seq": change_seq, "deleted_at": deleted_at} for task_id in task_ids]
+    )
+
+
+def insert_many() -> Insert:
+    """Multi-row INSERT ... RETURNING; execute with insert_many_params()."""
+    return insert(TaskModel).returning(*TASK_COLUMNS)
+
+
+def insert_many_params(tasks: list[Task], change_seq: int) -> list[dict]:
+    """Parameter sets for insert_many()."""
+    return [
+        {
+            "description": task.description,
+            "status": task.status,
+            "user_id": task.user_id,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+            "change_seq": change_seq,
+            "created_seq": change_seq,
+        }
+        for task in tasks
+    ]
+
+
+def to_created(rows) -> list[Task]:
+    """Convert the rows returned by insert_many() to tasks in input order."""
+    # RETURNING order is unspecified, but autoincrement ids are assigned in VALUES
+    # order, so sorting by id restores input order without a sentinel column
+    # (sort_by_parameter_order would fall back to row-at-a-time on SQLite)
+    return [to_domain(row) for row in sorted(rows, key=lambda row: row.id)]
+
+
+def update_many() -> Update:
+    """Executemany UPDATE keyed by task_id; execute with update_many_params()."""
+    # Core UPDATE: the SET clause is derived from the parameter keys
+    table = TaskModel.__table__
+    return update(table).where(table.c.id == bindparam("task_id"))
+
+
+def update_many_params(changes: dict[int, TaskUpdate], change_seq: int) -> list[dict]:
+    """Parameter sets for update_many()."""
+    return [
+        {
+            "task_id": task_id,
+            "description": change.description,
+            "status": change.status,
+            "user_id": change.user_id,
+            "updated_at": change.updated_at,
+            "change_seq": change_seq,
+        }
+        for task_id, change in changes.items()
+    ]
+
+
+def select_by_id(task_id: int) -> Select:
+    """SELECT a single task by id."""
+    return select(*TASK_COLUMNS).where(TaskModel.id == task_id)
+
+
+def select_by_ids(task_ids) -> Select:
+    """SELECT tasks by a set of ids."""
+    return select(*TASK_COLUMNS).where(TaskModel.id.in_(task_ids))
+
+
+def select_by_user_id(user_id: int) -> Select:
+    """SELECT all tasks of a user."""
+    return select(*TASK_COLUMNS).where(TaskModel.user_id == user_id)
+
+
+def select_existing_ids(task_ids) -> Select:
+    """SELECT the ids of a set that still exist, without locking the rows."""
+    return select(TaskModel.id).where(TaskModel.id.in_(task_ids))
+
+
+def select_all() -> Select:
+    """SELECT all tasks ordered by creation time."""
+    return select(*TASK_COLUMNS).order_by(TaskModel.created_at.asc())
+
+
+def select_matching(query: TaskQuery) -> Select:
+    """SELECT tasks matching a query, in the query's sort order."""
+    source = _source(query)
+    return _filtered(query, source).order_by(*_order_by(query, source))
+
+
+def select_page(limit: int, cursor: TaskCursor | None, query: TaskQuery) -> Select:
+    """SELECT one keyset page of matching tasks, plus one row to detect a next page."""
+    source = _source(query)
+    stmt = _filtered(query, source)
+    if cursor is not None:
+        position = tuple_(source.c[query.sort.field], source.c.id)
+        after = tuple_(cursor.sort_key, cursor.id)
+        stmt = stmt.where(position < after if query.sort.descending else position > after)
+    return stmt.order_by(*_order_by(query, source)).limit(limit + 1)
+
+
+def to_page(rows, limit: int, query: TaskQuery) -> TaskPage:
+    """Build a page of tasks from the rows of select_page()."""
+    return TaskPage(items=[to_domain(row) for row in rows[:limit]], next_cursor=_next_cursor(rows, limit, query))
+
+
+def to_row_page(rows, limit: int, query: TaskQuery) -> TaskRowPage:
+    """Build a page of task rows from the rows of select_page()."""
+    return TaskRowPage(items=rows[:limit], next_cursor=_next_cursor(rows, limit, query))
+
+
+def _next_cursor(rows, limit: int, query: TaskQuery) -> TaskCursor | None:
+    """Cursor after the last row of a page, if select_page() found one more row."""
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return TaskCursor(sort_key=getattr(last, query.sort.field), id=last.id)
+
+
+def select_watermark() -> Select:
+    """SELECT the tasks table watermark: the task change counter, one primary-key lookup."""
+    return change_queries.select_value(SEQUENCE_NAME)
+
+
+def to_watermark(row) -> TableWatermark:
+    """Convert the row of a watermark SELECT."""
+    return TableWatermark(version=row[0])
+
+
+def select_sequence() -> Select:
+    """SELECT the current task change sequence value and compaction horizon."""
+    return select(ChangeCounterModel.value, ChangeCounterModel.compacted_through).where(
+        ChangeCounterModel.name == SEQUENCE_NAME
+    )
+
+
+def to_sync_token(row, since: SyncToken | None) -> SyncToken:
+    """Token for the current sequence value, checking that `since` can still be served.
+
+    Raises SyncTokenExpiredError if tombstones after `since` were compacted
+    away, or if `since` is ahead of the sequence (a token from another database).
+    """
+    value, compacted_through = row
+    if since is not None and not compacted_through <= since.seq <= value:
+        raise SyncTokenExpiredError("Sync token has expired; fetch the full listing again")
+    return SyncToken(seq=value)
+
+
+def select_changed(since: SyncToken | None, token: SyncToken) -> Select:
+    """SELECT tasks written after `since` (all tasks if None) up to `token`, via ix_tasks_change_seq."""
+    stmt = select(*TASK_COLUMNS).where(TaskModel.change_seq <= token.seq)
+    if since is not None:
+        stmt = stmt.where(TaskModel.change_seq > since.seq)
+    return stmt.order_by(TaskModel.change_seq, TaskModel.id)
+
+
+def select_created_ids(task_ids, since: SyncToken) -> Select:
+    """SELECT which of some task ids were inserted after `since`, by primary key."""
+    return select(TaskModel.id).where(TaskModel.id.in_(task_ids), TaskModel.created_seq > since.seq)
+
+
+def select_deleted_ids(since: SyncToken, token: SyncToken) -> Select:
+    """SELECT ids of tasks deleted after `since` up to `token`."""
+    return (
+        select(TaskTombstoneModel.task_id)
+        .where(TaskTombstoneModel.change_seq > since.seq, TaskTombstoneModel.change_seq <= token.seq)
+        .order_by(TaskTombstoneModel.change_seq, TaskTombstoneModel.id)
+    )
+
+
+def select_compactable_seq(before: datetime) -> Select:
+    """SELECT the highest sequence value among tombstones written before a cutoff."""
+    return select(func.max(TaskTombstoneModel.change_seq)).where(TaskTombstoneModel.deleted_at < before)
+
+
+def delete_tombstones_through(change_seq: int) -> Delete:
+    """DELETE tombstones up to a sequence value, so the compaction horizon stays a single number."""
+    return delete(TaskTombstoneModel).where(TaskTombstoneModel.change_seq <= change_seq)
+
+
+def mark_compacted(change_seq: int) -> Update:
+    """UPDATE the compaction horizon; it never moves backwards."""
+    return (
+        update(ChangeCounterModel)
+        .where(ChangeCounterModel.name == SEQUENCE_NAME, ChangeCounterModel.compacted_through < change_seq)
+        .values(compacted_through=change_seq)
+    )
+
+
+def select_archivable_ids(before: datetime, limit: int) -> Select:
+    """SELECT the ids of up to `limit` DONE tasks last updated before a cutoff, lowest first."""
+    return (
+        select(TaskModel.id)
+        .where(TaskModel.status == TaskStatus.DONE, TaskModel.updated_at < before)
+        .order_by(TaskModel.id)
+        .limit(limit)
+    )
+
+
+def copy_to_archive(task_ids, archived_at: datetime) -> Insert:
+    """INSERT ... SELECT tasks into tasks_archive, stamped with when they were archived."""
+    columns = [column.key for column in TASK_COLUMNS] + ["archived_at"]
+    rows = select(*TASK_COLUMNS, literal(archived_at, DateTime)).where(TaskModel.id.in_(task_ids))
+    return insert(TaskArchiveModel).from_select(columns, rows)
+
+
+def _source(query: TaskQuery):
+    """What a listing reads: tasks, or tasks and tasks_archive as one when archived tasks are included."""
+    if not query.include_archived:
+        return TaskModel.__table__
+    return union_all(select(*TASK_COLUMNS), select(*ARCHIVE_COLUMNS)).subquery("all_tasks")
+
+
+def _filtered(query: TaskQuery, source) -> Select:
+    """SELECT the task columns of a source with the filters of a TaskQuery applied."""
+    return where_matching(select(*(source.c[column.key] for column in TASK_COLUMNS)), query, source.c)
+
+
+def where_matching(stmt: Select, query: TaskQuery, columns=TaskModel.__table__.c) -> Select:
+    """Add the filters of a TaskQuery to a SELECT over tasks (or over `columns` of the same names)."""
+    if query.user_ids:
+        stmt = stmt.where(columns.user_id.in_(query.user_ids))
+    if query.statuses:
+        stmt = stmt.where(columns.status.in_(query.statuses))
+    if query.created_after is not None:
+        stmt = stmt.where(columns.created_at >= query.created_after)
+    if query.created_before is not None:
+        stmt = stmt.where(columns.created_at < query.created_before)
+    if query.updated_after is not None:
+        stmt = stmt.where(columns.updated_at >= query.updated_after)
+    if query.updated_before is not None:
+        stmt = stmt.where(columns.updated_at < query.updated_before)
+    return stmt
+
+
+def _order_by(query: TaskQuery, source) -> tuple:
+    """ORDER BY clauses for a query's sort order, with id as tie-breaker."""
+    sort_column = source.c[query.sort.field]
+    if query.sort.descending:
+        return sort_column.desc(), source.c.id.desc()
+    return sort_column.asc(), source.c.id.asc()
@@ -0,0 +1,89 @@
+"""SQL statements shared by the sync and async user repositories."""
+
+from sqlalchemy import Insert, Select, Update, insert, select
+
+from domain.models import TableWatermark, User
+from infrastructure.database.models import UserModel
+
+from . import change_queries
+
+# Columns selected and returned by user statements, in User field order
+USER_COLUMNS = (
+    UserModel.id,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.email,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
+
+# Row of change_counters bumped by user writes
+SEQUENCE_NAME = "users"
+
+# Columns of a UserRow, in field order
+USER_ROW_COLUMNS = (
+    UserModel.id,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.created_at,
+)
+
+
+def to_domain(row) -> User:
+    """Convert a UserModel (or a row with USER_COLUMNS) to a domain user, without re-validating it."""
+    return User.from_trusted(row.id, row.first_name, row.last_name, row.email, row.created_at, row.updated_at)
+
+
+def next_change_seq() -> Update:
+    """UPDATE ... RETURNING the next user change sequence value (see change_queries)."""
+    return change_queries.bump(SEQUENCE_NAME)
+
+
+def insert_user(user: User) -> Insert:
+    """INSERT ... RETURNING for a single user."""
+    return (
+        insert(UserModel)
+        .values(
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+        .returning(*USER_COLUMNS)
+    )
+
+
+def select_by_id(user_id: int) -> Select:
+    """SELECT a single user by id."""
+    return select(*USER_COLUMNS).where(UserModel.id == user_id)
+
+
+def select_by_ids(user_ids) -> Select:
+    """SELECT users by a set of ids."""
+    return select(*USER_COLUMNS).where(UserModel.id.in_(user_ids))
+
+
+def select_by_name(first_name: str, last_name: str) -> Select:
+    """SELECT the first user with the given name."""
+    return select(*USER_COLUMNS).where(UserModel.first_name == first_name, UserModel.last_name == last_name).limit(1)
+
+
+def select_all() -> Select:
+    """SELECT all users."""
+    return select(*USER_COLUMNS)
+
+
+def select_all_rows() -> Select:
+    """SELECT the listed columns of all users."""
+    return select(*USER_ROW_COLUMNS)
+
+
+def select_watermark() -> Select:
+    """SELECT the users table watermark: the user change counter, one primary-key lookup."""
+    return change_queries.select_value(SEQUENCE_NAME)
+
+
+def to_watermark(row) -> TableWatermark:
+    """Convert the row of a watermark SELECT."""
+    return TableWatermark(version=row[0])
@@ -1,19 +1,70 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from infrastructure.database import Base, engine
+from infrastructure.cache import get_cache
+from infrastructure.coherence import ChangePoller
+from infrastructure.config import get_settings
+from infrastructure.database import (
+    acheck_database,
+    awarm_up,
+    check_database,
+    get_async_engine,
+    get_engine,
+    get_session_factory,
+    warm_up,
+)
+from infrastructure.events import get_event_hub
+from infrastructure.metrics import instrument_engines
+from presentation.api.async_routes import async_tasks_router, async_users_router
+from presentation.api.change_feed import HubTaskEventPublisher, change_feed_router
+from presentation.api.metrics import MetricsMiddleware, metrics_router
+from presentation.api.query_budget import QueryBudgetMiddleware
 from presentation.api.routes import tasks_router, users_router
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the connection pool before serving, then run the change poller when coherence is enabled.
+
+    Nothing touches the database at import; the schema is left to Alembic migrations.
+    """
+    settings = get_settings()
+    if settings.database_warmup_connections > 0:
+        if settings.async_database:
+            await awarm_up(get_async_engine(), settings.database_warmup_connections)
+        else:
+            await run_in_threadpool(warm_up, get_engine(), settings.database_warmup_connections)
+    if not settings.coherence_enabled:
+        yield
+        return
+    poller = ChangePoller(
+        get_session_factory(),
+        cache=get_cache(),
+        publisher=HubTaskEventPublisher(get_event_hub()),
+        interval_seconds=settings.coherence_poll_seconds,
+        listen=settings.coherence_listen,
+    )
+    poller.start()
+    try:
+        yield
+    finally:
+        poller.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Task Management API",
     description="REST API for task management with Hexagonal architecture",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -25,12 +76,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(tasks_router)
-app.include_router(users_router)
+# Check each request's SQL against its route's declared QueryBudget
+if get_settings().query_budget_mode != "off":
+    instrument_engines()
+    app.add_middleware(QueryBudgetMiddleware, action=get_settings().query_budget_mode)
+
+# Outermost, so the latency recorded covers every other middleware
+if get_settings().metrics_enabled:
+    instrument_engines()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+# Include routers; the async set serves requests through AsyncSession
+if get_settings().async_database:
+    app.include_router(async_tasks_router)
+    app.include_router(async_users_router)
+else:
+    app.include_router(tasks_router)
+    app.include_router(users_router)
+app.include_router(change_feed_router)
 
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint."""
+    """Liveness check: the process is up."""
     return {"status": "healthy"}
+
+
+@app.get("/health/ready")
+async def readiness_check() -> JSONResponse:
+    """Readiness check: database round-trip latency and connection pool saturation.
+
+    Probes through the engine that serves requests; 503 if the database cannot be reached or the pool is exhausted.
+    """
+    if get_settings().async_database:
+        health = await acheck_database(get_async_engine())
+    else:
+        health = await run_in_threadpool(check_database, get_engine())
+    return JSONResponse(
+        {"status": "ready" if health.ready else "unavailable", **asdict(health)},
+        status_code=200 if health.ready else 503,
+    )
+
+
+@app.get("/health/cache")
+def cache_stats():
+    """Read-through cache counters (hits, misses, evictions, ...) of this process."""
+    cache = get_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **asdict(cache.stats())}
+
+
+@app.get("/health/events")
+def event_hub_stats():
+    """Change feed counters (open subscribers, published and dropped) of this process."""
+    return asdict(get_event_hub().stats())
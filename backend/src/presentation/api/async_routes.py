@@ -0,0 +1,300 @@
+"""Async API routes for tasks and users, served through AsyncSession repositories.
+
+These mirror the routes in routes.py; request parsing, error mapping and response
+building are shared through common.py. main.py mounts one set or the other
+depending on Settings.async_database.
+"""
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.services import AsyncTaskService, AsyncUserService
+from domain.models import SearchCursor, SyncToken, TaskQuery
+from domain.ports import TaskEventPublisher
+from infrastructure.cache import CacheBackend, get_cache
+from infrastructure.database import get_async_db, get_async_session_factory
+from infrastructure.metrics import QueryBudget
+from infrastructure.repositories import (
+    CachingAsyncTaskRepository,
+    CachingAsyncUserRepository,
+    SQLAlchemyAsyncTaskRepository,
+    SQLAlchemyAsyncUserRepository,
+)
+
+from .change_feed import get_task_event_publisher
+from .common import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_LENGTH,
+    BoardSummaryResponse,
+    BulkResponse,
+    TaskBulkCreateRequest,
+    TaskBulkDeleteRequest,
+    TaskBulkUpdateRequest,
+    TaskChangesResponse,
+    TaskCreateRequest,
+    TaskPageResponse,
+    TaskResponse,
+    TaskUpdateRequest,
+    UserResponse,
+    decode_param,
+    get_search_query,
+    get_task_query,
+    parse_task_listing,
+    require_search_text,
+    service_errors,
+    task_changes,
+    task_fields,
+    to_board_summary_response,
+    to_bulk_response,
+    to_task_response,
+)
+from .etag import etag_matches, make_etag, not_modified, tag_response
+from .serialization import (
+    TASK_FIELDS,
+    USER_FIELDS,
+    task_changes_response,
+    task_row_page_response,
+    task_rows_response,
+    user_rows_response,
+)
+from .streaming import aencode_chunks, streaming_response, wants_ndjson
+
+async_tasks_router = APIRouter(prefix="/api", tags=["tasks"])
+async_users_router = APIRouter(prefix="/api", tags=["users"])
+
+
+async def stream_tasks(
+    session_factory: async_sessionmaker[AsyncSession], query: TaskQuery, ndjson: bool
+) -> AsyncIterator[bytes]:
+    """Encode all matching tasks in chunks, reading them through a session of its own."""
+    async with session_factory() as db:
+        service = AsyncTaskService(SQLAlchemyAsyncTaskRepository(db), SQLAlchemyAsyncUserRepository(db))
+        async for chunk in aencode_chunks(service.stream_tasks(query), TASK_FIELDS, ndjson):
+            yield chunk
+
+
+async def stream_users(session_factory: async_sessionmaker[AsyncSession], ndjson: bool) -> AsyncIterator[bytes]:
+    """Encode all users in chunks, reading them through a session of its own."""
+    async with session_factory() as db:
+        service = AsyncUserService(SQLAlchemyAsyncUserRepository(db))
+        async for chunk in aencode_chunks(service.stream_users(), USER_FIELDS, ndjson):
+            yield chunk
+
+
+def get_async_task_service(
+    db: AsyncSession = Depends(get_async_db),
+    cache: CacheBackend | None = Depends(get_cache),
+    publisher: TaskEventPublisher | None = Depends(get_task_event_publisher),
+) -> AsyncTaskService:
+    """Get async task service with dependencies, reading through the cache when enabled.
+
+    Committed writes are published to the change feed.
+    """
+    task_repo = SQLAlchemyAsyncTaskRepository(db)
+    user_repo = SQLAlchemyAsyncUserRepository(db)
+    if cache is not None:
+        task_repo = CachingAsyncTaskRepository(task_repo, cache)
+        user_repo = CachingAsyncUserRepository(user_repo, cache)
+    return AsyncTaskService(task_repo, user_repo, publisher)
+
+
+def get_async_user_service(
+    db: AsyncSession = Depends(get_async_db), cache: CacheBackend | None = Depends(get_cache)
+) -> AsyncUserService:
+    """Get async user service with dependencies, reading through the cache when enabled."""
+    user_repo = SQLAlchemyAsyncUserRepository(db)
+    if cache is not None:
+        user_repo = CachingAsyncUserRepository(user_repo, cache)
+    return AsyncUserService(user_repo)
+
+
+@async_tasks_router.post("/tasks", response_model=TaskResponse, status_code=201)
+@QueryBudget(3)  # change counter, INSERT ... RETURNING, count upsert
+async def create_task(
+    request: TaskCreateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse:
+    """Create a new task."""
+    with service_errors(not_found=True):
+        task = await service.create_task(
+            description=request.description,
+            status=request.status,
+            user_id=request.user_id,
+        )
+    return to_task_response(task)
+
+
+# Bulk routes are registered before /tasks/{task_id} so "bulk" is not parsed as an id
+@async_tasks_router.post("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(4)  # users IN, change counter, multi-row INSERT, count upsert
+async def create_tasks_bulk(
+    request: TaskBulkCreateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> BulkResponse:
+    """Create several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(await service.create_tasks(task_fields(request)))
+
+
+@async_tasks_router.put("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(6)  # users IN, change counter, old keys, executemany UPDATE, re-SELECT, count upsert
+async def update_tasks_bulk(
+    request: TaskBulkUpdateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> BulkResponse:
+    """Update several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(await service.update_tasks(task_changes(request)))
+
+
+@async_tasks_router.delete("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(5)  # id lookup, change counter, DELETE ... RETURNING, tombstones, count upsert
+async def delete_tasks_bulk(
+    request: TaskBulkDeleteRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> BulkResponse:
+    """Delete several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(await service.delete_tasks(request.ids))
+
+
+@async_tasks_router.put("/tasks/{task_id}", response_model=TaskResponse)
+@QueryBudget(4)  # change counter, old key, UPDATE ... RETURNING, count upsert
+async def update_task(
+    task_id: int,
+    request: TaskUpdateRequest,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskResponse:
+    """Update an existing task."""
+    with service_errors(not_found=True):
+        task = await service.update_task(
+            task_id=task_id,
+            description=request.description,
+            status=request.status,
+            user_id=request.user_id,
+        )
+    return to_task_response(task)
+
+
+@async_tasks_router.get("/tasks", response_model=list[TaskResponse] | TaskPageResponse)
+@QueryBudget(2)  # watermark, then the page, listing or stream
+async def get_tasks(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    stream: bool = Query(False, description="Stream the full listing as a chunked JSON array"),
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+    query: TaskQuery = Depends(get_task_query),
+    service: AsyncTaskService = Depends(get_async_task_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> list[TaskResponse] | TaskPageResponse:
+    """Get all matching tasks, or a single page of them when limit or cursor is given.
+
+    Without limit or cursor, the listing is streamed when requested with
+    stream=true (JSON array) or Accept: application/x-ndjson (one task per line).
+    Responses carry a weak ETag derived from the tasks table watermark; a
+    matching If-None-Match is answered with 304 without loading any rows.
+    """
+    listing = parse_task_listing(limit, cursor, stream, accept)
+    with service_errors():
+        # The watermark is read before the rows, so a tag is never newer than its body
+        etag = make_etag(await service.get_tasks_watermark(), request, listing.ndjson)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        if listing.streamed:
+            response = streaming_response(stream_tasks(session_factory, query, listing.ndjson), listing.ndjson)
+        elif listing.paged:
+            response = task_row_page_response(
+                await service.get_task_rows_page(listing.page_size, listing.cursor, query)
+            )
+        else:
+            # Listings are encoded straight from column rows, bypassing response_model
+            response = task_rows_response(await service.find_task_rows(query))
+    return tag_response(response, etag)
+
+
+@async_tasks_router.get("/tasks/search", response_model=TaskPageResponse)
+@QueryBudget(1)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_LENGTH, description="Terms the description must contain"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    query: TaskQuery = Depends(get_search_query),
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskPageResponse:
+    """Get a page of the tasks whose description contains every term of q, most relevant first."""
+    require_search_text(q)
+    page_cursor = decode_param(SearchCursor.decode, cursor)
+    with service_errors():
+        return task_row_page_response(await service.search_tasks(q, limit, page_cursor, query))
+
+
+@async_tasks_router.get("/tasks/changes", response_model=TaskChangesResponse)
+@QueryBudget(3)  # sequence, changed rows, tombstones
+async def get_task_changes(
+    since: str | None = Query(None, description="next_token of the previous response; omit for a full sync"),
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> TaskChangesResponse:
+    """Get the tasks created or updated and the ids deleted since a sync token.
+
+    Without a token every task is returned. A token older than the tombstone
+    retention window is answered with 410; the client then syncs from scratch.
+    """
+    sync_token = decode_param(SyncToken.decode, since)
+    with service_errors():
+        return task_changes_response(await service.get_task_changes(sync_token))
+
+
+@async_tasks_router.get("/board/summary", response_model=BoardSummaryResponse)
+@QueryBudget(1)
+async def get_board_summary(service: AsyncTaskService = Depends(get_async_task_service)) -> BoardSummaryResponse:
+    """Get the number of tasks per status, overall and per user.
+
+    Served from counters maintained by every task write, so the cost depends
+    on the number of users, not of tasks.
+    """
+    with service_errors():
+        return to_board_summary_response(await service.get_board_summary())
+
+
+@async_tasks_router.delete("/tasks/{task_id}", status_code=204)
+@QueryBudget(5)  # id lookup, change counter, DELETE ... RETURNING, tombstone, count upsert
+async def delete_task(
+    task_id: int,
+    service: AsyncTaskService = Depends(get_async_task_service),
+) -> None:
+    """Delete a task."""
+    with service_errors(not_found=True):
+        await service.delete_task(task_id)
+
+
+@async_users_router.get("/users", response_model=list[UserResponse])
+@QueryBudget(2)  # watermark, then the listing or stream
+async def get_users(
+    request: Request,
+    stream: bool = Query(False, description="Stream the full listing as a chunked JSON array"),
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+    service: AsyncUserService = Depends(get_async_user_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> list[UserResponse]:
+    """Get all users, streamed when requested with stream=true or Accept: application/x-ndjson.
+
+    Responses carry a weak ETag derived from the users table watermark.
+    """
+    ndjson = wants_ndjson(accept)
+    with service_errors():
+        etag = make_etag(await service.get_users_watermark(), request, ndjson)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        if stream or ndjson:
+            response = streaming_response(stream_users(session_factory, ndjson), ndjson)
+        else:
+            response = user_rows_response(await service.get_all_user_rows())
+    return tag_response(response, etag)
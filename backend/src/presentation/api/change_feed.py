@@ -0,0 +1,103 @@
+"""Server-Sent Events change feed of committed task writes.
+
+Services (or, with coherence enabled, the change poller) publish task events
+through HubTaskEventPublisher, which encodes each event once into an SSE
+message and hands it to the process's event hub; every open
+GET /api/tasks/events stream receives it from its own bounded queue.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from domain.models import TaskEvent
+from domain.ports import TaskEventPublisher
+from infrastructure.config import get_settings
+from infrastructure.events import EventHub, get_event_hub
+
+from .serialization import TASK_FIELDS, encode
+
+change_feed_router = APIRouter(prefix="/api", tags=["tasks"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Reconnection delay suggested to EventSource clients, in milliseconds
+RETRY_MILLISECONDS = 3000
+
+# Comment line sent on idle streams so proxies keep them open and dead peers are noticed
+KEEPALIVE = b": keepalive\n\n"
+
+# Last message of a stream whose client fell too far behind; it should resync via /api/tasks/changes
+DROPPED = b"event: dropped\ndata: {}\n\n"
+
+
+def encode_event(event: TaskEvent) -> bytes:
+    """Encode a task event as one SSE message, with the task as GET /api/tasks lists it."""
+    data = {"task_id": event.task_id}
+    if event.task is not None:
+        data["task"] = {field: getattr(event.task, field) for field in TASK_FIELDS}
+    return b"event: " + event.type.value.encode() + b"\ndata: " + encode(data) + b"\n\n"
+
+
+class HubTaskEventPublisher(TaskEventPublisher):
+    """Publishes task events to the SSE subscribers of an event hub."""
+
+    def __init__(self, hub: EventHub):
+        """Initialize with the hub to publish to."""
+        self.hub = hub
+
+    def publish(self, events: Sequence[TaskEvent]) -> None:
+        """Encode events once and fan them out; skipped when nobody is listening."""
+        if self.hub.has_subscribers:
+            self.hub.publish([encode_event(event) for event in events])
+
+
+@lru_cache
+def get_task_event_publisher() -> TaskEventPublisher | None:
+    """Get the publisher services use to feed the change feed.
+
+    None when coherence is enabled: the change poller then publishes every
+    process's writes, this one's included, so services must not publish too.
+    """
+    if get_settings().coherence_enabled:
+        return None
+    return HubTaskEventPublisher(get_event_hub())
+
+
+async def event_stream(hub: EventHub, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+    """Yield the SSE messages of one subscriber until it disconnects or is dropped."""
+    subscription = hub.subscribe()
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n".encode()
+        while True:
+            try:
+                async with asyncio.timeout(heartbeat_seconds):
+                    message = await subscription.get()
+            except TimeoutError:
+                yield KEEPALIVE
+                continue
+            if message is None:
+                yield DROPPED
+                return
+            yield message
+    finally:
+        subscription.close()
+
+
+@change_feed_router.get("/tasks/events")
+async def task_events(hub: EventHub = Depends(get_event_hub)) -> StreamingResponse:
+    """Stream task created/updated/deleted events as Server-Sent Events.
+
+    Only writes committed by this process are seen, unless coherence is
+    enabled, in which case the change poller relays every process's. A client that cannot keep
+    up receives a final `dropped` event; it should then resync with
+    GET /api/tasks/changes and reconnect.
+    """
+    return StreamingResponse(
+        event_stream(hub, get_settings().event_heartbeat_seconds),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
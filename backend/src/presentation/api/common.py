@@ -0,0 +1,308 @@
+"""Request models, parsing, error mapping and response building shared by the sync and async routers.
+
+routes.py and async_routes.py differ only in awaiting their services; everything
+around the service calls lives here, so the two route sets answer alike.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, Field
+
+from domain.models import (
+    BoardSummary,
+    BulkItemResult,
+    SyncTokenExpiredError,
+    Task,
+    TaskCursor,
+    TaskFields,
+    TaskQuery,
+    TaskSortOrder,
+    TaskStatus,
+)
+
+from .streaming import wants_ndjson
+
+T = TypeVar("T")
+
+# Page size bounds for cursor pagination
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Maximum length of search text
+MAX_SEARCH_LENGTH = 200
+
+# Maximum number of items in one bulk request
+MAX_BULK_ITEMS = 1000
+
+
+# Pydantic models for request validation
+class TaskCreateRequest(BaseModel):
+    """Task creation request."""
+
+    description: str = Field(..., min_length=1, description="Task description")
+    status: TaskStatus = Field(..., description="Task status (TODO, DOING, or DONE)")
+    user_id: int = Field(..., gt=0, description="User ID")
+
+
+class TaskUpdateRequest(BaseModel):
+    """Task update request."""
+
+    description: str = Field(..., min_length=1, description="Task description")
+    status: TaskStatus = Field(..., description="Task status (TODO, DOING, or DONE)")
+    user_id: int = Field(..., gt=0, description="User ID")
+
+
+class TaskBulkCreateRequest(BaseModel):
+    """Bulk task creation request."""
+
+    items: list[TaskCreateRequest] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdateRequest):
+    """Single task update within a bulk request."""
+
+    id: int = Field(..., gt=0, description="Task ID")
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    """Bulk task update request."""
+
+    items: list[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskBulkDeleteRequest(BaseModel):
+    """Bulk task deletion request."""
+
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class TaskResponse(BaseModel):
+    """Task response."""
+
+    id: int
+    description: str
+    status: str
+    user_id: int
+    created_at: str
+    updated_at: str
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class TaskPageResponse(BaseModel):
+    """Page of tasks with the cursor for the next page."""
+
+    items: list[TaskResponse]
+    next_cursor: str | None
+
+
+class TaskChangesResponse(BaseModel):
+    """Tasks changed and deleted since a sync token, with the token to send next time."""
+
+    changed: list[TaskResponse]
+    deleted: list[int]
+    next_token: str
+
+
+class BulkItemResponse(BaseModel):
+    """Outcome of one item of a bulk request."""
+
+    index: int
+    task_id: int | None
+    task: TaskResponse | None
+    error: str | None
+
+
+class BulkResponse(BaseModel):
+    """Per-item outcomes of a bulk request, in request order."""
+
+    results: list[BulkItemResponse]
+
+
+class UserTaskCountsResponse(BaseModel):
+    """Task counts of one user."""
+
+    user_id: int
+    total: int
+    by_status: dict[str, int]
+
+
+class BoardSummaryResponse(BaseModel):
+    """Task counts across the board, per status and per user."""
+
+    total: int
+    by_status: dict[str, int]
+    users: list[UserTaskCountsResponse]
+
+
+class UserResponse(BaseModel):
+    """User response."""
+
+    id: int
+    first_name: str
+    last_name: str
+    created_at: str
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+def to_task_response(task: Task) -> TaskResponse:
+    """Convert a domain task to its API response."""
+    return TaskResponse(
+        id=task.id,
+        description=task.description,
+        status=task.status.value,
+        user_id=task.user_id,
+        created_at=task.created_at.isoformat(),
+        updated_at=task.updated_at.isoformat(),
+    )
+
+
+def to_bulk_response(results: list[BulkItemResult]) -> BulkResponse:
+    """Convert bulk item results to the API response."""
+    return BulkResponse(
+        results=[
+            BulkItemResponse(
+                index=result.index,
+                task_id=result.task_id,
+                task=to_task_response(result.task) if result.task else None,
+                error=result.error,
+            )
+            for result in results
+        ]
+    )
+
+
+def to_board_summary_response(summary: BoardSummary) -> BoardSummaryResponse:
+    """Convert a board summary to its API response."""
+    return BoardSummaryResponse(
+        total=summary.total,
+        by_status={status.value: count for status, count in summary.by_status.items()},
+        users=[
+            UserTaskCountsResponse(
+                user_id=user_id,
+                total=sum(counts.values()),
+                by_status={status.value: count for status, count in counts.items()},
+            )
+            for user_id, counts in summary.by_user.items()
+        ],
+    )
+
+
+def get_task_query(
+    user_id: list[int] | None = Query(None, description="Only tasks of these users (repeatable)"),
+    status: list[TaskStatus] | None = Query(None, description="Only tasks with these statuses (repeatable)"),
+    created_after: datetime | None = Query(None, description="Created at or after this time"),
+    created_before: datetime | None = Query(None, description="Created before this time"),
+    updated_after: datetime | None = Query(None, description="Updated at or after this time"),
+    updated_before: datetime | None = Query(None, description="Updated before this time"),
+    sort: TaskSortOrder = Query(TaskSortOrder.CREATED_ASC, description="Sort order; prefix with '-' for descending"),
+    include_archived: bool = Query(False, description="Also list archived tasks (old DONE tasks)"),
+) -> TaskQuery:
+    """Build a task query from listing query parameters."""
+    return TaskQuery(
+        user_ids=frozenset(user_id or ()),
+        statuses=frozenset(status or ()),
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        sort=sort,
+        include_archived=include_archived,
+    )
+
+
+def get_search_query(
+    user_id: list[int] | None = Query(None, description="Only tasks of these users (repeatable)"),
+    status: list[TaskStatus] | None = Query(None, description="Only tasks with these statuses (repeatable)"),
+) -> TaskQuery:
+    """Build the filters of a task search; results are ordered by relevance, so there is no sort."""
+    return TaskQuery(user_ids=frozenset(user_id or ()), statuses=frozenset(status or ()))
+
+
+def task_fields(request: TaskBulkCreateRequest) -> list[TaskFields]:
+    """Fields of the tasks of a bulk creation, in request order."""
+    return [TaskFields(item.description, item.status, item.user_id) for item in request.items]
+
+
+def task_changes(request: TaskBulkUpdateRequest) -> list[tuple[int, TaskFields]]:
+    """Ids and new fields of the tasks of a bulk update, in request order."""
+    return [(item.id, TaskFields(item.description, item.status, item.user_id)) for item in request.items]
+
+
+def decode_param(decode: Callable[[str], T], value: str | None) -> T | None:
+    """Decode an optional opaque query parameter (cursor or sync token), rejecting a malformed one with 400."""
+    if value is None:
+        return None
+    try:
+        return decode(value)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def require_search_text(q: str) -> None:
+    """Reject search text made only of whitespace with 400."""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search text cannot be blank")
+
+
+@contextmanager
+def service_errors(not_found: bool = False) -> Iterator[None]:
+    """Map errors raised by service calls in the block to HTTP errors.
+
+    An expired sync token is 410; with not_found, a ValueError (unknown task or
+    user) is 404; anything else is 500.
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except SyncTokenExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e)) from e
+    except ValueError as e:
+        if not not_found:
+            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+
+
+@dataclass(frozen=True)
+class TaskListing:
+    """How a task listing request is answered: one page, a streamed body, or one JSON array."""
+
+    limit: int | None
+    cursor: TaskCursor | None
+    stream: bool
+    ndjson: bool
+
+    @property
+    def paged(self) -> bool:
+        """Whether a single page is requested, by limit or cursor."""
+        return self.limit is not None or self.cursor is not None
+
+    @property
+    def streamed(self) -> bool:
+        """Whether the full listing is streamed, as requested with stream=true or NDJSON."""
+        return not self.paged and (self.stream or self.ndjson)
+
+    @property
+    def page_size(self) -> int:
+        """Rows per page."""
+        return self.limit or DEFAULT_PAGE_SIZE
+
+
+def parse_task_listing(limit: int | None, cursor: str | None, stream: bool, accept: str | None) -> TaskListing:
+    """Parse the paging and format parameters of GET /api/tasks, rejecting a malformed cursor with 400."""
+    return TaskListing(limit, decode_param(TaskCursor.decode, cursor), stream, wants_ndjson(accept))
@@ -0,0 +1,40 @@
+"""Weak ETags for listings, derived from table watermarks."""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from domain.models import TableWatermark
+
+
+def make_etag(watermark: TableWatermark, request: Request, ndjson: bool) -> str:
+    """Weak ETag of a listing: the table watermark plus everything that shapes the body.
+
+    Query parameters are sorted so equivalent URLs share a tag.
+    """
+    params = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    raw = f"{request.url.path}?{params}|{ndjson}|{watermark.version}"
+    return f'W/"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """304 response confirming the client's copy is current."""
+    return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept"})
+
+
+def tag_response(response: Response, etag: str) -> Response:
+    """Attach the listing's ETag to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Accept"
+    return response
@@ -0,0 +1,109 @@
+"""Request metrics: ASGI middleware and GET /metrics in the Prometheus text format.
+
+MetricsMiddleware times every HTTP request. It labels the request with its
+method and route template, so /api/tasks/{task_id} is one series however many
+ids are requested; unrouted paths share the "unmatched" route. It also wraps
+the request in measure_queries(), which gives each request's statement count,
+database time and rows.
+
+Metrics are per process. Each worker reports its own and Prometheus sums them.
+"""
+
+import time
+from functools import lru_cache
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import CONTENT_TYPE, Counter, Gauge, Histogram, MetricsRegistry, measure_queries
+
+metrics_router = APIRouter(tags=["health"])
+
+UNMATCHED_ROUTE = "unmatched"
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+DB_SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+ROW_BUCKETS = (0, 1, 10, 100, 1000, 10_000, 100_000)
+
+
+class RequestMetrics:
+    """The HTTP and per-request database metrics of a process."""
+
+    def __init__(self):
+        """Register the metrics in a fresh registry."""
+        self.registry = MetricsRegistry()
+        route = ("method", "route")
+        self.requests = self.registry.register(
+            Counter("http_requests_total", "HTTP requests by route and status code.", (*route, "status"))
+        )
+        self.duration = self.registry.register(
+            Histogram("http_request_duration_seconds", "Time to serve a request, body included.", route)
+        )
+        self.in_flight = self.registry.register(Gauge("http_requests_in_flight", "Requests being served."))
+        self.queries = self.registry.register(
+            Histogram("http_request_db_queries", "SQL statements executed per request.", route, QUERY_BUCKETS)
+        )
+        self.db_seconds = self.registry.register(
+            Histogram("http_request_db_seconds", "Time spent executing SQL per request.", route, DB_SECONDS_BUCKETS)
+        )
+        self.rows = self.registry.register(
+            Histogram("http_request_db_rows", "Rows reported by the database driver per request.", route, ROW_BUCKETS)
+        )
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        return self.registry.render()
+
+
+@lru_cache
+def get_request_metrics() -> RequestMetrics:
+    """Get the process-wide request metrics."""
+    return RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording RequestMetrics for every HTTP request."""
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics | None = None):
+        """Wrap an app, recording into the process-wide metrics unless others are given."""
+        self.app = app
+        self.metrics = metrics or get_request_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, then record its latency, status and database cost."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_recording_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight.inc()
+        started = time.perf_counter()
+        with measure_queries() as cost:
+            try:
+                await self.app(scope, receive, send_recording_status)
+            finally:
+                elapsed = time.perf_counter() - started
+                metrics.in_flight.dec()
+                # Routing stores the matched route in the scope
+                route = scope.get("route")
+                labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+                metrics.requests.inc((*labels, status))
+                metrics.duration.observe(elapsed, labels)
+                metrics.queries.observe(cost.queries, labels)
+                metrics.db_seconds.observe(cost.seconds, labels)
+                metrics.rows.observe(cost.rows, labels)
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Request and database metrics of this process in the Prometheus text format."""
+    return Response(get_request_metrics().render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,39 @@
+"""Runtime query budget checks for routes.
+
+Every API route declares a QueryBudget on its endpoint (see routes.py).
+QueryBudgetMiddleware measures each request with statement shapes and, once
+the response has been sent, checks it against the budget of the matched route.
+In "warn" mode it logs the overrun. In "raise" mode it raises
+QueryBudgetExceededError, which fails tests driven through TestClient and
+shows up as a server error in development. The client already has its response.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.metrics import budget_of, measure_queries
+from infrastructure.metrics.query_budget import report
+
+BUDGET_ACTIONS = ("warn", "raise")
+
+
+class QueryBudgetMiddleware:
+    """Pure ASGI middleware checking each request's SQL against its route's declared budget."""
+
+    def __init__(self, app: ASGIApp, action: str = "warn"):
+        """Wrap an app; action is "warn" (log) or "raise"."""
+        if action not in BUDGET_ACTIONS:
+            raise ValueError(f"Query budget action must be one of {BUDGET_ACTIONS}, not '{action}'")
+        self.app = app
+        self.action = action
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, then report it if its route's budget was exceeded."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with measure_queries(track_shapes=True) as cost:
+            await self.app(scope, receive, send)
+        route = scope.get("route")
+        budget = budget_of(route.endpoint) if route is not None else None
+        if budget is not None:
+            report(budget, cost, f"{scope['method']} {route.path}", self.action)
@@ -1,186 +1,292 @@
 """API routes for tasks and users."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlalchemy.orm import Session, sessionmaker
 
 from application.services import TaskService, UserService
-from domain.models import TaskStatus
-from infrastructure.database import get_db
-from infrastructure.repositories import SQLAlchemyTaskRepository, SQLAlchemyUserRepository
+from domain.models import SearchCursor, SyncToken, TaskQuery
+from domain.ports import TaskEventPublisher
+from infrastructure.cache import CacheBackend, get_cache
+from infrastructure.database import get_db, get_session_factory
+from infrastructure.metrics import QueryBudget
+from infrastructure.repositories import (
+    CachingTaskRepository,
+    CachingUserRepository,
+    SQLAlchemyTaskRepository,
+    SQLAlchemyUserRepository,
+)
+
+from .change_feed import get_task_event_publisher
+from .common import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_LENGTH,
+    BoardSummaryResponse,
+    BulkResponse,
+    TaskBulkCreateRequest,
+    TaskBulkDeleteRequest,
+    TaskBulkUpdateRequest,
+    TaskChangesResponse,
+    TaskCreateRequest,
+    TaskPageResponse,
+    TaskResponse,
+    TaskUpdateRequest,
+    UserResponse,
+    decode_param,
+    get_search_query,
+    get_task_query,
+    parse_task_listing,
+    require_search_text,
+    service_errors,
+    task_changes,
+    task_fields,
+    to_board_summary_response,
+    to_bulk_response,
+    to_task_response,
+)
+from .etag import etag_matches, make_etag, not_modified, tag_response
+from .serialization import (
+    TASK_FIELDS,
+    USER_FIELDS,
+    task_changes_response,
+    task_row_page_response,
+    task_rows_response,
+    user_rows_response,
+)
+from .streaming import encode_chunks, streaming_response, wants_ndjson
 
 # Create separate routers for tasks and users
 tasks_router = APIRouter(prefix="/api", tags=["tasks"])
 users_router = APIRouter(prefix="/api", tags=["users"])
 
 
-# Pydantic models for request validation
-class TaskCreateRequest(BaseModel):
-    """Task creation request."""
-
-    description: str = Field(..., min_length=1, description="Task description")
-    status: TaskStatus = Field(..., description="Task status (TODO, DOING, or DONE)")
-    user_id: int = Field(..., gt=0, description="User ID")
-
-
-class TaskUpdateRequest(BaseModel):
-    """Task update request."""
-
-    description: str = Field(..., min_length=1, description="Task description")
-    status: TaskStatus = Field(..., description="Task status (TODO, DOING, or DONE)")
-    user_id: int = Field(..., gt=0, description="User ID")
-
-
-class TaskResponse(BaseModel):
-    """Task response."""
+def stream_tasks(session_factory: sessionmaker, query: TaskQuery, ndjson: bool) -> Iterator[bytes]:
+    """Encode all matching tasks in chunks, reading them through a session of its own.
 
-    id: int
-    description: str
-    status: str
-    user_id: int
-    created_at: str
-    updated_at: str
+    The request-scoped session is closed before a streaming body is sent, so
+    the stream opens (and closes) its own.
+    """
+    with session_factory() as db:
+        service = TaskService(SQLAlchemyTaskRepository(db), SQLAlchemyUserRepository(db))
+        yield from encode_chunks(service.stream_tasks(query), TASK_FIELDS, ndjson)
 
-    class Config:
-        """Pydantic config."""
 
-        from_attributes = True
+def stream_users(session_factory: sessionmaker, ndjson: bool) -> Iterator[bytes]:
+    """Encode all users in chunks, reading them through a session of its own."""
+    with session_factory() as db:
+        service = UserService(SQLAlchemyUserRepository(db))
+        yield from encode_chunks(service.stream_users(), USER_FIELDS, ndjson)
 
 
-class UserResponse(BaseModel):
-    """User response."""
+def get_task_service(
+    db: Session = Depends(get_db),
+    cache: CacheBackend | None = Depends(get_cache),
+    publisher: TaskEventPublisher | None = Depends(get_task_event_publisher),
+) -> TaskService:
+    """Get task service with dependencies, reading through the cache when enabled.
 
-    id: int
-    first_name: str
-    last_name: str
-    created_at: str
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-
-
-def get_task_service(db: Session = Depends(get_db)) -> TaskService:
-    """Get task service with dependencies."""
+    Committed writes are published to the change feed.
+    """
     task_repo = SQLAlchemyTaskRepository(db)
     user_repo = SQLAlchemyUserRepository(db)
-    return TaskService(task_repo, user_repo)
+    if cache is not None:
+        task_repo = CachingTaskRepository(task_repo, cache)
+        user_repo = CachingUserRepository(user_repo, cache)
+    return TaskService(task_repo, user_repo, publisher)
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    """Get user service with dependencies."""
+def get_user_service(db: Session = Depends(get_db), cache: CacheBackend | None = Depends(get_cache)) -> UserService:
+    """Get user service with dependencies, reading through the cache when enabled."""
     user_repo = SQLAlchemyUserRepository(db)
+    if cache is not None:
+        user_repo = CachingUserRepository(user_repo, cache)
     return UserService(user_repo)
 
 
 @tasks_router.post("/tasks", response_model=TaskResponse, status_code=201)
+@QueryBudget(3)  # change counter, INSERT ... RETURNING, count upsert
 def create_task(
     request: TaskCreateRequest,
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """Create a new task."""
-    try:
+    with service_errors(not_found=True):
         task = service.create_task(
             description=request.description,
             status=request.status,
             user_id=request.user_id,
         )
-        return TaskResponse(
-            id=task.id,
-            description=task.description,
-            status=task.status.value,
-            user_id=task.user_id,
-            created_at=task.created_at.isoformat(),
-            updated_at=task.updated_at.isoformat(),
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+    return to_task_response(task)
+
+
+# Bulk routes are registered before /tasks/{task_id} so "bulk" is not parsed as an id
+@tasks_router.post("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(4)  # users IN, change counter, multi-row INSERT, count upsert
+def create_tasks_bulk(
+    request: TaskBulkCreateRequest,
+    service: TaskService = Depends(get_task_service),
+) -> BulkResponse:
+    """Create several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(service.create_tasks(task_fields(request)))
+
+
+@tasks_router.put("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(6)  # users IN, change counter, old keys, executemany UPDATE, re-SELECT, count upsert
+def update_tasks_bulk(
+    request: TaskBulkUpdateRequest,
+    service: TaskService = Depends(get_task_service),
+) -> BulkResponse:
+    """Update several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(service.update_tasks(task_changes(request)))
+
+
+@tasks_router.delete("/tasks/bulk", response_model=BulkResponse)
+@QueryBudget(5)  # id lookup, change counter, DELETE ... RETURNING, tombstones, count upsert
+def delete_tasks_bulk(
+    request: TaskBulkDeleteRequest,
+    service: TaskService = Depends(get_task_service),
+) -> BulkResponse:
+    """Delete several tasks in one transaction."""
+    with service_errors():
+        return to_bulk_response(service.delete_tasks(request.ids))
 
 
 @tasks_router.put("/tasks/{task_id}", response_model=TaskResponse)
+@QueryBudget(4)  # change counter, old key, UPDATE ... RETURNING, count upsert
 def update_task(
     task_id: int,
     request: TaskUpdateRequest,
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """Update an existing task."""
-    try:
+    with service_errors(not_found=True):
         task = service.update_task(
             task_id=task_id,
             description=request.description,
             status=request.status,
             user_id=request.user_id,
         )
-        return TaskResponse(
-            id=task.id,
-            description=task.description,
-            status=task.status.value,
-            user_id=task.user_id,
-            created_at=task.created_at.isoformat(),
-            updated_at=task.updated_at.isoformat(),
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+    return to_task_response(task)
 
 
-@tasks_router.get("/tasks", response_model=list[TaskResponse])
+@tasks_router.get("/tasks", response_model=list[TaskResponse] | TaskPageResponse)
+@QueryBudget(2)  # watermark, then the page, listing or stream
 def get_tasks(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    stream: bool = Query(False, description="Stream the full listing as a chunked JSON array"),
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+    query: TaskQuery = Depends(get_task_query),
+    service: TaskService = Depends(get_task_service),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> list[TaskResponse] | TaskPageResponse:
+    """Get all matching tasks, or a single page of them when limit or cursor is given.
+
+    Without limit or cursor, the listing is streamed when requested with
+    stream=true (JSON array) or Accept: application/x-ndjson (one task per line).
+    Responses carry a weak ETag derived from the tasks table watermark; a
+    matching If-None-Match is answered with 304 without loading any rows.
+    """
+    listing = parse_task_listing(limit, cursor, stream, accept)
+    with service_errors():
+        # The watermark is read before the rows, so a tag is never newer than its body
+        etag = make_etag(service.get_tasks_watermark(), request, listing.ndjson)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        if listing.streamed:
+            response = streaming_response(stream_tasks(session_factory, query, listing.ndjson), listing.ndjson)
+        elif listing.paged:
+            response = task_row_page_response(service.get_task_rows_page(listing.page_size, listing.cursor, query))
+        else:
+            # Listings are encoded straight from column rows, bypassing response_model
+            response = task_rows_response(service.find_task_rows(query))
+    return tag_response(response, etag)
+
+
+@tasks_router.get("/tasks/search", response_model=TaskPageResponse)
+@QueryBudget(1)
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_LENGTH, description="Terms the description must contain"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    query: TaskQuery = Depends(get_search_query),
     service: TaskService = Depends(get_task_service),
-) -> list[TaskResponse]:
-    """Get all tasks."""
-    try:
-        tasks = service.get_all_tasks()
-        return [
-            TaskResponse(
-                id=task.id,
-                description=task.description,
-                status=task.status.value,
-                user_id=task.user_id,
-                created_at=task.created_at.isoformat(),
-                updated_at=task.updated_at.isoformat(),
-            )
-            for task in tasks
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+) -> TaskPageResponse:
+    """Get a page of the tasks whose description contains every term of q, most relevant first."""
+    require_search_text(q)
+    page_cursor = decode_param(SearchCursor.decode, cursor)
+    with service_errors():
+        return task_row_page_response(service.search_tasks(q, limit, page_cursor, query))
+
+
+@tasks_router.get("/tasks/changes", response_model=TaskChangesResponse)
+@QueryBudget(3)  # sequence, changed rows, tombstones
+def get_task_changes(
+    since: str | None = Query(None, description="next_token of the previous response; omit for a full sync"),
+    service: TaskService = Depends(get_task_service),
+) -> TaskChangesResponse:
+    """Get the tasks created or updated and the ids deleted since a sync token.
+
+    Without a token every task is returned. A token older than the tombstone
+    retention window is answered with 410; the client then syncs from scratch.
+    """
+    sync_token = decode_param(SyncToken.decode, since)
+    with service_errors():
+        return task_changes_response(service.get_task_changes(sync_token))
+
+
+@tasks_router.get("/board/summary", response_model=BoardSummaryResponse)
+@QueryBudget(1)
+def get_board_summary(service: TaskService = Depends(get_task_service)) -> BoardSummaryResponse:
+    """Get the number of tasks per status, overall and per user.
+
+    Served from counters maintained by every task write, so the cost depends
+    on the number of users, not of tasks.
+    """
+    with service_errors():
+        return to_board_summary_response(service.get_board_summary())
 
 
 @tasks_router.delete("/tasks/{task_id}", status_code=204)
+@QueryBudget(5)  # id lookup, change counter, DELETE ... RETURNING, tombstone, count upsert
 def delete_task(
     task_id: int,
     service: TaskService = Depends(get_task_service),
 ) -> None:
     """Delete a task."""
-    try:
+    with service_errors(not_found=True):
         service.delete_task(task_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
 
 
 @users_router.get("/users", response_model=list[UserResponse])
+@QueryBudget(2)  # watermark, then the listing or stream
 def get_users(
+    request: Request,
+    stream: bool = Query(False, description="Stream the full listing as a chunked JSON array"),
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
     service: UserService = Depends(get_user_service),
+    session_factory: sessionmaker = Depends(get_session_factory),
 ) -> list[UserResponse]:
-    """Get all users."""
-    try:
-        users = service.get_all_users()
-        return [
-            UserResponse(
-                id=user.id,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                email=user.email,
-                created_at=user.created_at.isoformat(),
-                updated_at=user.updated_at.isoformat(),
-            )
-            for user in users
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
+    """Get all users, streamed when requested with stream=true or Accept: application/x-ndjson.
+
+    Responses carry a weak ETag derived from the users table watermark.
+    """
+    ndjson = wants_ndjson(accept)
+    with service_errors():
+        etag = make_etag(service.get_users_watermark(), request, ndjson)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        if stream or ndjson:
+            response = streaming_response(stream_users(session_factory, ndjson), ndjson)
+        else:
+            response = user_rows_response(service.get_all_user_rows())
+    return tag_response(response, etag)
@@ -21,6 +21,30 @@ class TaskUpdateRequest(TypedDict):
     user_id: int
 
 
+class TaskBulkCreateRequest(TypedDict):
+    """Bulk task creation request schema."""
+
+    items: list[TaskCreateRequest]
+
+
+class TaskBulkUpdateItem(TaskUpdateRequest):
+    """Bulk task update item schema."""
+
+    id: int
+
+
+class TaskBulkUpdateRequest(TypedDict):
+    """Bulk task update request schema."""
+
+    items: list[TaskBulkUpdateItem]
+
+
+class TaskBulkDeleteRequest(TypedDict):
+    """Bulk task deletion request schema."""
+
+    ids: list[int]
+
+
 class TaskResponse(TypedDict):
     """Task response schema."""
 
@@ -32,6 +56,28 @@ class TaskResponse(TypedDict):
     updated_at: str
 
 
+class TaskPageResponse(TypedDict):
+    """Task page response schema."""
+
+    items: list[TaskResponse]
+    next_cursor: str | None
+
+
+class BulkItemResponse(TypedDict):
+    """Bulk item outcome schema."""
+
+    index: int
+    task_id: int | None
+    task: TaskResponse | None
+    error: str | None
+
+
+class BulkResponse(TypedDict):
+    """Bulk response schema."""
+
+    results: list[BulkItemResponse]
+
+
 class UserResponse(TypedDict):
     """User response schema."""
 
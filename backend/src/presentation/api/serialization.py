@@ -0,0 +1,56 @@
+"""Pre-serialized JSON bodies for listings, encoded straight from column rows.
+
+Listings skip TaskResponse/UserResponse construction and response_model
+validation: rows are zipped with their field names and encoded by orjson,
+which writes enums by value and datetimes in isoformat(). The bytes match
+what the Pydantic path returns through JSONResponse.
+"""
+
+from collections.abc import Iterable
+
+import orjson
+from fastapi.responses import Response
+
+from domain.models import TaskChanges, TaskRow, TaskRowPage, TaskSearchPage, UserRow
+
+TASK_FIELDS = TaskRow._fields
+USER_FIELDS = UserRow._fields
+
+
+def to_dicts(rows: Iterable[tuple], fields: tuple[str, ...]) -> list[dict]:
+    """Pair each row's values with the field names of its read model."""
+    return [dict(zip(fields, row, strict=True)) for row in rows]
+
+
+def encode(content) -> bytes:
+    """Encode a JSON-ready value as compact UTF-8 JSON."""
+    return orjson.dumps(content)
+
+
+def task_rows_response(rows: Iterable[TaskRow]) -> Response:
+    """JSON array of tasks, as returned by GET /api/tasks."""
+    return Response(encode(to_dicts(rows, TASK_FIELDS)), media_type="application/json")
+
+
+def task_row_page_response(page: TaskRowPage | TaskSearchPage) -> Response:
+    """One page of tasks with its next cursor, as returned by GET /api/tasks?limit=N and GET /api/tasks/search."""
+    content = {
+        "items": to_dicts(page.items, TASK_FIELDS),
+        "next_cursor": page.next_cursor.encode() if page.next_cursor else None,
+    }
+    return Response(encode(content), media_type="application/json")
+
+
+def task_changes_response(changes: TaskChanges) -> Response:
+    """Tasks changed and deleted since a sync token, as returned by GET /api/tasks/changes."""
+    content = {
+        "changed": to_dicts(changes.changed, TASK_FIELDS),
+        "deleted": changes.deleted_ids,
+        "next_token": changes.token.encode(),
+    }
+    return Response(encode(content), media_type="application/json")
+
+
+def user_rows_response(rows: Iterable[UserRow]) -> Response:
+    """JSON array of users, as returned by GET /api/users."""
+    return Response(encode(to_dicts(rows, USER_FIELDS)), media_type="application/json")
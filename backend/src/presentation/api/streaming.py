@@ -0,0 +1,78 @@
+"""Chunked encoding of streamed listings as NDJSON or a JSON array."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+
+from .serialization import encode, to_dicts
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+JSON_MEDIA_TYPE = "application/json"
+
+# Rows encoded and written to the socket per chunk
+CHUNK_SIZE = 500
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    """Check whether an Accept header asks for newline-delimited JSON."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def media_type(ndjson: bool) -> str:
+    """Content type of a streamed listing."""
+    return NDJSON_MEDIA_TYPE if ndjson else JSON_MEDIA_TYPE
+
+
+def streaming_response(chunks: Iterator[bytes] | AsyncIterator[bytes], ndjson: bool) -> StreamingResponse:
+    """Response streaming the chunks of encode_chunks() or aencode_chunks()."""
+    return StreamingResponse(chunks, media_type=media_type(ndjson))
+
+
+def encode_chunks(rows: Iterable[tuple], fields: tuple[str, ...], ndjson: bool) -> Iterator[bytes]:
+    """Encode rows as NDJSON lines or as one JSON array, CHUNK_SIZE rows per chunk."""
+    encoder = _Encoder(fields, ndjson)
+    batch: list[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == CHUNK_SIZE:
+            yield encoder.encode(batch)
+            batch = []
+    yield encoder.encode(batch) + encoder.close()
+
+
+async def aencode_chunks(rows: AsyncIterable[tuple], fields: tuple[str, ...], ndjson: bool) -> AsyncIterator[bytes]:
+    """Async counterpart of encode_chunks()."""
+    encoder = _Encoder(fields, ndjson)
+    batch: list[tuple] = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) == CHUNK_SIZE:
+            yield encoder.encode(batch)
+            batch = []
+    yield encoder.encode(batch) + encoder.close()
+
+
+class _Encoder:
+    """Encodes successive batches of one stream, tracking array punctuation."""
+
+    def __init__(self, fields: tuple[str, ...], ndjson: bool):
+        """Initialize for rows with the given field names, as NDJSON or a JSON array."""
+        self.fields = fields
+        self.ndjson = ndjson
+        self.started = False
+
+    def encode(self, batch: list[tuple]) -> bytes:
+        """Encode a batch; the first call of an array stream opens the array."""
+        items = to_dicts(batch, self.fields)
+        if self.ndjson:
+            return b"".join(encode(item) + b"\n" for item in items)
+        # Encode the batch as one array and drop its brackets
+        body = encode(items)[1:-1]
+        if self.started:
+            return b"," + body if body else b""
+        self.started = True
+        return b"[" + body
+
+    def close(self) -> bytes:
+        """Bytes ending the stream."""
+        return b"" if self.ndjson else b"]"
@@ -0,0 +1,94 @@
+"""Tests for AsyncTaskService."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.services import AsyncTaskService
+from domain.models import Task, TaskFields, TaskStatus, User
+
+
+class TestAsyncTaskService:
+    """Test cases for AsyncTaskService."""
+
+    @pytest.fixture
+    def mock_task_repository(self):
+        """Create a mock async task repository."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_user_repository(self):
+        """Create a mock async user repository."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def task_service(self, mock_task_repository, mock_user_repository):
+        """Create an AsyncTaskService instance with mocked repositories."""
+        return AsyncTaskService(mock_task_repository, mock_user_repository)
+
+    @pytest.fixture
+    def sample_task(self):
+        """Create a sample task."""
+        return Task(
+            id=1,
+            description="Test task",
+            status=TaskStatus.TODO,
+            user_id=1,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+
+    def test_create_task_success(self, task_service, mock_task_repository, sample_task):
+        """Test successfully creating a task."""
+        # Arrange
+        mock_task_repository.create.return_value = sample_task
+
+        # Act
+        result = asyncio.run(task_service.create_task(description="Test task", status=TaskStatus.TODO, user_id=1))
+
+        # Assert
+        assert result == sample_task
+        mock_task_repository.create.assert_awaited_once()
+
+    def test_update_task_not_found(self, task_service, mock_task_repository):
+        """Test updating a non-existent task."""
+        # Arrange
+        mock_task_repository.update.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Task with id 999 not found"):
+            asyncio.run(
+                task_service.update_task(task_id=999, description="Updated", status=TaskStatus.DOING, user_id=1)
+            )
+
+    def test_delete_task_not_found(self, task_service, mock_task_repository):
+        """Test deleting a non-existent task."""
+        # Arrange
+        mock_task_repository.delete.return_value = False
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Task with id 999 not found"):
+            asyncio.run(task_service.delete_task(999))
+
+    def test_create_tasks_reports_unknown_users(
+        self, task_service, mock_task_repository, mock_user_repository, sample_task
+    ):
+        """Test that bulk create resolves users once and skips items with unknown users."""
+        # Arrange
+        now = datetime.now(UTC)
+        mock_user_repository.get_by_ids.return_value = [
+            User(id=1, first_name="John", last_name="Doe", email="j@example.com", created_at=now, updated_at=now)
+        ]
+        mock_task_repository.create_many.return_value = [sample_task]
+        items = [TaskFields("Test task", TaskStatus.TODO, 1), TaskFields("Orphan", TaskStatus.TODO, 2)]
+
+        # Act
+        results = asyncio.run(task_service.create_tasks(items))
+
+        # Assert
+        assert results[0].ok and results[0].task_id == 1
+        assert results[1].error == "User with id 2 not found"
+        mock_user_repository.get_by_ids.assert_awaited_once_with({1, 2})
+        assert len(mock_task_repository.create_many.await_args.args[0]) == 1
@@ -1,12 +1,23 @@
 """Tests for TaskService."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
 
 from application.services import TaskService
-from domain.models import Task, TaskStatus, User
+from domain.models import (
+    Task,
+    TaskCount,
+    TaskCursor,
+    TaskEvent,
+    TaskEventType,
+    TaskFields,
+    TaskPage,
+    TaskQuery,
+    TaskStatus,
+    User,
+)
 
 
 class TestTaskService:
@@ -51,12 +62,9 @@ class TestTaskService:
             updated_at=datetime.now(UTC),
         )
 
-    def test_create_task_success(
-        self, task_service, mock_task_repository, mock_user_repository, sample_user, sample_task
-    ):
+    def test_create_task_success(self, task_service, mock_task_repository, mock_user_repository, sample_task):
         """Test successfully creating a task."""
         # Arrange
-        mock_user_repository.get_by_id.return_value = sample_user
         mock_task_repository.create.return_value = sample_task
 
         # Act
@@ -64,28 +72,29 @@ class TestTaskService:
 
         # Assert
         assert result == sample_task
-        mock_user_repository.get_by_id.assert_called_once_with(1)
         mock_task_repository.create.assert_called_once()
+        mock_user_repository.get_by_id.assert_not_called()
 
-    def test_create_task_user_not_found(self, task_service, mock_task_repository, mock_user_repository):
+    def test_create_task_user_not_found(self, task_service, mock_task_repository):
         """Test creating a task with non-existent user."""
         # Arrange
-        mock_user_repository.get_by_id.return_value = None
+        mock_task_repository.create.side_effect = ValueError("User with id 999 not found")
 
         # Act & Assert
         with pytest.raises(ValueError, match="User with id 999 not found"):
             task_service.create_task(description="Test task", status=TaskStatus.TODO, user_id=999)
 
-        mock_user_repository.get_by_id.assert_called_once_with(999)
+    def test_create_task_invalid_description(self, task_service, mock_task_repository):
+        """Test that invalid input is rejected before reaching the repository."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Task description cannot be empty"):
+            task_service.create_task(description="   ", status=TaskStatus.TODO, user_id=1)
+
         mock_task_repository.create.assert_not_called()
 
-    def test_update_task_success(
-        self, task_service, mock_task_repository, mock_user_repository, sample_user, sample_task
-    ):
+    def test_update_task_success(self, task_service, mock_task_repository, mock_user_repository, sample_task):
         """Test successfully updating a task."""
         # Arrange
-        mock_task_repository.get_by_id.return_value = sample_task
-        mock_user_repository.get_by_id.return_value = sample_user
         updated_task = Task(
             id=1,
             description="Updated task",
@@ -101,41 +110,46 @@ class TestTaskService:
 
         # Assert
         assert result == updated_task
-        mock_task_repository.get_by_id.assert_called_once_with(1)
-        mock_user_repository.get_by_id.assert_called_once_with(1)
         mock_task_repository.update.assert_called_once()
+        task_id, changes = mock_task_repository.update.call_args.args
+        assert task_id == 1
+        assert changes.description == "Updated task"
+        assert changes.status == TaskStatus.DOING
+        assert changes.user_id == 1
+        mock_task_repository.get_by_id.assert_not_called()
+        mock_user_repository.get_by_id.assert_not_called()
 
-    def test_update_task_not_found(self, task_service, mock_task_repository, mock_user_repository):
+    def test_update_task_not_found(self, task_service, mock_task_repository):
         """Test updating a non-existent task."""
         # Arrange
-        mock_task_repository.get_by_id.return_value = None
+        mock_task_repository.update.return_value = None
 
         # Act & Assert
         with pytest.raises(ValueError, match="Task with id 999 not found"):
             task_service.update_task(task_id=999, description="Updated task", status=TaskStatus.DOING, user_id=1)
 
-        mock_task_repository.get_by_id.assert_called_once_with(999)
-        mock_user_repository.get_by_id.assert_not_called()
-        mock_task_repository.update.assert_not_called()
+        mock_task_repository.update.assert_called_once()
 
-    def test_update_task_user_not_found(self, task_service, mock_task_repository, mock_user_repository, sample_task):
+    def test_update_task_user_not_found(self, task_service, mock_task_repository):
         """Test updating a task with non-existent user."""
         # Arrange
-        mock_task_repository.get_by_id.return_value = sample_task
-        mock_user_repository.get_by_id.return_value = None
+        mock_task_repository.update.side_effect = ValueError("User with id 999 not found")
 
         # Act & Assert
         with pytest.raises(ValueError, match="User with id 999 not found"):
             task_service.update_task(task_id=1, description="Updated task", status=TaskStatus.DOING, user_id=999)
 
-        mock_task_repository.get_by_id.assert_called_once_with(1)
-        mock_user_repository.get_by_id.assert_called_once_with(999)
+    def test_update_task_invalid_description(self, task_service, mock_task_repository):
+        """Test that invalid changes are rejected before reaching the repository."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Task description cannot exceed 500 characters"):
+            task_service.update_task(task_id=1, description="x" * 501, status=TaskStatus.DOING, user_id=1)
+
         mock_task_repository.update.assert_not_called()
 
-    def test_delete_task_success(self, task_service, mock_task_repository, sample_task):
+    def test_delete_task_success(self, task_service, mock_task_repository):
         """Test successfully deleting a task."""
         # Arrange
-        mock_task_repository.get_by_id.return_value = sample_task
         mock_task_repository.delete.return_value = True
 
         # Act
@@ -143,20 +157,93 @@ class TestTaskService:
 
         # Assert
         assert result is True
-        mock_task_repository.get_by_id.assert_called_once_with(1)
         mock_task_repository.delete.assert_called_once_with(1)
+        mock_task_repository.get_by_id.assert_not_called()
 
     def test_delete_task_not_found(self, task_service, mock_task_repository):
         """Test deleting a non-existent task."""
         # Arrange
-        mock_task_repository.get_by_id.return_value = None
+        mock_task_repository.delete.return_value = False
 
         # Act & Assert
         with pytest.raises(ValueError, match="Task with id 999 not found"):
             task_service.delete_task(task_id=999)
 
-        mock_task_repository.get_by_id.assert_called_once_with(999)
-        mock_task_repository.delete.assert_not_called()
+        mock_task_repository.delete.assert_called_once_with(999)
+
+    def test_create_tasks_reports_per_item_errors(
+        self, task_service, mock_task_repository, mock_user_repository, sample_user, sample_task
+    ):
+        """Test that bulk creation writes valid items once and reports invalid ones."""
+        # Arrange
+        mock_user_repository.get_by_ids.return_value = [sample_user]
+        mock_task_repository.create_many.return_value = [sample_task]
+        items = [
+            TaskFields("Test task", TaskStatus.TODO, 1),
+            TaskFields("   ", TaskStatus.TODO, 1),
+            TaskFields("Orphan", TaskStatus.TODO, 999),
+        ]
+
+        # Act
+        results = task_service.create_tasks(items)
+
+        # Assert
+        assert [result.index for result in results] == [0, 1, 2]
+        assert results[0].ok and results[0].task == sample_task
+        assert results[1].error == "Task description cannot be empty"
+        assert results[2].error == "User with id 999 not found"
+        mock_user_repository.get_by_ids.assert_called_once_with({1, 999})
+        created = mock_task_repository.create_many.call_args.args[0]
+        assert [task.description for task in created] == ["Test task"]
+
+    def test_create_tasks_all_invalid_skips_write(self, task_service, mock_task_repository, mock_user_repository):
+        """Test that no write happens when every item fails validation."""
+        # Act
+        results = task_service.create_tasks([TaskFields("", TaskStatus.TODO, 1)])
+
+        # Assert
+        assert not results[0].ok
+        mock_user_repository.get_by_ids.assert_not_called()
+        mock_task_repository.create_many.assert_not_called()
+
+    def test_update_tasks_reports_per_item_errors(
+        self, task_service, mock_task_repository, mock_user_repository, sample_user, sample_task
+    ):
+        """Test that bulk update reports missing tasks, missing users and duplicates."""
+        # Arrange
+        mock_user_repository.get_by_ids.return_value = [sample_user]
+        mock_task_repository.update_many.return_value = [sample_task]
+        items = [
+            (1, TaskFields("Test task", TaskStatus.DOING, 1)),
+            (2, TaskFields("Missing task", TaskStatus.DOING, 1)),
+            (3, TaskFields("Missing user", TaskStatus.DOING, 999)),
+            (1, TaskFields("Duplicate", TaskStatus.DONE, 1)),
+        ]
+
+        # Act
+        results = task_service.update_tasks(items)
+
+        # Assert
+        assert results[0].task == sample_task
+        assert results[1].error == "Task with id 2 not found"
+        assert results[2].error == "User with id 999 not found"
+        assert results[3].error == "Duplicate task id 1"
+        changes = mock_task_repository.update_many.call_args.args[0]
+        assert set(changes) == {1, 2}
+
+    def test_delete_tasks(self, task_service, mock_task_repository):
+        """Test that bulk delete deletes unique ids once and reports the rest."""
+        # Arrange
+        mock_task_repository.delete_many.return_value = {1}
+
+        # Act
+        results = task_service.delete_tasks([1, 2, 1])
+
+        # Assert
+        assert results[0].ok
+        assert results[1].error == "Task with id 2 not found"
+        assert results[2].error == "Duplicate task id 1"
+        mock_task_repository.delete_many.assert_called_once_with([1, 2])
 
     def test_get_tasks_by_user_success(
         self, task_service, mock_task_repository, mock_user_repository, sample_user, sample_task
@@ -199,6 +286,47 @@ class TestTaskService:
         assert result == tasks
         mock_task_repository.get_all.assert_called_once()
 
+    def test_get_tasks_page(self, task_service, mock_task_repository, sample_task):
+        """Test getting a page of tasks after a cursor."""
+        # Arrange
+        cursor = TaskCursor(sort_key=sample_task.created_at, id=sample_task.id)
+        query = TaskQuery(statuses=frozenset({TaskStatus.TODO}))
+        page = TaskPage(items=[sample_task], next_cursor=None)
+        mock_task_repository.get_page.return_value = page
+
+        # Act
+        result = task_service.get_tasks_page(limit=10, cursor=cursor, query=query)
+
+        # Assert
+        assert result == page
+        mock_task_repository.get_page.assert_called_once_with(10, cursor, query)
+
+    def test_stream_tasks(self, task_service, mock_task_repository, sample_task):
+        """Test streaming tasks passes the query and batch size to the repository."""
+        # Arrange
+        query = TaskQuery(user_ids=frozenset({1}))
+        mock_task_repository.stream.return_value = iter([sample_task])
+
+        # Act
+        result = list(task_service.stream_tasks(query, batch_size=50))
+
+        # Assert
+        assert result == [sample_task]
+        mock_task_repository.stream.assert_called_once_with(query, 50)
+
+    def test_find_tasks(self, task_service, mock_task_repository, sample_task):
+        """Test finding tasks matching a query."""
+        # Arrange
+        query = TaskQuery(user_ids=frozenset({1}))
+        mock_task_repository.find.return_value = [sample_task]
+
+        # Act
+        result = task_service.find_tasks(query)
+
+        # Assert
+        assert result == [sample_task]
+        mock_task_repository.find.assert_called_once_with(query)
+
     def test_get_task_by_id_success(self, task_service, mock_task_repository, sample_task):
         """Test getting a task by id."""
         # Arrange
@@ -221,3 +349,60 @@ class TestTaskService:
             task_service.get_task_by_id(task_id=999)
 
         mock_task_repository.get_by_id.assert_called_once_with(999)
+
+    def test_writes_publish_events(self, mock_task_repository, mock_user_repository, sample_task):
+        """Test that committed writes are published, and failed ones are not."""
+        # Arrange
+        publisher = Mock()
+        service = TaskService(mock_task_repository, mock_user_repository, publisher)
+        mock_task_repository.create.return_value = sample_task
+        mock_task_repository.delete_many.return_value = {2, 1}
+        mock_task_repository.update.return_value = None
+
+        # Act
+        service.create_task(description="Test task", status=TaskStatus.TODO, user_id=1)
+        service.delete_tasks([1, 2, 3])
+        with pytest.raises(ValueError):
+            service.update_task(task_id=9, description="Missing", status=TaskStatus.DONE, user_id=1)
+
+        # Assert
+        published = [call.args[0] for call in publisher.publish.call_args_list]
+        assert published == [
+            [TaskEvent(TaskEventType.CREATED, sample_task.id, sample_task)],
+            [TaskEvent(TaskEventType.DELETED, 1), TaskEvent(TaskEventType.DELETED, 2)],
+        ]
+
+    def test_archive_done_tasks_runs_batches_and_publishes_deletions(self, mock_task_repository, mock_user_repository):
+        """Test that archiving repeats until a short batch and publishes each archived task as deleted."""
+        # Arrange
+        publisher = Mock()
+        service = TaskService(mock_task_repository, mock_user_repository, publisher)
+        mock_task_repository.archive.side_effect = [{2, 1}, {3}]
+
+        # Act
+        archived = service.archive_done_tasks(timedelta(days=90), batch_size=2)
+
+        # Assert
+        assert archived == 3
+        assert mock_task_repository.archive.call_count == 2
+        published = [call.args[0] for call in publisher.publish.call_args_list]
+        assert published == [
+            [TaskEvent(TaskEventType.DELETED, 1), TaskEvent(TaskEventType.DELETED, 2)],
+            [TaskEvent(TaskEventType.DELETED, 3)],
+        ]
+
+    def test_get_board_summary(self, task_service, mock_task_repository):
+        """Test that the board summary is built from the maintained counts."""
+        # Arrange
+        mock_task_repository.get_counts.return_value = [
+            TaskCount(1, TaskStatus.TODO, 2),
+            TaskCount(2, TaskStatus.DONE, 1),
+        ]
+
+        # Act
+        summary = task_service.get_board_summary()
+
+        # Assert
+        assert summary.total == 3
+        assert summary.by_status == {TaskStatus.TODO: 2, TaskStatus.DOING: 0, TaskStatus.DONE: 1}
+        assert list(summary.by_user) == [1, 2]
@@ -0,0 +1 @@
+"""Domain tests package."""
@@ -0,0 +1,70 @@
+"""Tests for domain entity construction."""
+
+from datetime import datetime
+
+import pytest
+
+from domain.models import BoardSummary, Task, TaskCount, TaskStatus, User
+
+NOW = datetime(2025, 1, 1)
+
+
+class TestTask:
+    """Test cases for Task construction paths."""
+
+    def test_constructor_validates(self):
+        """Test that client input is still validated."""
+        with pytest.raises(ValueError, match="Task description cannot be empty"):
+            Task(id=None, description=" ", status=TaskStatus.TODO, user_id=1, created_at=NOW, updated_at=NOW)
+
+    def test_from_trusted_matches_constructor(self):
+        """Test that trusted hydration builds an equal task."""
+        fields = (1, "Stored task", TaskStatus.DONE, 2, NOW, NOW)
+
+        assert Task.from_trusted(*fields) == Task(*fields)
+
+    def test_from_trusted_skips_validation(self):
+        """Test that trusted hydration does not re-run validation."""
+        task = Task.from_trusted(1, "", TaskStatus.TODO, 0, NOW, NOW)
+
+        assert task.description == ""
+
+    def test_is_slotted(self):
+        """Test that tasks carry no per-instance __dict__."""
+        task = Task.from_trusted(1, "Stored task", TaskStatus.TODO, 1, NOW, NOW)
+
+        assert not hasattr(task, "__dict__")
+
+
+class TestUser:
+    """Test cases for User construction paths."""
+
+    def test_constructor_validates_email(self):
+        """Test that client input is still validated."""
+        with pytest.raises(ValueError, match="Invalid email format"):
+            User(id=None, first_name="John", last_name="Doe", email="not-an-email", created_at=NOW, updated_at=NOW)
+
+    def test_from_trusted_matches_constructor(self):
+        """Test that trusted hydration builds an equal, slotted user."""
+        fields = (1, "John", "Doe", "john.doe@example.com", NOW, NOW)
+        user = User.from_trusted(*fields)
+
+        assert user == User(*fields)
+        assert not hasattr(user, "__dict__")
+
+
+class TestBoardSummary:
+    """Test cases for BoardSummary aggregation."""
+
+    def test_from_counts_fills_statuses_and_drops_empty_users(self):
+        """Test that every listed user has every status and users with no tasks are left out."""
+        summary = BoardSummary.from_counts(
+            [TaskCount(2, TaskStatus.DONE, 3), TaskCount(1, TaskStatus.TODO, 2), TaskCount(3, TaskStatus.TODO, 0)]
+        )
+
+        assert summary.by_user == {
+            1: {TaskStatus.TODO: 2, TaskStatus.DOING: 0, TaskStatus.DONE: 0},
+            2: {TaskStatus.TODO: 0, TaskStatus.DOING: 0, TaskStatus.DONE: 3},
+        }
+        assert summary.by_status == {TaskStatus.TODO: 2, TaskStatus.DOING: 0, TaskStatus.DONE: 3}
+        assert summary.total == 5
@@ -0,0 +1 @@
+"""Infrastructure tests package."""
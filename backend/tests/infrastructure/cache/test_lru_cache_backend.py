@@ -0,0 +1,113 @@
+"""Tests for LRUCacheBackend."""
+
+import pytest
+
+from infrastructure.cache import MISSING, LRUCacheBackend
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current time."""
+        return self.now
+
+
+class TestLRUCacheBackend:
+    """Test cases for LRUCacheBackend."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        """Create a small cache driven by the fake clock."""
+        return LRUCacheBackend(max_entries=2, max_bytes=10_000, ttl_seconds=10, clock=clock)
+
+    def test_hit_and_miss_counters(self, cache):
+        """Test that lookups are counted as hits or misses."""
+        # Act
+        first = cache.get(("tasks", "get_all"))
+        cache.set(("tasks", "get_all"), [1, 2], cache.generation("tasks"))
+        second = cache.get(("tasks", "get_all"))
+
+        # Assert
+        assert first is MISSING
+        assert second == [1, 2]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that the entry bound evicts the least recently used entry."""
+        # Arrange
+        for name in ("a", "b"):
+            cache.set(("tasks", name), name, 0)
+        cache.get(("tasks", "a"))
+
+        # Act
+        cache.set(("tasks", "c"), "c", 0)
+
+        # Assert
+        assert cache.get(("tasks", "b")) is MISSING
+        assert cache.get(("tasks", "a")) == "a"
+        assert cache.stats().evictions == 1
+
+    def test_memory_bound(self, clock):
+        """Test that the byte bound evicts entries and rejects oversized values."""
+        # Arrange
+        cache = LRUCacheBackend(max_entries=100, max_bytes=2_000, ttl_seconds=10, clock=clock)
+
+        # Act
+        cache.set(("tasks", "big"), "x" * 5_000, 0)
+        for i in range(10):
+            cache.set(("tasks", i), "x" * 500, 0)
+
+        # Assert
+        stats = cache.stats()
+        assert cache.get(("tasks", "big")) is MISSING
+        assert stats.size_bytes <= 2_000
+        assert stats.evictions > 0
+
+    def test_ttl_expiry(self, cache, clock):
+        """Test that entries expire after the TTL."""
+        # Arrange
+        cache.set(("users", "get_all"), ["user"], 0)
+
+        # Act
+        clock.now = 10
+
+        # Assert
+        assert cache.get(("users", "get_all")) is MISSING
+        assert cache.stats().expirations == 1
+
+    def test_invalidate_drops_only_its_namespace(self, cache):
+        """Test that invalidation drops a namespace's entries and bumps its generation."""
+        # Arrange
+        cache.set(("tasks", "get_all"), ["task"], 0)
+        cache.set(("users", "get_all"), ["user"], 0)
+
+        # Act
+        cache.invalidate("tasks")
+
+        # Assert
+        assert cache.get(("tasks", "get_all")) is MISSING
+        assert cache.get(("users", "get_all")) == ["user"]
+        assert cache.generation("tasks") == 1
+
+    def test_set_after_invalidation_is_ignored(self, cache):
+        """Test that a value loaded before a write is not cached after it."""
+        # Arrange
+        generation = cache.generation("tasks")
+        cache.invalidate("tasks")
+
+        # Act
+        cache.set(("tasks", "get_all"), ["stale"], generation)
+
+        # Assert
+        assert cache.get(("tasks", "get_all")) is MISSING
@@ -0,0 +1,16 @@
+"""Tests for the read-through cache configuration."""
+
+import pytest
+
+from infrastructure.config.settings import Settings
+
+
+@pytest.mark.parametrize(
+    ("cache_enabled", "coherence_enabled", "active"),
+    [(None, False, False), (None, True, True), (True, False, True), (False, True, False)],
+)
+def test_cache_is_on_by_default_only_with_coherence(cache_enabled, coherence_enabled, active):
+    """Unset, the cache follows coherence, since nothing else invalidates it on other processes' writes."""
+    settings = Settings(cache_enabled=cache_enabled, coherence_enabled=coherence_enabled)
+
+    assert settings.cache_active is active
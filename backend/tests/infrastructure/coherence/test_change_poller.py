@@ -0,0 +1,217 @@
+"""Tests for ChangePoller across processes sharing one SQLite database."""
+
+import multiprocessing
+import socket
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from domain.models import Task, TaskEvent, TaskEventType, TaskStatus, TaskUpdate
+from infrastructure.cache import MISSING, LRUCacheBackend
+from infrastructure.coherence import ChangePoller
+from infrastructure.coherence import poller as poller_module
+from infrastructure.database import Base, create_database_engine
+from infrastructure.database.models import UserModel
+from infrastructure.repositories import SQLAlchemyTaskRepository, change_queries
+
+NOW = datetime(2025, 1, 1)
+
+
+def write_in_worker(url: str, action: str, task_id: int | None = None) -> None:
+    """Write through a task repository in another process, as another uvicorn worker would."""
+    engine = create_database_engine(url)
+    with sessionmaker(bind=engine)() as db:
+        repository = SQLAlchemyTaskRepository(db)
+        if action == "create":
+            repository.create(
+                Task(
+                    id=None,
+                    description="From worker",
+                    status=TaskStatus.TODO,
+                    user_id=1,
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+            )
+        elif action == "update":
+            changes = TaskUpdate(
+                description="Moved", status=TaskStatus.DONE, user_id=1, updated_at=datetime(2025, 2, 1)
+            )
+            repository.update(task_id, changes)
+        else:
+            repository.delete(task_id)
+    engine.dispose()
+
+
+def run_worker(url: str, action: str, task_id: int | None = None) -> None:
+    """Run write_in_worker in a freshly spawned process and wait for it."""
+    process = multiprocessing.get_context("spawn").Process(target=write_in_worker, args=(url, action, task_id))
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 0
+
+
+class TestChangePoller:
+    """Test cases for cross-process invalidation and event relay."""
+
+    @pytest.fixture
+    def url(self, tmp_path):
+        """Create a file database with the schema and one user."""
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        engine = create_database_engine(url)
+        Base.metadata.create_all(engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(
+                UserModel(first_name="John", last_name="Doe", email="john@example.com", created_at=NOW, updated_at=NOW)
+            )
+            db.commit()
+        engine.dispose()
+        return url
+
+    @pytest.fixture
+    def poller_parts(self, url):
+        """Create a poller over its own engine, with a real cache and a mock publisher."""
+        engine = create_database_engine(url)
+        cache = LRUCacheBackend(max_entries=10, max_bytes=2**20, ttl_seconds=60)
+        publisher = Mock()
+        poller = ChangePoller(sessionmaker(bind=engine), cache=cache, publisher=publisher, interval_seconds=0.05)
+        yield poller, cache, publisher
+        poller.stop()
+        engine.dispose()
+
+    def test_other_process_writes_invalidate_and_publish(self, url, poller_parts):
+        """Test that create, update and delete in another process reach this one."""
+        # Arrange
+        poller, cache, publisher = poller_parts
+        assert poller.poll() == set()
+        cache.set(("tasks", "get_all"), ["stale"], cache.generation("tasks"))
+        cache.set(("users", "get_all"), ["fresh"], cache.generation("users"))
+
+        # Act
+        run_worker(url, "create")
+        moved = poller.poll()
+
+        # Assert
+        assert moved == {"tasks"}
+        assert cache.get(("tasks", "get_all")) is MISSING
+        assert cache.get(("users", "get_all")) == ["fresh"]
+        [created] = publisher.publish.call_args.args[0]
+        assert (created.type, created.task.description) == (TaskEventType.CREATED, "From worker")
+
+        run_worker(url, "update", created.task_id)
+        run_worker(url, "delete", created.task_id)
+        poller.poll()
+        assert publisher.publish.call_args.args[0] == [TaskEvent(TaskEventType.DELETED, created.task_id)]
+
+    def test_event_types_come_from_the_change_sequence(self, url, poller_parts):
+        """Test that creation is told from update by sequence, not timestamps, which can be equal for both."""
+        # Arrange
+        poller, _, publisher = poller_parts
+        poller.poll()
+        engine = create_database_engine(url)
+        repository = SQLAlchemyTaskRepository(sessionmaker(bind=engine)())
+        task = Task(id=None, description="Same tick", status=TaskStatus.TODO, user_id=1, created_at=NOW, updated_at=NOW)
+        same_tick = TaskUpdate(description="Same tick", status=TaskStatus.DOING, user_id=1, updated_at=NOW)
+
+        # Act
+        created = repository.create(task)
+        repository.update(created.id, same_tick)
+        poller.poll()
+        first = publisher.publish.call_args.args[0]
+        repository.update(created.id, same_tick)
+        poller.poll()
+        second = publisher.publish.call_args.args[0]
+        repository.session.close()
+        engine.dispose()
+
+        # Assert
+        assert [(event.type, event.task.status) for event in first] == [(TaskEventType.CREATED, TaskStatus.DOING)]
+        assert [event.type for event in second] == [TaskEventType.UPDATED]
+
+    def test_background_thread_picks_up_writes(self, url, poller_parts):
+        """Test that a started poller notices another process's write within its interval."""
+        poller, _, publisher = poller_parts
+        poller.start()
+
+        run_worker(url, "create")
+        deadline = time.monotonic() + 5
+        while not publisher.publish.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert publisher.publish.called
+
+    def test_failed_listener_falls_back_to_polling(self, url, poller_parts, monkeypatch):
+        """Test that a broken LISTEN connection is closed and reopened while polling carries on."""
+        # Arrange
+        monkeypatch.setattr(poller_module, "LISTEN_RETRY_SECONDS", 0.05)
+        poller, _, publisher = poller_parts
+        readable, writer = socket.socketpair()
+        writer.send(b"x")
+        broken = Mock(notifies=[], fileno=readable.fileno)
+        broken.poll.side_effect = OSError("server closed the connection unexpectedly")
+        poller.listen = True
+        poller._open_listener = Mock(side_effect=[broken, None])
+
+        # Act
+        poller.start()
+        run_worker(url, "create")
+        deadline = time.monotonic() + 5
+        while not (publisher.publish.called and poller._open_listener.call_count == 2) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert publisher.publish.called
+        assert poller._thread.is_alive()
+        broken.close.assert_called_once()
+        assert poller._open_listener.call_count == 2
+        readable.close()
+        writer.close()
+
+
+class FakePooledConnection:
+    """Stands in for a pool's connection proxy, which drops its driver connection once detached."""
+
+    def __init__(self, driver_connection):
+        """Wrap a driver connection."""
+        self.driver_connection = driver_connection
+
+    def detach(self):
+        """Take the connection out of the pool, as _ConnectionFairy.detach() does."""
+        self.driver_connection = None
+
+
+class TestChangeListener:
+    """Test cases for the LISTEN connection opened on PostgreSQL."""
+
+    @staticmethod
+    def engine(driver: str, driver_connection=None):
+        """A stub engine for a PostgreSQL driver handing out one pooled connection."""
+        engine = Mock()
+        engine.dialect.name = "postgresql"
+        engine.dialect.driver = driver
+        engine.raw_connection.return_value = FakePooledConnection(driver_connection)
+        return engine
+
+    @pytest.mark.parametrize("driver", ["psycopg2", "psycopg"])
+    def test_listener_listens_in_autocommit(self, driver):
+        """Test that the listener keeps the detached driver connection, in autocommit, LISTENing on the channel."""
+        driver_connection = MagicMock()
+        poller = ChangePoller(sessionmaker(bind=self.engine(driver, driver_connection)), listen=True)
+
+        listener = poller._open_listener()
+
+        assert listener is driver_connection
+        assert driver_connection.autocommit is True
+        cursor = driver_connection.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with(f"LISTEN {change_queries.NOTIFY_CHANNEL}")
+
+    def test_other_drivers_fall_back_to_polling(self):
+        """Test that drivers without notifications get no listener."""
+        engine = self.engine("asyncpg")
+        poller = ChangePoller(sessionmaker(bind=engine), listen=True)
+
+        assert poller._open_listener() is None
+        engine.raw_connection.assert_not_called()
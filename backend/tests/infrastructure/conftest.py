@@ -0,0 +1,68 @@
+"""Shared fixtures for infrastructure tests."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.database import Base, create_database_engine
+from infrastructure.database.models import UserModel
+
+
+@pytest.fixture
+def db_engine():
+    """Create an in-memory SQLite engine with the full schema."""
+    engine = create_database_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """Create a database session bound to the in-memory engine."""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def db_user(db_session):
+    """Create a persisted user."""
+    now = datetime(2025, 1, 1)
+    user = UserModel(first_name="John", last_name="Doe", email="john.doe@example.com", created_at=now, updated_at=now)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class QueryCounter:
+    """Collects the SQL statements executed on an engine."""
+
+    def __init__(self):
+        """Initialize with no statements."""
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        """Record a statement (before_cursor_execute listener)."""
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed."""
+        return len(self.statements)
+
+    def reset(self) -> None:
+        """Forget recorded statements."""
+        self.statements.clear()
+
+
+@pytest.fixture
+def query_counter(db_engine):
+    """Count statements executed on the test engine."""
+    counter = QueryCounter()
+    event.listen(db_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(db_engine, "before_cursor_execute", counter)
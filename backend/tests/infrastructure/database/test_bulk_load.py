@@ -0,0 +1,60 @@
+"""Tests for bulk loading."""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from domain.models import Task, TaskStatus
+from infrastructure.database import bulk_insert, deferred_search_index, supports_copy
+from infrastructure.database.bulk_load import copy_text
+from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.repositories import SQLAlchemyTaskRepository
+
+NOW = datetime(2025, 1, 1, 12, 30)
+USER_COLUMNS = ("id", "first_name", "last_name", "email", "created_at", "updated_at")
+TASK_COLUMNS = ("id", "description", "status", "user_id", "created_at", "updated_at")
+
+
+def user_rows(count: int):
+    """Generate user rows with ids 1..count."""
+    return ((i, "Bulk", f"User {i}", f"bulk{i}@example.com", NOW, NOW) for i in range(1, count + 1))
+
+
+def test_bulk_insert_writes_every_row_in_batches(db_engine):
+    """Rows are inserted batch by batch, with progress reported after each one."""
+    progress = []
+
+    loaded = bulk_insert(db_engine, UserModel.__table__, USER_COLUMNS, user_rows(25), 10, progress.append)
+
+    assert loaded == 25
+    assert progress == [10, 20, 25]
+    with db_engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(UserModel)).scalar_one() == 25
+
+
+def test_bulk_insert_uses_executemany_on_sqlite(db_engine):
+    """COPY is only used on PostgreSQL through psycopg2 or psycopg 3."""
+    assert not supports_copy(db_engine)
+
+
+def test_copy_text_escapes_values():
+    """Values are tab-separated, NULL is \\N, enums are written by name and special characters are escaped."""
+    rows = [(1, "Tab\there\nnewline \\ slash", TaskStatus.DOING, None, NOW)]
+
+    assert copy_text(rows) == "1\tTab\\there\\nnewline \\\\ slash\tDOING\t\\N\t2025-01-01 12:30:00\n"
+
+
+def test_deferred_search_index_indexes_loaded_tasks_on_exit(db_engine):
+    """Tasks loaded with the index deferred are searchable afterwards, and later inserts are indexed again."""
+    bulk_insert(db_engine, UserModel.__table__, USER_COLUMNS, user_rows(1))
+    tasks = [(i, f"Review invoice {i}", TaskStatus.TODO, 1, NOW, NOW) for i in range(1, 4)]
+
+    with deferred_search_index(db_engine):
+        bulk_insert(db_engine, TaskModel.__table__, TASK_COLUMNS, tasks)
+
+    with Session(db_engine) as db:
+        repository = SQLAlchemyTaskRepository(db)
+        repository.create(Task(None, "Pay invoice", TaskStatus.TODO, 1, NOW, NOW))
+        page = repository.search("invoice", limit=10)
+    assert len(page.items) == 4
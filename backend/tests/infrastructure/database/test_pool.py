@@ -0,0 +1,143 @@
+"""Tests for connection pool configuration and instrumentation."""
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from infrastructure.config.settings import Settings
+from infrastructure.database import (
+    MonitoredQueuePool,
+    PoolMonitor,
+    check_database,
+    create_database_engine,
+    engine_options,
+    pool_stats,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A file-based SQLite engine with a small monitored pool."""
+    db_engine = create_database_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MonitoredQueuePool,
+        monitor=PoolMonitor(),
+        pool_size=2,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield db_engine
+    db_engine.dispose()
+
+
+class TestPoolMonitor:
+    """Test cases for PoolMonitor and MonitoredQueuePool."""
+
+    def test_reports_saturation_waits_and_timeouts(self, engine):
+        """Test that checkouts, waits, saturation and timeouts are captured."""
+        # Act
+        connections = [engine.connect() for _ in range(3)]
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        stats = pool_stats(engine)
+        for connection in connections:
+            connection.close()
+
+        # Assert
+        assert (stats.size, stats.max_overflow, stats.checked_out) == (2, 1, 3)
+        assert stats.saturation == 1.0
+        assert (stats.checkouts, stats.connects, stats.timeouts) == (3, 3, 1)
+        assert 0 <= stats.wait_ms_p50 <= stats.wait_ms_p99 <= stats.wait_ms_max
+
+    def test_records_lifetimes_and_survives_dispose(self, engine):
+        """Test that closed connections report their lifetime and dispose() keeps the monitor."""
+        monitor = engine.pool.monitor
+        engine.connect().close()
+
+        engine.dispose()
+        engine.connect().close()
+
+        stats = pool_stats(engine)
+        assert engine.pool.monitor is monitor
+        assert stats.lifetime_seconds_max is not None
+        assert stats.checkouts == 2
+
+    def test_check_database(self, engine):
+        """Test that the readiness probe times a round trip and includes the pool."""
+        health = check_database(engine)
+
+        assert health.ready
+        assert health.round_trip_ms >= 0
+        assert health.pool.checked_out == 0
+
+    def test_check_database_exhausted_pool(self, engine):
+        """Test that an exhausted pool is reported without waiting for a connection."""
+        # Arrange
+        connections = [engine.connect() for _ in range(3)]
+
+        # Act
+        health = check_database(engine)
+        timeouts = pool_stats(engine).timeouts
+        for connection in connections:
+            connection.close()
+
+        # Assert
+        assert not health.ready
+        assert health.error == "Connection pool exhausted: 3 of 3 checked out"
+        assert health.pool.saturation == 1.0
+        assert timeouts == 0
+        assert check_database(engine).ready
+
+    def test_check_database_unreachable(self, tmp_path):
+        """Test that a database that cannot be opened is reported, not raised."""
+        engine = create_database_engine(f"sqlite:///{tmp_path / 'missing' / 'db.sqlite'}")
+
+        health = check_database(engine)
+
+        assert not health.ready
+        assert health.error
+
+
+class TestEngineOptions:
+    """Test cases for engine_options."""
+
+    def test_sizes_pool_from_settings(self):
+        """Test that pool settings become create_engine() arguments."""
+        settings = Settings(database_pool_size=7, database_max_overflow=3, database_pool_timeout_seconds=2)
+
+        options = engine_options("postgresql://user:pw@db/app", settings)
+
+        assert options["poolclass"] is MonitoredQueuePool
+        assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (7, 3, 2)
+        assert options["echo"] is False
+        assert "connect_args" not in options
+
+    @pytest.mark.parametrize(
+        ("url", "connect_args"),
+        [
+            ("postgresql://user:pw@db/app", {"options": "-c statement_timeout=250"}),
+            ("postgresql+asyncpg://user:pw@db/app", {"server_settings": {"statement_timeout": "250"}}),
+        ],
+    )
+    def test_statement_timeout_per_driver(self, url, connect_args):
+        """Test that statement_timeout is passed the way each driver accepts it."""
+        options = engine_options(url, Settings(database_statement_timeout_ms=250))
+
+        assert options["connect_args"] == connect_args
+
+    @pytest.mark.parametrize(("threshold", "prepare_threshold"), [(2, 2), (0, None)])
+    def test_psycopg_prepare_threshold(self, threshold, prepare_threshold):
+        """Test that psycopg 3 gets the prepare threshold alongside the statement timeout, 0 disabling it."""
+        settings = Settings(database_prepare_threshold=threshold, database_statement_timeout_ms=250)
+
+        options = engine_options("postgresql+psycopg://user:pw@db/app", settings)
+
+        assert options["connect_args"] == {
+            "options": "-c statement_timeout=250",
+            "prepare_threshold": prepare_threshold,
+        }
+
+    def test_in_memory_sqlite_has_no_pool_to_size(self):
+        """Test that in-memory SQLite keeps its default pool."""
+        options = engine_options("sqlite://", Settings())
+
+        assert options == {"echo": False, "pool_pre_ping": True}
@@ -0,0 +1,196 @@
+"""Tests for read-replica routing."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.models import Task, TaskStatus, User
+from infrastructure.database import (
+    Base,
+    ReplicaRouter,
+    RoutingSession,
+    create_async_database_engine,
+    create_database_engine,
+)
+from infrastructure.repositories import (
+    SQLAlchemyAsyncTaskRepository,
+    SQLAlchemyAsyncUserRepository,
+    SQLAlchemyTaskRepository,
+    SQLAlchemyUserRepository,
+)
+
+NOW = datetime(2025, 1, 1)
+
+
+def make_engine():
+    """An in-memory SQLite engine with the full schema, standing in for one database instance."""
+    engine = create_database_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def make_user() -> User:
+    """Build an unsaved user."""
+    return User(
+        id=None, first_name="John", last_name="Doe", email="john.doe@example.com", created_at=NOW, updated_at=NOW
+    )
+
+
+def make_task(user_id: int, description: str = "Task") -> Task:
+    """Build an unsaved task."""
+    return Task(
+        id=None, description=description, status=TaskStatus.TODO, user_id=user_id, created_at=NOW, updated_at=NOW
+    )
+
+
+@pytest.fixture
+def primary():
+    """Engine of the primary."""
+    engine = make_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica():
+    """Engine of the replica; nothing replicates to it, so reads it serves are told apart by their data."""
+    engine = make_engine()
+    yield engine
+    engine.dispose()
+
+
+def make_factory(primary, router) -> sessionmaker:
+    """A routing session factory on the primary."""
+    return sessionmaker(class_=RoutingSession, router=router, autoflush=False, bind=primary)
+
+
+class TestRoutingSession:
+    """Test cases for RoutingSession with ReplicaRouter."""
+
+    def test_reads_go_to_replica_once_lag_has_passed(self, primary, replica):
+        """Test that lookups and listings are served by the replica."""
+        # Arrange
+        router = ReplicaRouter(replica, max_lag_seconds=0)
+        factory = make_factory(primary, router)
+        with sessionmaker(bind=replica)() as session:
+            user = SQLAlchemyUserRepository(session).create(make_user())
+            SQLAlchemyTaskRepository(session).create(make_task(user.id, "On the replica"))
+        with factory() as session:
+            primary_user = SQLAlchemyUserRepository(session).create(make_user())
+            SQLAlchemyTaskRepository(session).create(make_task(primary_user.id, "On the primary"))
+
+        # Act
+        with factory() as session:
+            tasks = SQLAlchemyTaskRepository(session)
+            users = SQLAlchemyUserRepository(session)
+            all_tasks = tasks.get_all()
+            by_user = tasks.get_by_user_id(user.id)
+            found_user = users.get_by_id(user.id)
+
+        # Assert
+        assert [task.description for task in all_tasks] == ["On the replica"]
+        assert [task.description for task in by_user] == ["On the replica"]
+        assert found_user is not None
+        assert router.replica_reads == 3
+
+    def test_session_reads_its_own_writes_from_primary(self, primary, replica):
+        """Test that reads after a write in the same session stay on the primary."""
+        # Arrange
+        factory = make_factory(primary, ReplicaRouter(replica, max_lag_seconds=0))
+
+        # Act
+        with factory() as session:
+            tasks = SQLAlchemyTaskRepository(session)
+            user = SQLAlchemyUserRepository(session).create(make_user())
+            created = tasks.create(make_task(user.id, "Just written"))
+            found = tasks.get_by_id(created.id)
+
+        # Assert
+        assert found is not None
+        assert found.description == "Just written"
+
+    def test_reads_stay_on_primary_within_lag_of_a_write(self, primary, replica):
+        """Test the staleness fallback: other sessions read the primary right after a write."""
+        # Arrange
+        router = ReplicaRouter(replica, max_lag_seconds=60)
+        factory = make_factory(primary, router)
+        with factory() as session:
+            user = SQLAlchemyUserRepository(session).create(make_user())
+            created = SQLAlchemyTaskRepository(session).create(make_task(user.id))
+
+        # Act
+        with factory() as session:
+            found = SQLAlchemyTaskRepository(session).get_by_id(created.id)
+
+        # Assert
+        assert found is not None
+        assert router.replica_reads == 0
+        assert router.primary_reads == 1
+
+    def test_change_sync_stays_on_primary(self, primary, replica):
+        """Test that delta sync, whose tokens come from the primary, is never served by a replica."""
+        # Arrange
+        factory = make_factory(primary, ReplicaRouter(replica, max_lag_seconds=0))
+        with factory() as session:
+            user = SQLAlchemyUserRepository(session).create(make_user())
+            SQLAlchemyTaskRepository(session).create(make_task(user.id))
+
+        # Act
+        with factory() as session:
+            changes = SQLAlchemyTaskRepository(session).get_changes(None)
+
+        # Assert
+        assert len(changes.changed) == 1
+
+    def test_without_router_everything_goes_to_primary(self, primary):
+        """Test that a routing session without a replica behaves as a plain session."""
+        # Arrange
+        factory = make_factory(primary, None)
+        with factory() as session:
+            user = SQLAlchemyUserRepository(session).create(make_user())
+            SQLAlchemyTaskRepository(session).create(make_task(user.id))
+
+        # Act
+        with factory() as session:
+            tasks = SQLAlchemyTaskRepository(session).get_all()
+
+        # Assert
+        assert len(tasks) == 1
+
+    def test_async_session_routes_reads(self):
+        """Test that AsyncSession routes through a RoutingSession on its sync side."""
+
+        async def scenario():
+            engines = [create_async_database_engine("sqlite+aiosqlite://", poolclass=StaticPool) for _ in range(2)]
+            for engine in engines:
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+            primary, replica = engines
+            factory = async_sessionmaker(
+                primary,
+                sync_session_class=RoutingSession,
+                router=ReplicaRouter(replica.sync_engine, max_lag_seconds=0),
+                expire_on_commit=False,
+            )
+            try:
+                async with factory() as session:
+                    user = await SQLAlchemyAsyncUserRepository(session).create(make_user())
+                    await SQLAlchemyAsyncTaskRepository(session).create(make_task(user.id))
+                    own_write = await SQLAlchemyAsyncTaskRepository(session).get_all()
+                async with factory() as session:
+                    from_replica = await SQLAlchemyAsyncTaskRepository(session).get_all()
+                return own_write, from_replica
+            finally:
+                for engine in engines:
+                    await engine.dispose()
+
+        # Act
+        own_write, from_replica = asyncio.run(scenario())
+
+        # Assert
+        assert len(own_write) == 1
+        assert from_replica == []
@@ -0,0 +1,49 @@
+"""Tests for connection pool warm-up."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from infrastructure.database import Base, awarm_up, create_async_database_engine, create_database_engine, warm_up
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """A SQLite file with the full schema."""
+    path = tmp_path / "app.db"
+    engine = create_database_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return path
+
+
+def test_warm_up_opens_pooled_connections(database_path):
+    """Warm-up opens at most pool_size connections at once and leaves them idle in the pool."""
+    engine = create_database_engine(f"sqlite:///{database_path}", poolclass=QueuePool, pool_size=3, max_overflow=5)
+
+    opened = warm_up(engine, 10)
+
+    assert opened == 3
+    assert (engine.pool.checkedin(), engine.pool.checkedout()) == (3, 0)
+    engine.dispose()
+
+
+def test_warm_up_single_connection_pool(db_engine):
+    """Pools that hold one connection are warmed once."""
+    assert warm_up(db_engine, 4) == 1
+
+
+def test_awarm_up_opens_pooled_connections(database_path):
+    """The async engine's pool is warmed the same way."""
+
+    async def scenario():
+        engine = create_async_database_engine(
+            f"sqlite+aiosqlite:///{database_path}", poolclass=AsyncAdaptedQueuePool, pool_size=2, max_overflow=0
+        )
+        try:
+            return await awarm_up(engine, 4), engine.sync_engine.pool.checkedin()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(scenario()) == (2, 2)
@@ -0,0 +1,80 @@
+"""Tests for EventHub."""
+
+import asyncio
+import threading
+
+from infrastructure.events import EventHub
+
+
+def run(scenario):
+    """Run an async scenario on a fresh event loop."""
+    return asyncio.run(scenario())
+
+
+class TestEventHub:
+    """Test cases for the in-process publish/subscribe hub."""
+
+    def test_fans_out_to_every_subscriber(self):
+        """Test that each subscriber receives every message in order."""
+
+        async def scenario():
+            hub = EventHub(queue_size=8)
+            first, second = hub.subscribe(), hub.subscribe()
+            hub.publish([b"a", b"b"])
+            return [await first.get(), await first.get(), await second.get(), await second.get()]
+
+        assert run(scenario) == [b"a", b"b", b"a", b"b"]
+
+    def test_publish_without_subscribers_is_noop(self):
+        """Test that publishing before anyone subscribes does nothing."""
+        hub = EventHub()
+
+        hub.publish([b"a"])
+
+        assert hub.stats().published == 0
+
+    def test_slow_subscriber_is_dropped(self):
+        """Test that a full queue drops its subscriber without affecting the others."""
+
+        async def scenario():
+            hub = EventHub(queue_size=2)
+            slow, fast = hub.subscribe(), hub.subscribe()
+            hub.publish([b"a", b"b"])
+            assert await fast.get() == b"a"
+            assert await fast.get() == b"b"
+            hub.publish([b"c"])
+            return hub, slow, await slow.get(), await fast.get()
+
+        hub, slow, slow_message, fast_message = run(scenario)
+
+        assert slow.dropped
+        assert slow_message is None
+        assert fast_message == b"c"
+        assert hub.stats().subscribers == 1
+        assert hub.stats().dropped == 1
+
+    def test_publish_from_another_thread(self):
+        """Test that messages published off the loop (sync routes) reach subscribers."""
+
+        async def scenario():
+            hub = EventHub()
+            subscription = hub.subscribe()
+            publisher = threading.Thread(target=hub.publish, args=([b"a"],))
+            publisher.start()
+            message = await asyncio.wait_for(subscription.get(), timeout=1)
+            publisher.join()
+            return message
+
+        assert run(scenario) == b"a"
+
+    def test_close_unsubscribes(self):
+        """Test that closed subscriptions stop receiving messages."""
+
+        async def scenario():
+            hub = EventHub()
+            subscription = hub.subscribe()
+            subscription.close()
+            hub.publish([b"a"])
+            return hub.stats()
+
+        assert run(scenario).subscribers == 0
@@ -0,0 +1,121 @@
+"""Tests for the metrics registry, per-request query cost and query budgets."""
+
+import contextvars
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    QueryBudgetExceededError,
+    instrument_engines,
+    measure_queries,
+    query_budget,
+)
+
+
+class TestMetricsRegistry:
+    """Test cases for metrics rendered in the Prometheus text format."""
+
+    def test_renders_counters_and_cumulative_histograms(self):
+        """Test the exposition of labelled counters and histograms."""
+        # Arrange
+        registry = MetricsRegistry()
+        requests = registry.register(Counter("requests_total", "Requests.", ("route",)))
+        latency = registry.register(Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)))
+
+        # Act
+        requests.inc(('/a"b',))
+        requests.inc(('/a"b',))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, ("/a",))
+
+        # Assert
+        assert registry.render().splitlines() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{route="/a\\"b"} 2.0',
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1.0"} 3',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+            'latency_seconds_sum{route="/a"} 3.65',
+            'latency_seconds_count{route="/a"} 4',
+        ]
+
+
+class TestQueryCost:
+    """Test cases for counting statements per measured context."""
+
+    def test_counts_statements_of_measured_context_only(self, db_engine):
+        """Test that statements are attributed to the context that ran them, threads included."""
+        # Arrange
+        instrument_engines()
+
+        def run_query():
+            with db_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        # Act
+        run_query()
+        with measure_queries() as cost:
+            run_query()
+            # A thread running in a copy of the context, as the threadpool does
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(run_query,))
+            thread.start()
+            thread.join()
+        run_query()
+
+        # Assert
+        assert cost.queries == 2
+        assert cost.seconds > 0
+
+
+class TestQueryBudget:
+    """Test cases for query budgets."""
+
+    def test_flags_lazy_loads_as_repeated_statements(self, db_session, db_user):
+        """Test that a lazy load per row (N+1) exceeds the budget even when the total fits."""
+        # Arrange
+        now = datetime(2025, 1, 1)
+        other = UserModel(first_name="Jane", last_name="Roe", email="jane@example.com", created_at=now, updated_at=now)
+        db_session.add(other)
+        db_session.flush()
+        for user_id in (db_user.id, other.id):
+            db_session.add(
+                TaskModel(description="Task", status="TODO", user_id=user_id, created_at=now, updated_at=now)
+            )
+        db_session.commit()
+        db_session.expunge_all()
+        instrument_engines()
+
+        # Act
+        with pytest.raises(QueryBudgetExceededError, match="repeated 2 times") as error:
+            with query_budget(10, name="listing"):
+                tasks = db_session.scalars(select(TaskModel)).all()
+                [task.user.email for task in tasks]
+
+        # Assert
+        assert error.value.args[0].startswith("listing exceeded its query budget")
+
+    def test_counts_statements_and_nests_in_enclosing_measurement(self, db_engine):
+        """Test the statement limit, and that a budgeted block is still charged to the enclosing cost."""
+        # Arrange
+        instrument_engines()
+
+        # Act
+        with measure_queries() as outer:
+            with pytest.raises(QueryBudgetExceededError, match="2 statements, budget 1"):
+                with query_budget(1, max_repeats=2):
+                    with db_engine.connect() as conn:
+                        conn.execute(text("SELECT 1"))
+                        conn.execute(text("SELECT 2"))
+
+        # Assert
+        assert outer.queries == 2
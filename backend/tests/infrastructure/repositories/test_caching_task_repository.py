@@ -0,0 +1,118 @@
+"""Tests for CachingTaskRepository."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from domain.models import TableWatermark, Task, TaskQuery, TaskStatus, TaskUpdate
+from infrastructure.cache import LRUCacheBackend
+from infrastructure.repositories import CachingTaskRepository
+
+
+class TestCachingTaskRepository:
+    """Test cases for CachingTaskRepository over a mocked repository."""
+
+    @pytest.fixture
+    def inner(self):
+        """Create a mock task repository returning empty results."""
+        inner = Mock()
+        inner.get_all.return_value = []
+        inner.find_rows.return_value = []
+        return inner
+
+    @pytest.fixture
+    def repository(self, inner):
+        """Create a caching repository around the mock."""
+        return CachingTaskRepository(inner, LRUCacheBackend())
+
+    @pytest.fixture
+    def sample_task(self):
+        """Create a sample task."""
+        now = datetime(2025, 1, 1)
+        return Task(id=1, description="Task", status=TaskStatus.TODO, user_id=1, created_at=now, updated_at=now)
+
+    def test_repeated_reads_hit_the_cache(self, repository, inner, sample_task):
+        """Test that the same query shape is loaded once."""
+        # Arrange
+        inner.find.return_value = [sample_task]
+        query = TaskQuery(statuses=frozenset({TaskStatus.TODO}))
+
+        # Act
+        first = repository.find(query)
+        second = repository.find(TaskQuery(statuses=frozenset({TaskStatus.TODO})))
+
+        # Assert
+        assert first == second == [sample_task]
+        inner.find.assert_called_once_with(query)
+
+    def test_query_shapes_are_cached_separately(self, repository, inner):
+        """Test that different filters and pages use different keys."""
+        # Act
+        repository.find_rows(TaskQuery())
+        repository.find_rows(TaskQuery(user_ids=frozenset({1})))
+        repository.get_rows_page(10)
+        repository.get_rows_page(20)
+
+        # Assert
+        assert inner.find_rows.call_count == 2
+        assert inner.get_rows_page.call_count == 2
+
+    def test_writes_invalidate(self, repository, inner, sample_task):
+        """Test that every write method drops cached task reads."""
+        changes = TaskUpdate(description="New", status=TaskStatus.DONE, user_id=1, updated_at=datetime(2025, 2, 1))
+        writes = [
+            lambda: repository.create(sample_task),
+            lambda: repository.update(1, changes),
+            lambda: repository.delete(1),
+            lambda: repository.create_many([sample_task]),
+            lambda: repository.update_many({1: changes}),
+            lambda: repository.delete_many([1]),
+        ]
+
+        repository.get_all()
+
+        for write in writes:
+            # Arrange
+            inner.get_all.reset_mock()
+
+            # Act
+            write()
+            repository.get_all()
+            repository.get_all()
+
+            # Assert
+            inner.get_all.assert_called_once()
+
+    def test_failed_write_keeps_cache(self, repository, inner, sample_task):
+        """Test that a write that raised does not invalidate."""
+        # Arrange
+        inner.create.side_effect = ValueError("User with id 999 not found")
+        repository.get_all()
+
+        # Act
+        with pytest.raises(ValueError):
+            repository.create(sample_task)
+        repository.get_all()
+
+        # Assert
+        inner.get_all.assert_called_once()
+
+    def test_watermark_is_read_from_the_database_and_revalidates(self, repository, inner):
+        """Test that the watermark bypasses the cache, and a moved one drops reads cached before another process's write."""
+        # Arrange
+        before, after = TableWatermark(1), TableWatermark(2)
+        inner.get_watermark.side_effect = [before, before, after]
+        repository.get_watermark()
+        repository.get_all()
+
+        # Act
+        unchanged = repository.get_watermark()
+        repository.get_all()
+        moved = repository.get_watermark()
+        repository.get_all()
+
+        # Assert
+        assert (unchanged, moved) == (before, after)
+        assert inner.get_watermark.call_count == 3
+        assert inner.get_all.call_count == 2
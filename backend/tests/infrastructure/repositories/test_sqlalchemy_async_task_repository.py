@@ -0,0 +1,216 @@
+"""Tests for SQLAlchemyAsyncTaskRepository."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.models import Task, TaskQuery, TaskStatus, TaskUpdate, User
+from infrastructure.database import Base, create_async_database_engine
+from infrastructure.repositories import SQLAlchemyAsyncTaskRepository, SQLAlchemyAsyncUserRepository
+
+
+def run_with_repositories(scenario):
+    """Run an async scenario against fresh repositories on in-memory aiosqlite."""
+
+    async def runner():
+        engine = create_async_database_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                return await scenario(SQLAlchemyAsyncTaskRepository(session), SQLAlchemyAsyncUserRepository(session))
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(runner())
+
+
+async def create_user(user_repository) -> User:
+    """Persist a user for tasks to reference."""
+    now = datetime(2025, 1, 1)
+    return await user_repository.create(
+        User(id=None, first_name="John", last_name="Doe", email="john.doe@example.com", created_at=now, updated_at=now)
+    )
+
+
+def make_task(user_id: int, minutes: int = 0, description: str = "Task") -> Task:
+    """Build an unsaved task created the given number of minutes after the epoch of the tests."""
+    created = datetime(2025, 1, 1) + timedelta(minutes=minutes)
+    return Task(
+        id=None,
+        description=description,
+        status=TaskStatus.TODO,
+        user_id=user_id,
+        created_at=created,
+        updated_at=created,
+    )
+
+
+class TestSQLAlchemyAsyncTaskRepository:
+    """Test cases for SQLAlchemyAsyncTaskRepository against aiosqlite."""
+
+    def test_create_update_delete(self):
+        """Test the single-task write path round-trips through the database."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            created = await tasks.create(make_task(user.id, description="New"))
+            changes = TaskUpdate(
+                description="Changed", status=TaskStatus.DONE, user_id=user.id, updated_at=datetime(2025, 2, 1)
+            )
+            updated = await tasks.update(created.id, changes)
+            deleted = await tasks.delete(created.id)
+            return created, updated, deleted, await tasks.get_by_id(created.id)
+
+        created, updated, deleted, missing = run_with_repositories(scenario)
+
+        assert created.id is not None
+        assert updated.description == "Changed"
+        assert updated.status == TaskStatus.DONE
+        assert deleted is True
+        assert missing is None
+
+    def test_create_user_not_found(self):
+        """Test that the user_id foreign key violation becomes a not-found error."""
+
+        async def scenario(tasks, users):
+            await tasks.create(make_task(999))
+
+        with pytest.raises(ValueError, match="User with id 999 not found"):
+            run_with_repositories(scenario)
+
+    def test_get_page_walks_all_tasks(self):
+        """Test that cursor pagination visits every task once, in order."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            await tasks.create_many([make_task(user.id, minutes=offset) for offset in [0, 1, 1, 2, 3]])
+            seen, cursor = [], None
+            while True:
+                page = await tasks.get_page(2, cursor, TaskQuery())
+                seen.extend(task.id for task in page.items)
+                if page.next_cursor is None:
+                    return seen, [task.id for task in await tasks.get_all()]
+                cursor = page.next_cursor
+
+        seen, all_ids = run_with_repositories(scenario)
+
+        assert seen == all_ids
+        assert len(seen) == 5
+
+    def test_bulk_update_and_delete(self):
+        """Test bulk writes report only the tasks that existed."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            created = await tasks.create_many([make_task(user.id, minutes=i) for i in range(3)])
+            changes = TaskUpdate(
+                description="Bulk", status=TaskStatus.DOING, user_id=user.id, updated_at=datetime(2025, 2, 1)
+            )
+            updated = await tasks.update_many({created[0].id: changes, 999: changes})
+            deleted = await tasks.delete_many([created[1].id, 999])
+            watermark = await tasks.get_watermark()
+            missed = await tasks.delete_many([998, 999])
+            return created, updated, deleted, missed, watermark, await tasks.get_watermark()
+
+        created, updated, deleted, missed, watermark, after_miss = run_with_repositories(scenario)
+
+        assert [task.id for task in updated] == [created[0].id]
+        assert updated[0].description == "Bulk"
+        assert deleted == {created[1].id}
+        assert missed == set()
+        assert after_miss == watermark
+
+    def test_stream_yields_all_tasks_in_order(self):
+        """Test that streaming through a server-side cursor visits every task once."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            await tasks.create_many([make_task(user.id, minutes=i) for i in range(5)])
+            streamed = [task.id async for task in tasks.stream(TaskQuery(), batch_size=2)]
+            return streamed, [task.id for task in await tasks.get_all()]
+
+        streamed, all_ids = run_with_repositories(scenario)
+
+        assert streamed == all_ids
+
+    def test_get_changes_since_token(self):
+        """Test that delta sync returns only the writes and deletions after a token."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            created = await tasks.create_many([make_task(user.id, minutes=i) for i in range(3)])
+            token = (await tasks.get_changes(None)).token
+            changes = TaskUpdate(
+                description="Moved", status=TaskStatus.DONE, user_id=user.id, updated_at=datetime(2025, 2, 1)
+            )
+            await tasks.update(created[0].id, changes)
+            await tasks.delete(created[1].id)
+            return created, await tasks.get_changes(token)
+
+        created, result = run_with_repositories(scenario)
+
+        assert [row.id for row in result.changed] == [created[0].id]
+        assert result.deleted_ids == [created[1].id]
+
+    def test_writes_keep_counts(self):
+        """Test that writes adjust the task counts and a rebuild reproduces them."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            created = await tasks.create_many([make_task(user.id, minutes=i) for i in range(3)])
+            changes = TaskUpdate(description="Done", status=TaskStatus.DONE, user_id=user.id, updated_at=datetime.now())
+            await tasks.update(created[0].id, changes)
+            await tasks.delete(created[1].id)
+            maintained = {tuple(row) for row in await tasks.get_counts()}
+            await tasks.rebuild_counts()
+            return user, maintained, {tuple(row) for row in await tasks.get_counts()}
+
+        user, maintained, rebuilt = run_with_repositories(scenario)
+
+        assert maintained == {(user.id, TaskStatus.TODO, 1), (user.id, TaskStatus.DONE, 1)}
+        assert rebuilt == maintained
+
+    def test_archive_moves_old_done_tasks(self):
+        """Test that archiving moves old DONE tasks out of listings and counts, leaving tombstones."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            created = await tasks.create_many([make_task(user.id, minutes=i) for i in range(3)])
+            token = (await tasks.get_changes(None)).token
+            for task in created[:2]:
+                changes = TaskUpdate(
+                    description=task.description, status=TaskStatus.DONE, user_id=user.id, updated_at=task.updated_at
+                )
+                await tasks.update(task.id, changes)
+            archived = await tasks.archive(datetime(2025, 1, 1, 0, 1), 10)
+            listed = [task.id for task in await tasks.get_all()]
+            archived_listed = [row.id for row in await tasks.find_rows(TaskQuery(include_archived=True))]
+            counts = {tuple(row) for row in await tasks.get_counts()}
+            return user, created, archived, listed, archived_listed, counts, await tasks.get_changes(token)
+
+        user, created, archived, listed, archived_listed, counts, changes = run_with_repositories(scenario)
+
+        assert archived == {created[0].id}
+        assert listed == [created[1].id, created[2].id]
+        assert archived_listed == [task.id for task in created]
+        assert counts == {(user.id, TaskStatus.TODO, 1), (user.id, TaskStatus.DONE, 1)}
+        assert changes.deleted_ids == [created[0].id]
+
+    def test_search(self):
+        """Test that search finds tasks by description through the FTS5 index."""
+
+        async def scenario(tasks, users):
+            user = await create_user(users)
+            await tasks.create_many(
+                [make_task(user.id, description=text) for text in ("Fix login bug", "Deploy", "login page")]
+            )
+            return await tasks.search("LOGIN bug", 10)
+
+        page = run_with_repositories(scenario)
+
+        assert [row.description for row in page.items] == ["Fix login bug"]
+        assert page.next_cursor is None
@@ -0,0 +1,697 @@
+"""Tests for SQLAlchemyTaskRepository."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from domain.models import (
+    SyncToken,
+    SyncTokenExpiredError,
+    Task,
+    TaskCursor,
+    TaskQuery,
+    TaskSortOrder,
+    TaskStatus,
+    TaskUpdate,
+)
+from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.repositories import SQLAlchemyTaskRepository, task_queries
+
+
+class TestSQLAlchemyTaskRepository:
+    """Test cases for SQLAlchemyTaskRepository against SQLite."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a repository bound to the test session."""
+        return SQLAlchemyTaskRepository(db_session)
+
+    @pytest.fixture
+    def stored_tasks(self, db_session, db_user):
+        """Persist five tasks, two of which share a creation time."""
+        base = datetime(2025, 1, 1)
+        offsets = [0, 1, 1, 2, 3]
+        tasks = [
+            TaskModel(
+                description=f"Task {i}",
+                status=TaskStatus.TODO,
+                user_id=db_user.id,
+                created_at=base + timedelta(minutes=offset),
+                updated_at=base + timedelta(minutes=offset),
+            )
+            for i, offset in enumerate(offsets)
+        ]
+        db_session.add_all(tasks)
+        db_session.commit()
+        return tasks
+
+    def test_create_is_single_write(self, repository, db_user, query_counter):
+        """Test that creating a task costs one INSERT ... RETURNING and one count upsert after the sequence bump."""
+        # Arrange
+        now = datetime(2025, 2, 1)
+        task = Task(
+            id=None, description="New", status=TaskStatus.TODO, user_id=db_user.id, created_at=now, updated_at=now
+        )
+        query_counter.reset()
+
+        # Act
+        result = repository.create(task)
+
+        # Assert
+        assert result.id is not None
+        assert result.description == "New"
+        assert query_counter.count == 3
+
+    def test_create_user_not_found(self, repository, db_user):
+        """Test that the user_id foreign key violation becomes a not-found error."""
+        now = datetime(2025, 2, 1)
+        task = Task(id=None, description="New", status=TaskStatus.TODO, user_id=999, created_at=now, updated_at=now)
+
+        with pytest.raises(ValueError, match="User with id 999 not found"):
+            repository.create(task)
+
+    def test_update_is_single_write(self, repository, stored_tasks, query_counter):
+        """Test that updating a task costs one UPDATE ... RETURNING between a key SELECT and a count upsert.
+
+        SQLite needs the key SELECT; on PostgreSQL the UPDATE returns the previous keys itself.
+        """
+        # Arrange
+        target = stored_tasks[0]
+        changes = TaskUpdate(
+            description="Moved", status=TaskStatus.DONE, user_id=target.user_id, updated_at=datetime(2025, 2, 1)
+        )
+        query_counter.reset()
+
+        # Act
+        result = repository.update(target.id, changes)
+
+        # Assert
+        assert result.description == "Moved"
+        assert result.status == TaskStatus.DONE
+        assert result.created_at == datetime(2025, 1, 1)
+        assert result.updated_at == datetime(2025, 2, 1)
+        assert query_counter.count == 4
+
+    def test_update_returns_previous_keys_on_postgresql(self):
+        """Test that the PostgreSQL update locks and reads the previous user and status in the same statement."""
+        changes = TaskUpdate(description="Moved", status=TaskStatus.DONE, user_id=2, updated_at=datetime(2025, 2, 1))
+
+        sql = str(task_queries.update_task_returning_old(7, changes, 3).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("UPDATE tasks SET")
+        assert 'FOR UPDATE) AS "old" WHERE tasks.id = "old".id' in sql
+        assert sql.endswith('"old".user_id AS old_user_id, "old".status AS old_status')
+
+    def test_update_keeping_status_skips_counts(self, repository, stored_tasks, query_counter):
+        """Test that an update leaving user and status alone does not touch the counts."""
+        # Arrange
+        target = stored_tasks[0]
+        changes = TaskUpdate(
+            description="Reworded", status=target.status, user_id=target.user_id, updated_at=datetime(2025, 2, 1)
+        )
+        query_counter.reset()
+
+        # Act
+        repository.update(target.id, changes)
+
+        # Assert
+        assert query_counter.count == 3
+
+    def test_update_task_not_found(self, repository, db_user):
+        """Test updating a missing task returns None."""
+        changes = TaskUpdate(description="Moved", status=TaskStatus.DONE, user_id=db_user.id, updated_at=datetime.now())
+
+        assert repository.update(999, changes) is None
+
+    def test_update_user_not_found(self, repository, stored_tasks):
+        """Test that moving a task to a missing user becomes a not-found error."""
+        changes = TaskUpdate(description="Moved", status=TaskStatus.DONE, user_id=999, updated_at=datetime.now())
+
+        with pytest.raises(ValueError, match="User with id 999 not found"):
+            repository.update(stored_tasks[0].id, changes)
+
+        assert repository.get_by_id(stored_tasks[0].id).user_id == stored_tasks[0].user_id
+
+    def test_delete_is_single_write_plus_tombstone(self, repository, stored_tasks, query_counter):
+        """Test that deleting a task costs an id lookup, one DELETE ... RETURNING, one tombstone INSERT and one count upsert."""
+        # Arrange
+        target_id = stored_tasks[0].id
+        query_counter.reset()
+
+        # Act
+        result = repository.delete(target_id)
+
+        # Assert
+        assert result is True
+        assert query_counter.count == 5
+        assert repository.get_by_id(target_id) is None
+
+    def test_delete_task_not_found(self, repository, query_counter):
+        """Test that deleting a missing task returns False after one lookup, without taking a change sequence."""
+        # Arrange
+        watermark = repository.get_watermark()
+        query_counter.reset()
+
+        # Act
+        result = repository.delete_many([998, 999])
+
+        # Assert
+        assert result == set()
+        assert query_counter.count == 1
+        assert repository.delete(999) is False
+        assert repository.get_watermark() == watermark
+
+    def test_create_many_preserves_order(self, repository, db_user, query_counter):
+        """Test that bulk creation is one INSERT and one count upsert and keeps input order."""
+        # Arrange
+        now = datetime(2025, 2, 1)
+        user_id = db_user.id
+        tasks = [
+            Task(
+                id=None,
+                description=f"Bulk {i}",
+                status=TaskStatus.TODO,
+                user_id=user_id,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(5)
+        ]
+        query_counter.reset()
+
+        # Act
+        result = repository.create_many(tasks)
+
+        # Assert
+        assert [task.description for task in result] == [f"Bulk {i}" for i in range(5)]
+        assert len({task.id for task in result}) == 5
+        assert query_counter.count == 3
+
+    def test_create_many_user_not_found_creates_nothing(self, repository, db_user):
+        """Test that a foreign key violation rolls back the whole batch."""
+        now = datetime(2025, 2, 1)
+        tasks = [
+            Task(id=None, description="Ok", status=TaskStatus.TODO, user_id=db_user.id, created_at=now, updated_at=now),
+            Task(id=None, description="Bad", status=TaskStatus.TODO, user_id=999, created_at=now, updated_at=now),
+        ]
+
+        with pytest.raises(ValueError, match="One or more users not found"):
+            repository.create_many(tasks)
+
+        assert repository.get_all() == []
+
+    def test_update_many(self, repository, stored_tasks, query_counter):
+        """Test that bulk update is one executemany between two SELECTs, plus a count upsert, and skips missing ids."""
+        # Arrange
+        user_id = stored_tasks[0].user_id
+        ids = [stored_tasks[0].id, stored_tasks[1].id]
+        changes = {
+            task_id: TaskUpdate(
+                description=f"Moved {task_id}", status=TaskStatus.DONE, user_id=user_id, updated_at=datetime(2025, 2, 1)
+            )
+            for task_id in [*ids, 999]
+        }
+        query_counter.reset()
+
+        # Act
+        result = repository.update_many(changes)
+
+        # Assert
+        assert sorted(task.id for task in result) == ids
+        assert all(task.status == TaskStatus.DONE for task in result)
+        assert query_counter.count == 5
+
+    def test_delete_many(self, repository, stored_tasks, query_counter):
+        """Test that bulk delete is an id lookup, one DELETE ... RETURNING, one tombstone INSERT and one count upsert."""
+        # Arrange
+        ids = [stored_tasks[0].id, stored_tasks[1].id]
+        query_counter.reset()
+
+        # Act
+        result = repository.delete_many([*ids, 999])
+
+        # Assert
+        assert result == set(ids)
+        assert query_counter.count == 5
+        assert len(repository.get_all()) == len(stored_tasks) - 2
+
+    def test_get_page_walks_all_tasks_in_order(self, repository, stored_tasks):
+        """Test that following next_cursor visits every task exactly once."""
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            page = repository.get_page(limit=2, cursor=cursor)
+            seen.extend(task.id for task in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        # Assert
+        assert seen == [task.id for task in stored_tasks]
+
+    def test_get_page_last_page_has_no_cursor(self, repository, stored_tasks):
+        """Test that an exactly-full last page does not return a cursor."""
+        # Act
+        page = repository.get_page(limit=len(stored_tasks))
+
+        # Assert
+        assert len(page.items) == len(stored_tasks)
+        assert page.next_cursor is None
+
+    def test_get_page_descending_updated_at(self, repository, stored_tasks):
+        """Test paging in descending updated_at order."""
+        query = TaskQuery(sort=TaskSortOrder.UPDATED_DESC)
+
+        # Act
+        first = repository.get_page(limit=3, query=query)
+        second = repository.get_page(limit=3, cursor=first.next_cursor, query=query)
+
+        # Assert
+        assert first.next_cursor.sort_key == stored_tasks[2].updated_at
+        assert [task.id for task in first.items + second.items] == [5, 4, 3, 2, 1]
+        assert second.next_cursor is None
+
+    def test_stream_yields_matching_tasks_in_order(self, repository, stored_tasks, query_counter):
+        """Test that streaming visits every matching task once, with a single query."""
+        query = TaskQuery(sort=TaskSortOrder.CREATED_DESC)
+        query_counter.reset()
+
+        # Act
+        ids = [task.id for task in repository.stream(query, batch_size=2)]
+        statements = query_counter.count
+
+        # Assert
+        assert ids == [task.id for task in repository.find(query)]
+        assert statements == 1
+
+    def test_watermark_changes_on_every_write(self, repository, db_user, query_counter):
+        """Test that inserts, updates, deletes and archiving each move the watermark, read in one query.
+
+        The update is stamped earlier than the insert, as a writer with a lagging clock would.
+        """
+        # Arrange
+        now = datetime(2025, 2, 1)
+        task = Task(
+            id=None, description="New", status=TaskStatus.DONE, user_id=db_user.id, created_at=now, updated_at=now
+        )
+        changes = TaskUpdate(
+            description="Changed", status=TaskStatus.DONE, user_id=db_user.id, updated_at=now - timedelta(1)
+        )
+        query_counter.reset()
+        empty = repository.get_watermark()
+        statements = query_counter.count
+
+        # Act
+        created = repository.create(task)
+        after_insert = repository.get_watermark()
+        repository.update(created.id, changes)
+        after_update = repository.get_watermark()
+        repository.archive(now, 10)
+        after_archive = repository.get_watermark()
+        repository.create(task)
+        repository.delete(repository.get_all()[0].id)
+        after_delete = repository.get_watermark()
+
+        # Assert
+        assert statements == 1
+        assert len({empty, after_insert, after_update, after_archive, after_delete}) == 5
+
+    def test_find_filters_by_user_and_status(self, repository, db_session, db_user, stored_tasks):
+        """Test that user and status filters are combined."""
+        # Arrange
+        other = UserModel(
+            first_name="Jane",
+            last_name="Smith",
+            email="jane.smith@example.com",
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 1),
+        )
+        db_session.add(other)
+        db_session.flush()
+        stored_tasks[1].status = TaskStatus.DONE
+        stored_tasks[2].status = TaskStatus.DOING
+        stored_tasks[3].user_id = other.id
+        stored_tasks[3].status = TaskStatus.DONE
+        db_session.commit()
+
+        # Act
+        result = repository.find(
+            TaskQuery(user_ids=frozenset({db_user.id}), statuses=frozenset({TaskStatus.DOING, TaskStatus.DONE}))
+        )
+
+        # Assert
+        assert [task.id for task in result] == [stored_tasks[1].id, stored_tasks[2].id]
+
+    def test_find_filters_by_created_range(self, repository, stored_tasks):
+        """Test that the created_after bound is inclusive and created_before is exclusive."""
+        # Act
+        result = repository.find(
+            TaskQuery(created_after=stored_tasks[1].created_at, created_before=stored_tasks[3].created_at)
+        )
+
+        # Assert
+        assert [task.id for task in result] == [stored_tasks[1].id, stored_tasks[2].id]
+
+    def test_get_page_empty_table(self, repository):
+        """Test paging over an empty table."""
+        # Act
+        page = repository.get_page(limit=10)
+
+        # Assert
+        assert page.items == []
+        assert page.next_cursor is None
+
+
+class TestTaskChanges:
+    """Test cases for delta sync against SQLite."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a repository bound to the test session."""
+        return SQLAlchemyTaskRepository(db_session)
+
+    @pytest.fixture
+    def tasks(self, repository, db_user):
+        """Create three tasks through the repository."""
+        now = datetime(2025, 1, 1)
+        return repository.create_many(
+            [
+                Task(
+                    id=None,
+                    description=f"Task {i}",
+                    status=TaskStatus.TODO,
+                    user_id=db_user.id,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i in range(3)
+            ]
+        )
+
+    def test_full_sync_without_token(self, repository, tasks):
+        """Test that omitting the token returns every task and no deletions."""
+        # Act
+        changes = repository.get_changes(None)
+
+        # Assert
+        assert [row.id for row in changes.changed] == [task.id for task in tasks]
+        assert changes.deleted_ids == []
+        assert changes.token == SyncToken(seq=1)
+
+    def test_changes_since_token(self, repository, tasks, query_counter):
+        """Test that only writes after the token are returned, in three statements."""
+        # Arrange
+        token = repository.get_changes(None).token
+        moved, deleted = tasks[0], tasks[1]
+        changes = TaskUpdate(
+            description="Moved", status=TaskStatus.DONE, user_id=moved.user_id, updated_at=datetime(2025, 2, 1)
+        )
+        repository.update(moved.id, changes)
+        repository.delete(deleted.id)
+        query_counter.reset()
+
+        # Act
+        result = repository.get_changes(token)
+
+        # Assert
+        assert [(row.id, row.description) for row in result.changed] == [(moved.id, "Moved")]
+        assert result.deleted_ids == [deleted.id]
+        assert result.token.seq == token.seq + 2
+        assert query_counter.count == 3
+
+    def test_in_sync_client_gets_nothing(self, repository, tasks):
+        """Test that the latest token yields no changes and the same token."""
+        token = repository.get_changes(None).token
+
+        result = repository.get_changes(token)
+
+        assert (result.changed, result.deleted_ids, result.token) == ([], [], token)
+
+    def test_compacted_token_expires(self, repository, tasks):
+        """Test that tokens older than compacted tombstones are rejected and newer ones still served."""
+        # Arrange
+        old_token = repository.get_changes(None).token
+        repository.delete(tasks[0].id)
+        token_after_delete = repository.get_changes(old_token).token
+
+        # Act
+        removed = repository.purge_tombstones(datetime.now(UTC) + timedelta(minutes=1))
+
+        # Assert
+        assert removed == 1
+        with pytest.raises(SyncTokenExpiredError):
+            repository.get_changes(old_token)
+        assert repository.get_changes(token_after_delete).deleted_ids == []
+
+    def test_token_ahead_of_sequence_expires(self, repository, tasks):
+        """Test that a token from another database is rejected."""
+        with pytest.raises(SyncTokenExpiredError):
+            repository.get_changes(SyncToken(seq=100))
+
+
+class TestTaskCounts:
+    """Test cases for the task counts maintained by SQLAlchemyTaskRepository writes."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a repository bound to the test session."""
+        return SQLAlchemyTaskRepository(db_session)
+
+    @pytest.fixture
+    def users(self, db_session):
+        """Persist two users."""
+        now = datetime(2025, 1, 1)
+        users = [
+            UserModel(first_name=name, last_name="Doe", email=f"{name}@example.com", created_at=now, updated_at=now)
+            for name in ("a", "b")
+        ]
+        db_session.add_all(users)
+        db_session.commit()
+        return users
+
+    @staticmethod
+    def new_task(user_id: int, status: TaskStatus) -> Task:
+        """Build an unsaved task."""
+        now = datetime(2025, 1, 1)
+        return Task(id=None, description="Task", status=status, user_id=user_id, created_at=now, updated_at=now)
+
+    @staticmethod
+    def counts(repository) -> set[tuple]:
+        """The non-zero counts as comparable tuples."""
+        return {tuple(row) for row in repository.get_counts()}
+
+    def test_writes_keep_counts(self, repository, users):
+        """Test that creates, moves and deletes, single and bulk, adjust the counts."""
+        # Arrange
+        a, b = users[0].id, users[1].id
+        created = repository.create_many([self.new_task(a, TaskStatus.TODO) for _ in range(3)])
+        single = repository.create(self.new_task(b, TaskStatus.DOING))
+
+        # Act
+        moved = created[0]
+        repository.update(moved.id, TaskUpdate("Moved", TaskStatus.DONE, b, datetime(2025, 2, 1)))
+        repository.update_many({created[1].id: TaskUpdate("Doing", TaskStatus.DOING, a, datetime(2025, 2, 1))})
+        repository.delete(single.id)
+        repository.delete_many([created[2].id, 999])
+
+        # Assert
+        assert self.counts(repository) == {(a, TaskStatus.DOING, 1), (b, TaskStatus.DONE, 1)}
+
+    def test_get_counts_is_one_query(self, repository, users, query_counter):
+        """Test that reading the counts does not scan tasks."""
+        user_id = users[0].id
+        repository.create(self.new_task(user_id, TaskStatus.TODO))
+        query_counter.reset()
+
+        assert self.counts(repository) == {(user_id, TaskStatus.TODO, 1)}
+        assert query_counter.count == 1
+
+    def test_rebuild_repairs_drift(self, repository, users, db_session):
+        """Test that rebuilding counts tasks written behind the repository's back."""
+        # Arrange
+        repository.create(self.new_task(users[0].id, TaskStatus.TODO))
+        now = datetime(2025, 1, 1)
+        db_session.add(
+            TaskModel(description="Raw", status=TaskStatus.DONE, user_id=users[1].id, created_at=now, updated_at=now)
+        )
+        db_session.commit()
+
+        # Act
+        rebuilt = repository.rebuild_counts()
+
+        # Assert
+        assert rebuilt == 2
+        assert self.counts(repository) == {(users[0].id, TaskStatus.TODO, 1), (users[1].id, TaskStatus.DONE, 1)}
+
+
+class TestTaskSearch:
+    """Test cases for SQLAlchemyTaskRepository.search over the SQLite FTS5 index."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a repository bound to the test session."""
+        return SQLAlchemyTaskRepository(db_session)
+
+    @pytest.fixture
+    def tasks(self, repository, db_user):
+        """Create tasks through the repository, so the index triggers see them."""
+        now = datetime(2025, 1, 1)
+        descriptions = ["Fix login bug", "Write login docs", "Deploy to prod", "login page: login form, login button"]
+        return repository.create_many(
+            [
+                Task(
+                    id=None,
+                    description=text,
+                    status=TaskStatus.TODO,
+                    user_id=db_user.id,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for text in descriptions
+            ]
+        )
+
+    @staticmethod
+    def descriptions(page) -> list[str]:
+        """Descriptions of a page's rows, in order."""
+        return [row.description for row in page.items]
+
+    def test_ranks_matches_and_requires_every_term(self, repository, tasks):
+        """Test that matches are case-insensitive substrings, most relevant first, with all terms required."""
+        assert self.descriptions(repository.search("LOGIN", 10))[0] == "login page: login form, login button"
+        assert set(self.descriptions(repository.search("login", 10))) == {
+            "Fix login bug",
+            "Write login docs",
+            "login page: login form, login button",
+        }
+        assert self.descriptions(repository.search("bug log", 10)) == ["Fix login bug"]
+        assert self.descriptions(repository.search("pr", 10)) == ["Deploy to prod"]
+        assert repository.search("missing", 10).items == []
+
+    def test_pages_follow_relevance(self, repository, tasks):
+        """Test that following next_cursor visits every match once, in the same order as one page."""
+        everything = self.descriptions(repository.search("login", 10))
+        first = repository.search("login", 2)
+        second = repository.search("login", 2, first.next_cursor)
+
+        assert self.descriptions(first) + self.descriptions(second) == everything
+        assert second.next_cursor is None
+
+    def test_index_follows_writes_and_filters_apply(self, repository, tasks):
+        """Test that updates and deletes reach the index and status filters narrow the results."""
+        # Arrange
+        moved, deleted = tasks[2], tasks[0]
+        changes = TaskUpdate(
+            description="Deploy login service", status=TaskStatus.DONE, user_id=moved.user_id, updated_at=datetime.now()
+        )
+
+        # Act
+        repository.update(moved.id, changes)
+        repository.delete(deleted.id)
+
+        # Assert
+        assert repository.search("prod", 10).items == []
+        done = repository.search("login", 10, query=TaskQuery(statuses=frozenset({TaskStatus.DONE})))
+        assert self.descriptions(done) == ["Deploy login service"]
+        assert deleted.id not in {row.id for row in repository.search("login", 10).items}
+
+
+class TestTaskArchive:
+    """Test cases for archiving old DONE tasks against SQLite."""
+
+    CUTOFF = datetime(2025, 1, 1)
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a repository bound to the test session."""
+        return SQLAlchemyTaskRepository(db_session)
+
+    @pytest.fixture
+    def tasks(self, repository, db_user):
+        """Create three old DONE tasks, an old TODO task and a recent DONE task."""
+        old, recent = datetime(2024, 1, 1), datetime(2025, 6, 1)
+        specs = [(TaskStatus.DONE, old)] * 3 + [(TaskStatus.TODO, old), (TaskStatus.DONE, recent)]
+        return repository.create_many(
+            [
+                Task(
+                    id=None,
+                    description=f"Task {i}",
+                    status=status,
+                    user_id=db_user.id,
+                    created_at=datetime(2023, 1, 1) + timedelta(days=i),
+                    updated_at=updated_at,
+                )
+                for i, (status, updated_at) in enumerate(specs)
+            ]
+        )
+
+    def test_archive_moves_old_done_tasks_in_batches(self, repository, tasks, db_user):
+        """Test that only DONE tasks older than the cutoff move, limit at a time, leaving tombstones and counts."""
+        # Arrange
+        token = repository.get_changes(None).token
+
+        # Act
+        first = repository.archive(self.CUTOFF, 2)
+        second = repository.archive(self.CUTOFF, 2)
+
+        # Assert
+        assert first == {tasks[0].id, tasks[1].id}
+        assert second == {tasks[2].id}
+        assert repository.archive(self.CUTOFF, 2) == set()
+        assert [task.id for task in repository.get_all()] == [tasks[3].id, tasks[4].id]
+        assert sorted(repository.get_changes(token).deleted_ids) == [task.id for task in tasks[:3]]
+        assert {tuple(row) for row in repository.get_counts()} == {
+            (db_user.id, TaskStatus.TODO, 1),
+            (db_user.id, TaskStatus.DONE, 1),
+        }
+
+    def test_include_archived_lists_both_tables(self, repository, tasks):
+        """Test that archived tasks are listed, filtered and paged together with active ones only on request."""
+        # Arrange
+        repository.archive(self.CUTOFF, 10)
+        everything = TaskQuery(include_archived=True)
+        done = TaskQuery(statuses=frozenset({TaskStatus.DONE}), include_archived=True)
+
+        # Act
+        first = repository.get_rows_page(3, query=everything)
+        second = repository.get_rows_page(3, first.next_cursor, everything)
+
+        # Assert
+        assert [row.id for row in repository.find_rows(TaskQuery())] == [tasks[3].id, tasks[4].id]
+        assert [row.id for row in first.items + second.items] == [task.id for task in tasks]
+        assert second.next_cursor is None
+        assert [row.id for row in repository.stream(done, 2)] == [tasks[i].id for i in (0, 1, 2, 4)]
+
+
+class TestSyncToken:
+    """Test cases for SyncToken encoding."""
+
+    def test_round_trip(self):
+        """Test that a decoded token equals the encoded one."""
+        token = SyncToken(seq=12345)
+
+        assert SyncToken.decode(token.encode()) == token
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", TaskCursor(datetime(2025, 1, 1), 1).encode()])
+    def test_decode_invalid(self, token):
+        """Test that malformed tokens, including page cursors, are rejected."""
+        with pytest.raises(ValueError, match="Invalid sync token"):
+            SyncToken.decode(token)
+
+
+class TestTaskCursor:
+    """Test cases for TaskCursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a decoded cursor equals the encoded one."""
+        cursor = TaskCursor(sort_key=datetime(2025, 1, 1, 12, 30, 15, 123456), id=42)
+
+        assert TaskCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", "bm8tc2VwYXJhdG9y"])
+    def test_decode_invalid(self, token):
+        """Test that malformed tokens are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            TaskCursor.decode(token)
@@ -0,0 +1 @@
+"""Presentation tests package."""
@@ -0,0 +1,46 @@
+"""Tests for the SSE change feed."""
+
+import asyncio
+from datetime import datetime
+
+from domain.models import Task, TaskEvent, TaskEventType, TaskStatus
+from infrastructure.events import EventHub
+from presentation.api.change_feed import DROPPED, KEEPALIVE, HubTaskEventPublisher, encode_event, event_stream
+
+NOW = datetime(2025, 1, 1, 12, 0)
+
+
+class TestChangeFeed:
+    """Test cases for change feed encoding and streams."""
+
+    def test_encode_event(self):
+        """Test that events are SSE messages carrying the task as listings encode it."""
+        task = Task.from_trusted(1, "Card", TaskStatus.DOING, 2, NOW, NOW)
+
+        assert encode_event(TaskEvent(TaskEventType.UPDATED, 1, task)) == (
+            b"event: updated\ndata: "
+            b'{"task_id":1,"task":{"id":1,"description":"Card","status":"DOING","user_id":2,'
+            b'"created_at":"2025-01-01T12:00:00","updated_at":"2025-01-01T12:00:00"}}\n\n'
+        )
+        assert encode_event(TaskEvent(TaskEventType.DELETED, 1)) == b'event: deleted\ndata: {"task_id":1}\n\n'
+
+    def test_stream_delivers_events_keepalives_and_drop(self):
+        """Test a subscriber's stream from connection to being dropped."""
+
+        async def scenario():
+            hub = EventHub(queue_size=1)
+            publisher = HubTaskEventPublisher(hub)
+            stream = event_stream(hub, heartbeat_seconds=0.01)
+            messages = [await anext(stream)]
+            messages.append(await anext(stream))  # idle: keep-alive
+            publisher.publish([TaskEvent(TaskEventType.DELETED, 1)])
+            messages.append(await anext(stream))
+            publisher.publish([TaskEvent(TaskEventType.DELETED, 2), TaskEvent(TaskEventType.DELETED, 3)])
+            messages.extend([message async for message in stream])
+            return hub, messages
+
+        hub, messages = asyncio.run(scenario())
+
+        assert messages[0].startswith(b"retry: ")
+        assert messages[1:] == [KEEPALIVE, b'event: deleted\ndata: {"task_id":1}\n\n', DROPPED]
+        assert hub.stats().subscribers == 0
@@ -0,0 +1,50 @@
+"""Tests for listing ETags."""
+
+from starlette.requests import Request
+
+from domain.models import TableWatermark
+from presentation.api.etag import etag_matches, make_etag
+
+WATERMARK = TableWatermark(version=7)
+
+
+def make_request(query_string: str) -> Request:
+    """Build a GET /api/tasks request with the given query string."""
+    return Request(
+        {"type": "http", "method": "GET", "path": "/api/tasks", "query_string": query_string.encode(), "headers": []}
+    )
+
+
+class TestETag:
+    """Test cases for ETag construction and matching."""
+
+    def test_etag_is_weak_and_stable(self):
+        """Test that equivalent requests share a weak tag regardless of parameter order."""
+        first = make_etag(WATERMARK, make_request("status=TODO&user_id=1"), ndjson=False)
+        second = make_etag(WATERMARK, make_request("user_id=1&status=TODO"), ndjson=False)
+
+        assert first.startswith('W/"')
+        assert first == second
+
+    def test_etag_changes_with_watermark_and_shape(self):
+        """Test that the tag changes with the table state, the query and the format."""
+        base = make_etag(WATERMARK, make_request(""), ndjson=False)
+        changed = [
+            make_etag(TableWatermark(8), make_request(""), ndjson=False),
+            make_etag(WATERMARK, make_request("limit=10"), ndjson=False),
+            make_etag(WATERMARK, make_request(""), ndjson=True),
+        ]
+
+        assert base not in changed
+        assert len(set(changed)) == len(changed)
+
+    def test_etag_matches(self):
+        """Test weak comparison against If-None-Match lists and wildcards."""
+        etag = 'W/"abc"'
+
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('W/"xyz", W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"xyz"', etag)
+        assert not etag_matches(None, etag)
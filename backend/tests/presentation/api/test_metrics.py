@@ -0,0 +1,63 @@
+"""Tests for the request metrics middleware."""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.database import create_database_engine
+from infrastructure.metrics import instrument_engines
+from presentation.api.metrics import UNMATCHED_ROUTE, MetricsMiddleware, RequestMetrics
+
+
+@pytest.fixture
+def db_engine():
+    """An in-memory SQLite engine shared by the app's threads."""
+    engine = create_database_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+def make_client(db_engine) -> tuple[TestClient, RequestMetrics]:
+    """A client of an app with routes that query the test engine, wrapped in the middleware."""
+    app = FastAPI()
+    metrics = RequestMetrics()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    instrument_engines()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with db_engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT 1"))
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    return TestClient(app), metrics
+
+
+class TestMetricsMiddleware:
+    """Test cases for MetricsMiddleware."""
+
+    def test_records_requests_by_route_template(self, db_engine):
+        """Test that requests are labelled by route, status and their database cost."""
+        # Arrange
+        client, metrics = make_client(db_engine)
+
+        # Act
+        client.get("/items/2")
+        client.get("/items/3")
+        client.get("/items/0")
+        client.get("/missing")
+
+        # Assert
+        route = ("GET", "/items/{item_id}")
+        assert metrics.requests.value((*route, 200)) == 2
+        assert metrics.requests.value((*route, 404)) == 1
+        assert metrics.requests.value(("GET", UNMATCHED_ROUTE, 404)) == 1
+        assert metrics.duration.count(route) == 3
+        assert metrics.queries.count(route) == 3
+        assert 'http_request_db_queries_sum{method="GET",route="/items/{item_id}"} 5.0' in metrics.render()
+        assert metrics.in_flight.value() == 0
@@ -0,0 +1,125 @@
+"""Tests for route query budgets."""
+
+import logging
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from infrastructure.cache import get_cache
+from infrastructure.database import Base, create_database_engine, get_db, get_session_factory
+from infrastructure.database.models import UserModel
+from infrastructure.metrics import QueryBudget, QueryBudgetExceededError, budget_of, instrument_engines
+from presentation.api.async_routes import async_tasks_router, async_users_router
+from presentation.api.change_feed import get_task_event_publisher
+from presentation.api.query_budget import QueryBudgetMiddleware
+from presentation.api.routes import tasks_router, users_router
+
+
+@pytest.fixture
+def db_engine():
+    """An in-memory SQLite engine with the full schema and two users, shared by the app's threads."""
+    engine = create_database_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2025, 1, 1)
+    with sessionmaker(bind=engine)() as session:
+        for name in ("Ann", "Bob"):
+            session.add(
+                UserModel(first_name=name, last_name="Doe", email=f"{name}@example.com", created_at=now, updated_at=now)
+            )
+        session.commit()
+    instrument_engines()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(db_engine) -> TestClient:
+    """A client of the sync API on the test engine, without cache, raising on any budget overrun."""
+    factory = sessionmaker(autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(tasks_router)
+    app.include_router(users_router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: factory
+    app.dependency_overrides[get_cache] = lambda: None
+    app.dependency_overrides[get_task_event_publisher] = lambda: None
+    app.add_middleware(QueryBudgetMiddleware, action="raise")
+    return TestClient(app)
+
+
+class TestQueryBudgets:
+    """Test cases for the budgets declared on routes and their enforcement."""
+
+    @pytest.mark.parametrize("router", [tasks_router, users_router, async_tasks_router, async_users_router])
+    def test_every_route_declares_a_budget(self, router):
+        """Test that no API route is left without a query budget."""
+        missing = [
+            route.path for route in router.routes if isinstance(route, APIRoute) and not budget_of(route.endpoint)
+        ]
+
+        assert missing == []
+
+    def test_routes_stay_within_their_budgets(self, client):
+        """Test every route, including error paths, against its declared budget."""
+        items = [{"description": f"Bulk {i}", "status": "TODO", "user_id": 1 + i % 2} for i in range(20)]
+
+        created = client.post("/api/tasks", json={"description": "Single", "status": "TODO", "user_id": 1}).json()
+        ids = [item["task_id"] for item in client.post("/api/tasks/bulk", json={"items": items}).json()["results"]]
+        updates = [{"id": task_id, "description": "Moved", "status": "DONE", "user_id": 2} for task_id in ids[:10]]
+        responses = [
+            client.put("/api/tasks/bulk", json={"items": updates}),
+            client.request("DELETE", "/api/tasks/bulk", json={"ids": [*ids[10:15], 9999]}),
+            client.put(f"/api/tasks/{created['id']}", json={"description": "Edited", "status": "DOING", "user_id": 2}),
+            client.put("/api/tasks/9999", json={"description": "Missing", "status": "DOING", "user_id": 2}),
+            client.get("/api/tasks"),
+            client.get("/api/tasks", params={"limit": 5}),
+            client.get("/api/tasks", params={"stream": "true"}),
+            client.get("/api/tasks", headers={"Accept": "application/x-ndjson"}),
+            client.get("/api/tasks/search", params={"q": "bulk"}),
+            client.get("/api/board/summary"),
+            client.delete(f"/api/tasks/{created['id']}"),
+            client.delete("/api/tasks/9999"),
+            client.get("/api/users"),
+            client.get("/api/users", params={"stream": "true"}),
+        ]
+        token = client.get("/api/tasks/changes").json()["next_token"]
+        responses.append(client.get("/api/tasks/changes", params={"since": token}))
+
+        assert [response.status_code for response in responses] == [
+            200, 200, 200, 404, 200, 200, 200, 200, 200, 200, 204, 404, 200, 200, 200,
+        ]  # fmt: skip
+
+    def test_middleware_raises_or_warns_on_overrun(self, db_engine, caplog):
+        """Test that a route exceeding its budget raises in raise mode and logs in warn mode."""
+
+        def make_app(action: str) -> TestClient:
+            app = FastAPI()
+
+            @app.get("/lookups")
+            @QueryBudget(5)
+            def lookups():
+                with db_engine.connect() as conn:
+                    for user_id in (1, 2):
+                        conn.execute(text("SELECT * FROM users WHERE id = :id"), {"id": user_id})
+                return {}
+
+            app.add_middleware(QueryBudgetMiddleware, action=action)
+            return TestClient(app)
+
+        with pytest.raises(QueryBudgetExceededError, match="GET /lookups exceeded"):
+            make_app("raise").get("/lookups")
+        with caplog.at_level(logging.WARNING):
+            assert make_app("warn").get("/lookups").status_code == 200
+
+        assert "statement repeated 2 times, budget 1" in caplog.text
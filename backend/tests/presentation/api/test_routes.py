@@ -0,0 +1,339 @@
+"""Tests for the task and user routes, run against both the sync and the async route set."""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from infrastructure.cache import LRUCacheBackend, get_cache
+from infrastructure.database import (
+    Base,
+    create_async_database_engine,
+    create_database_engine,
+    get_async_db,
+    get_async_session_factory,
+    get_db,
+    get_session_factory,
+)
+from infrastructure.database.models import UserModel
+from infrastructure.repositories import SQLAlchemyTaskRepository
+from presentation.api.async_routes import async_tasks_router, async_users_router
+from presentation.api.change_feed import get_task_event_publisher
+from presentation.api.routes import tasks_router, users_router
+
+
+@pytest.fixture(params=[False, True], ids=["sync", "async"])
+def async_database(request) -> bool:
+    """Whether the app mounts the async route set, as Settings.async_database selects."""
+    return request.param
+
+
+@pytest.fixture
+def cache(request) -> LRUCacheBackend | None:
+    """The read-through cache of the app: none unless a test parametrizes it on."""
+    return LRUCacheBackend() if getattr(request, "param", False) else None
+
+
+@pytest.fixture
+def session_factory(tmp_path) -> sessionmaker:
+    """Sessions on a SQLite file with the schema and two users."""
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2025, 1, 1)
+    factory = sessionmaker(autoflush=False, bind=engine)
+    with factory() as session:
+        for name in ("Ann", "Bob"):
+            session.add(
+                UserModel(first_name=name, last_name="Doe", email=f"{name}@example.com", created_at=now, updated_at=now)
+            )
+        session.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def client(tmp_path, session_factory, async_database, cache) -> TestClient:
+    """A client of the API over the session factory's database.
+
+    Each async request runs in a fresh event loop, so the async engine does not pool connections.
+    """
+    app = FastAPI()
+    if async_database:
+        async_engine = create_async_database_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", poolclass=NullPool)
+        async_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with async_factory() as db:
+                yield db
+
+        app.include_router(async_tasks_router)
+        app.include_router(async_users_router)
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        app.dependency_overrides[get_async_session_factory] = lambda: async_factory
+    else:
+
+        def override_get_db():
+            with session_factory() as db:
+                yield db
+
+        app.include_router(tasks_router)
+        app.include_router(users_router)
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_cache] = lambda: cache
+    app.dependency_overrides[get_task_event_publisher] = lambda: None
+    return TestClient(app)
+
+
+def create(client: TestClient, description: str = "Task", status: str = "TODO", user_id: int = 1) -> dict:
+    """Create a task through the API and return its body."""
+    response = client.post("/api/tasks", json={"description": description, "status": status, "user_id": user_id})
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestTaskRoutes:
+    """Test cases for the task routes and their error mapping."""
+
+    def test_create_update_delete(self, client):
+        """Test the single-task write routes and their 404s for unknown tasks and users."""
+        # Arrange
+        task = create(client, "Write tests")
+
+        # Act
+        updated = client.put(f"/api/tasks/{task['id']}", json={"description": "Done", "status": "DONE", "user_id": 2})
+        missing_task = client.put("/api/tasks/9999", json={"description": "X", "status": "DONE", "user_id": 1})
+        missing_user = client.post("/api/tasks", json={"description": "X", "status": "TODO", "user_id": 99})
+        deleted = client.delete(f"/api/tasks/{task['id']}")
+        deleted_again = client.delete(f"/api/tasks/{task['id']}")
+
+        # Assert
+        assert (updated.status_code, updated.json()["status"], updated.json()["user_id"]) == (200, "DONE", 2)
+        assert missing_task.status_code == 404
+        assert missing_user.status_code == 404
+        assert missing_user.json()["detail"] == "User with id 99 not found"
+        assert deleted.status_code == 204
+        assert deleted_again.status_code == 404
+        assert client.get("/api/tasks").json() == []
+
+    def test_invalid_bodies_are_rejected(self, client):
+        """Test that request validation answers 422 before any service call."""
+        assert client.post("/api/tasks", json={"description": "", "status": "TODO", "user_id": 1}).status_code == 422
+        assert client.post("/api/tasks", json={"description": "X", "status": "NOPE", "user_id": 1}).status_code == 422
+        assert client.post("/api/tasks/bulk", json={"items": []}).status_code == 422
+
+    def test_bulk_routes_report_each_item(self, client):
+        """Test that bulk writes succeed item by item and report failures in request order."""
+        # Arrange
+        items = [
+            {"description": "First", "status": "TODO", "user_id": 1},
+            {"description": "Orphan", "status": "TODO", "user_id": 99},
+            {"description": "Third", "status": "DOING", "user_id": 2},
+        ]
+
+        # Act
+        created = client.post("/api/tasks/bulk", json={"items": items}).json()["results"]
+        ids = [result["task_id"] for result in created if result["task_id"] is not None]
+        updates = [{"id": ids[0], "description": "Moved", "status": "DONE", "user_id": 2}]
+        updates.append({"id": 9999, "description": "Missing", "status": "DONE", "user_id": 2})
+        updated = client.put("/api/tasks/bulk", json={"items": updates}).json()["results"]
+        deleted = client.request("DELETE", "/api/tasks/bulk", json={"ids": [ids[1], 9999]}).json()["results"]
+
+        # Assert
+        assert [result["index"] for result in created] == [0, 1, 2]
+        assert [result["error"] is None for result in created] == [True, False, True]
+        assert created[0]["task"]["description"] == "First"
+        assert updated[0]["task"]["status"] == "DONE"
+        assert updated[1]["error"] is not None
+        assert [result["error"] is None for result in deleted] == [True, False]
+        assert [task["id"] for task in client.get("/api/tasks").json()] == [ids[0]]
+
+    def test_listing_pages_and_streams_agree(self, client):
+        """Test that pages, the full listing and both streamed formats return the same tasks."""
+        # Arrange
+        ids = [create(client, f"Task {i}", user_id=1 + i % 2)["id"] for i in range(5)]
+
+        # Act
+        listed = [task["id"] for task in client.get("/api/tasks").json()]
+        first = client.get("/api/tasks", params={"limit": 3}).json()
+        second = client.get("/api/tasks", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+        streamed = [task["id"] for task in client.get("/api/tasks", params={"stream": "true"}).json()]
+        ndjson = client.get("/api/tasks", headers={"Accept": "application/x-ndjson"})
+        filtered = client.get("/api/tasks", params={"user_id": 2, "sort": "-created_at"}).json()
+
+        # Assert
+        assert listed == ids
+        assert [task["id"] for task in first["items"] + second["items"]] == ids
+        assert second["next_cursor"] is None
+        assert streamed == ids
+        assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line)["id"] for line in ndjson.text.splitlines()] == ids
+        assert [task["id"] for task in filtered] == [ids[3], ids[1]]
+
+    @pytest.mark.parametrize(
+        ("path", "params"),
+        [
+            ("/api/tasks", {"cursor": "not-a-cursor"}),
+            ("/api/tasks/search", {"q": "x", "cursor": "not-a-cursor"}),
+            ("/api/tasks/search", {"q": "   "}),
+        ],
+    )
+    def test_malformed_parameters_are_400(self, client, path, params):
+        """Test that malformed cursors and blank search text are rejected with 400."""
+        assert client.get(path, params=params).status_code == 400
+
+    def test_search_and_board_summary(self, client):
+        """Test search by description and the board summary counts."""
+        # Arrange
+        create(client, "Fix login bug")
+        create(client, "Deploy", status="DONE", user_id=2)
+
+        # Act
+        found = client.get("/api/tasks/search", params={"q": "login"}).json()
+        summary = client.get("/api/board/summary").json()
+
+        # Assert
+        assert [task["description"] for task in found["items"]] == ["Fix login bug"]
+        assert summary["total"] == 2
+        assert summary["by_status"] == {"TODO": 1, "DOING": 0, "DONE": 1}
+        assert [user["user_id"] for user in summary["users"]] == [1, 2]
+
+
+@pytest.mark.parametrize("cache", [False, True], ids=["uncached", "cached"], indirect=True)
+class TestListingETags:
+    """Test cases for conditional GETs of the listings, with and without the read-through cache."""
+
+    def test_unchanged_listing_is_not_modified(self, client):
+        """Test that a repeat with the listing's ETag is answered 304 with an empty body."""
+        # Arrange
+        create(client)
+        first = client.get("/api/tasks")
+
+        # Act
+        repeat = client.get("/api/tasks", headers={"If-None-Match": first.headers["ETag"]})
+
+        # Assert
+        assert first.status_code == 200
+        assert first.headers["ETag"].startswith('W/"')
+        assert repeat.status_code == 304
+        assert repeat.content == b""
+        assert repeat.headers["ETag"] == first.headers["ETag"]
+
+    def test_writes_change_the_tag(self, client):
+        """Test that an update and a delete each make the old ETag stale."""
+        # Arrange
+        task = create(client)
+        before_update = client.get("/api/tasks").headers["ETag"]
+
+        # Act
+        client.put(f"/api/tasks/{task['id']}", json={"description": "Moved", "status": "DONE", "user_id": 2})
+        after_update = client.get("/api/tasks", headers={"If-None-Match": before_update})
+        client.delete(f"/api/tasks/{task['id']}")
+        after_delete = client.get("/api/tasks", headers={"If-None-Match": after_update.headers["ETag"]})
+
+        # Assert
+        assert after_update.status_code == 200
+        assert after_update.json()[0]["status"] == "DONE"
+        assert after_update.headers["ETag"] != before_update
+        assert after_delete.status_code == 200
+        assert after_delete.json() == []
+        assert after_delete.headers["ETag"] not in (before_update, after_update.headers["ETag"])
+
+    def test_query_string_changes_the_tag(self, client):
+        """Test that listings differing only in their query have different ETags."""
+        # Arrange
+        create(client)
+        tag = client.get("/api/tasks").headers["ETag"]
+
+        # Act
+        filtered = client.get("/api/tasks", params={"user_id": 1}, headers={"If-None-Match": tag})
+        ndjson = client.get("/api/tasks", headers={"Accept": "application/x-ndjson", "If-None-Match": tag})
+
+        # Assert
+        assert filtered.status_code == 200
+        assert filtered.headers["ETag"] != tag
+        assert ndjson.status_code == 200
+        assert ndjson.headers["ETag"] not in (tag, filtered.headers["ETag"])
+
+    def test_archiving_changes_the_archive_listing_tag(self, client, session_factory):
+        """Test that moving a task to the archive makes the include_archived listing's ETag stale."""
+        # Arrange
+        create(client, status="DONE")
+        tag = client.get("/api/tasks", params={"include_archived": "true"}).headers["ETag"]
+
+        # Act
+        with session_factory() as session:
+            archived = SQLAlchemyTaskRepository(session).archive(datetime.now(UTC) + timedelta(days=1), 10)
+        response = client.get("/api/tasks", params={"include_archived": "true"}, headers={"If-None-Match": tag})
+
+        # Assert
+        assert len(archived) == 1
+        assert response.status_code == 200
+        assert response.headers["ETag"] != tag
+        assert len(response.json()) == 1
+
+    def test_user_listing_is_tagged(self, client):
+        """Test that the user listing answers a matching If-None-Match with 304."""
+        tag = client.get("/api/users").headers["ETag"]
+
+        response = client.get("/api/users", headers={"If-None-Match": tag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+
+class TestTaskChangesRoute:
+    """Test cases for the task change feed route."""
+
+    def test_changes_since_token(self, client):
+        """Test that a token yields only the tasks changed and deleted after it."""
+        # Arrange
+        kept, removed = create(client, "Kept"), create(client, "Removed")
+        token = client.get("/api/tasks/changes").json()["next_token"]
+        client.put(f"/api/tasks/{kept['id']}", json={"description": "Moved", "status": "DONE", "user_id": 1})
+        client.delete(f"/api/tasks/{removed['id']}")
+
+        # Act
+        response = client.get("/api/tasks/changes", params={"since": token})
+
+        # Assert
+        assert response.status_code == 200
+        assert [task["description"] for task in response.json()["changed"]] == ["Moved"]
+        assert response.json()["deleted"] == [removed["id"]]
+
+    def test_malformed_token_is_400(self, client):
+        """Test that a token that does not decode is rejected with 400."""
+        assert client.get("/api/tasks/changes", params={"since": "not-a-token"}).status_code == 400
+
+    def test_compacted_token_is_410(self, client, session_factory):
+        """Test that a token older than the compacted tombstones is answered 410 so the client resyncs."""
+        # Arrange
+        task = create(client)
+        old_token = client.get("/api/tasks/changes").json()["next_token"]
+        client.delete(f"/api/tasks/{task['id']}")
+        with session_factory() as session:
+            SQLAlchemyTaskRepository(session).purge_tombstones(datetime.now(UTC) + timedelta(minutes=1))
+
+        # Act
+        response = client.get("/api/tasks/changes", params={"since": old_token})
+
+        # Assert
+        assert response.status_code == 410
+        assert client.get("/api/tasks/changes").status_code == 200
+
+
+class TestUserRoutes:
+    """Test cases for the user routes."""
+
+    def test_listing_and_stream(self, client):
+        """Test that the user listing and its stream return the same users."""
+        listed = client.get("/api/users").json()
+        streamed = client.get("/api/users", params={"stream": "true"}).json()
+
+        assert [user["first_name"] for user in listed] == ["Ann", "Bob"]
+        assert streamed == listed
@@ -0,0 +1,72 @@
+"""Tests for the pre-serialized listing responses."""
+
+from datetime import UTC, datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from domain.models import Task, TaskCursor, TaskRow, TaskRowPage, TaskStatus, User, UserRow
+from presentation.api.common import TaskPageResponse, UserResponse, to_task_response
+from presentation.api.serialization import task_row_page_response, task_rows_response, user_rows_response
+from presentation.api.streaming import encode_chunks
+
+
+def pydantic_body(content) -> bytes:
+    """Body the response_model path returns for the same content."""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+class TestSerialization:
+    """Test that the row encoders are byte-identical to the Pydantic path."""
+
+    rows = [
+        TaskRow(
+            1,
+            'Quote " backslash \\ newline \n ctrl \x01',
+            TaskStatus.TODO,
+            1,
+            datetime(2025, 1, 1),
+            datetime(2025, 1, 1),
+        ),
+        TaskRow(2, "Unicode é ✓  ", TaskStatus.DOING, 2, datetime(2025, 1, 1, 1, 2, 3, 4500), datetime.now(UTC)),
+    ]
+
+    def to_tasks(self) -> list[Task]:
+        """The same tasks as domain entities."""
+        return [Task(*row) for row in self.rows]
+
+    def test_task_rows_response(self):
+        """Test a task listing matches the TaskResponse list."""
+        expected = pydantic_body([to_task_response(task) for task in self.to_tasks()])
+
+        assert task_rows_response(self.rows).body == expected
+
+    def test_task_row_page_response(self):
+        """Test a page matches TaskPageResponse, with and without a next cursor."""
+        cursor = TaskCursor(sort_key=datetime(2025, 1, 1), id=2)
+        for next_cursor in (cursor, None):
+            expected = pydantic_body(
+                TaskPageResponse(
+                    items=[to_task_response(task) for task in self.to_tasks()],
+                    next_cursor=next_cursor.encode() if next_cursor else None,
+                )
+            )
+
+            assert task_row_page_response(TaskRowPage(items=self.rows, next_cursor=next_cursor)).body == expected
+
+    def test_user_rows_response(self):
+        """Test a user listing matches the UserResponse list."""
+        now = datetime(2025, 1, 1, 12, 30)
+        user = User(id=1, first_name="Zoë", last_name="O'Brien", email="z@example.com", created_at=now, updated_at=now)
+        expected = pydantic_body(
+            [UserResponse(id=1, first_name=user.first_name, last_name=user.last_name, created_at=now.isoformat())]
+        )
+
+        assert user_rows_response([UserRow(1, "Zoë", "O'Brien", now)]).body == expected
+
+    def test_streamed_array_matches_listing(self):
+        """Test the chunked JSON array equals the buffered body for any chunk boundary."""
+        for rows in (self.rows, self.rows * 600, []):
+            body = b"".join(encode_chunks(iter(rows), TaskRow._fields, ndjson=False))
+
+            assert body == task_rows_response(rows).body